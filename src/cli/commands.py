@@ -386,7 +386,7 @@ def process(
 
             # Setup managers
             backup_manager = BackupManager(config.backup.directory)
-            manifest_manager = ManifestManager(Path("manifest.json"))
+            manifest_manager = ManifestManager(Path("manifest.db"))
             txn_manager = TransactionManager(config.safety.transaction_log)
             op_logger = OperationLogger(Path("logs/operations.jsonl"))
 
@@ -456,9 +456,9 @@ def status(
     """Show processing status and statistics."""
     from src.utils.manifest import ManifestManager
 
-    manifest_path = Path("manifest.json")
+    manifest_path = Path("manifest.db")
 
-    if not manifest_path.exists():
+    if not ManifestManager.exists(manifest_path):
         output.console.print("[yellow]No manifest found. Run 'process' first.[/yellow]")
         raise typer.Exit(0)
 
@@ -487,15 +487,15 @@ def export_manifest(
         "json",
         "--format",
         "-f",
-        help="Export format: json or csv",
+        help="Export format: json, jsonl or csv (a .jsonl path implies jsonl)",
     ),
 ) -> None:
     """Export processing manifest to file."""
     from src.utils.manifest import ManifestManager
 
-    manifest_path = Path("manifest.json")
+    manifest_path = Path("manifest.db")
 
-    if not manifest_path.exists():
+    if not ManifestManager.exists(manifest_path):
         output.print_error("No manifest found")
         raise typer.Exit(1)
 
@@ -585,14 +585,14 @@ def revert(
     Use --id to revert a specific email by its Gmail message ID.
     """
     from src.auth.oauth import GmailOAuth
-    from src.imap.client import GmailIMAPClient
+    from src.imap.pool import get_pool
     from src.processor.reverter import EmailReverter
     from src.utils.manifest import ManifestManager
 
     config = get_config(config_path)
 
-    manifest_path = Path("manifest.json")
-    if not manifest_path.exists():
+    manifest_path = Path("manifest.db")
+    if not ManifestManager.exists(manifest_path):
         output.print_error("No manifest found. Nothing to revert.")
         raise typer.Exit(1)
 
@@ -651,8 +651,8 @@ def revert(
             token_file=config.oauth.token_file,
         )
 
-        with GmailIMAPClient(oauth, email) as client:
-            reverter = EmailReverter(client, manifest)
+        with get_pool(oauth, email) as pool:
+            reverter = EmailReverter(pool, manifest)
 
             # Check availability first
             output.console.print("\nChecking Trash for originals...")
@@ -692,8 +692,9 @@ def revert(
             with output.create_progress_bar() as progress:
                 task = progress.add_task("Reverting...", total=len(revertible))
 
-                for entry in revertible:
-                    result = reverter.revert_email(entry, dry_run=False)
+                entries_by_id = {entry.email_id: entry for entry in revertible}
+                for result in reverter.revert_many(revertible):
+                    entry = entries_by_id[result.email_id]
 
                     if result.success:
                         successful += 1
@@ -7,7 +7,7 @@ from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
-from src.models.email import BatchResult, EmailScanResult, ScanStatistics
+from src.models.email import BatchResult, EmailScanResult, ScanStatistics, format_size
 
 
 class RichOutput:
@@ -45,13 +45,13 @@ class RichOutput:
             date_str = result.header.date.strftime("%Y-%m-%d")
             sender = self._truncate(result.header.sender, 30)
             subject = self._truncate(result.header.subject, 40)
-            att_count = len(result.strippable_attachments)
-            size = self._format_size(result.strippable_size)
+            att_count = result.strippable_count
+            size = format_size(result.strippable_size)
 
             status = "OK"
             if result.is_encrypted:
                 status = "[red]Encrypted[/red]"
-            elif not result.strippable_attachments:
+            elif not att_count:
                 status = "[dim]Inline only[/dim]"
 
             table.add_row(date_str, sender, subject, str(att_count), size, status)
@@ -223,21 +223,3 @@ class RichOutput:
         if len(text) <= max_length:
             return text
         return text[: max_length - 3] + "..."
-
-    def _format_size(self, size: int) -> str:
-        """Format size in human-readable form.
-
-        Args:
-            size: Size in bytes.
-
-        Returns:
-            Human-readable size string.
-        """
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.2f} GB"
@@ -1,7 +1,15 @@
 """IMAP client module for Gmail access."""
 
 from src.imap.client import GmailIMAPClient
+from src.imap.pool import GmailIMAPClientPool, get_pool
 from src.imap.search import GmailSearcher, SearchCriteria
 from src.imap.scanner import EmailScanner
 
-__all__ = ["GmailIMAPClient", "GmailSearcher", "SearchCriteria", "EmailScanner"]
+__all__ = [
+    "GmailIMAPClient",
+    "GmailIMAPClientPool",
+    "get_pool",
+    "GmailSearcher",
+    "SearchCriteria",
+    "EmailScanner",
+]
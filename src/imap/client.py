@@ -4,10 +4,55 @@ import imaplib
 import re
 import ssl
 import time
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from src.auth.oauth import GmailOAuth
 
+# Start of one message in a FETCH response, and its UID
+_FETCH_START = re.compile(rb"\d+ \(")
+_FETCH_UID = re.compile(rb"\bUID (\d+)")
+
+_T = TypeVar("_T")
+
+
+def _uid_set(uids: list[int]) -> str:
+    """Format UIDs as a compact IMAP sequence set (e.g. "100:102,110").
+
+    Args:
+        uids: Message UIDs in any order.
+
+    Returns:
+        Sequence set string.
+    """
+    ranges: list[str] = []
+    ordered = sorted(set(uids))
+    start = prev = ordered[0]
+    for uid in ordered[1:]:
+        if uid != prev + 1:
+            ranges.append(f"{start}:{prev}" if prev != start else str(start))
+            start = uid
+        prev = uid
+    ranges.append(f"{start}:{prev}" if prev != start else str(start))
+    return ",".join(ranges)
+
+
+def _expand_uid_set(uid_set: str) -> list[int]:
+    """Expand an IMAP sequence set into UIDs, keeping its order.
+
+    Args:
+        uid_set: Sequence set string (e.g. "100:102,110").
+
+    Returns:
+        UIDs in the order the set lists them.
+    """
+    uids: list[int] = []
+    for item in uid_set.split(","):
+        first, _, last = item.partition(":")
+        start, end = sorted((int(first), int(last or first)))
+        uids.extend(range(start, end + 1))
+    return uids
+
 
 class IMAPConnectionError(Exception):
     """Raised when IMAP connection fails."""
@@ -36,6 +81,8 @@ class GmailIMAPClient:
     GMAIL_EXTENSION_MSGID = "X-GM-MSGID"
     GMAIL_EXTENSION_THRID = "X-GM-THRID"
     GMAIL_EXTENSION_LABELS = "X-GM-LABELS"
+    # Capability advertising X-GM-RAW, X-GM-MSGID, X-GM-THRID and X-GM-LABELS
+    GMAIL_EXTENSION_CAPABILITY = "X-GM-EXT-1"
 
     # Retry configuration
     DEFAULT_MAX_RETRIES = 3
@@ -63,6 +110,8 @@ class GmailIMAPClient:
         self.email_address = email_address
         self._connection: imaplib.IMAP4_SSL | None = None
         self._selected_folder: str | None = None
+        self._selected_readonly: bool | None = None
+        self._selected_count = 0
         self._max_retries = max_retries
         self._retry_delay = retry_delay
         self._operation_delay = operation_delay
@@ -128,6 +177,37 @@ class GmailIMAPClient:
             finally:
                 self._connection = None
                 self._selected_folder = None
+                self._selected_readonly = None
+
+    def has_capability(self, capability: str) -> bool:
+        """Check whether the server advertised a capability.
+
+        Uses the CAPABILITY list imaplib read on connect, so no command is sent.
+
+        Args:
+            capability: Capability name, e.g. "UIDPLUS".
+
+        Returns:
+            True if connected and the capability is advertised.
+        """
+        if self._connection is None:
+            return False
+        return capability.upper() in self._connection.capabilities
+
+    def noop(self) -> None:
+        """Send NOOP to check the connection and keep the session alive.
+
+        Raises:
+            IMAPConnectionError: If not connected or the server doesn't respond.
+        """
+        self._ensure_connected()
+
+        try:
+            status, data = self._connection.noop()  # type: ignore
+        except (imaplib.IMAP4.error, OSError) as e:
+            raise IMAPConnectionError(f"NOOP failed: {e}") from e
+        if status != "OK":
+            raise IMAPConnectionError(f"NOOP failed: {data}")
 
     def select_folder(self, folder: str = "[Gmail]/All Mail", readonly: bool = True) -> int:
         """Select mailbox folder.
@@ -144,6 +224,10 @@ class GmailIMAPClient:
         """
         self._ensure_connected()
 
+        # A failed SELECT leaves no mailbox selected
+        self._selected_folder = None
+        self._selected_readonly = None
+
         try:
             # Quote folder name for IMAP - required for names with special chars
             quoted_folder = f'"{folder}"'
@@ -152,14 +236,35 @@ class GmailIMAPClient:
                 raise IMAPConnectionError(f"Failed to select folder {folder}: {data}")
 
             self._selected_folder = folder
+            self._selected_readonly = readonly
 
             # Parse message count from response
             count = int(data[0].decode() if isinstance(data[0], bytes) else data[0])
+            self._selected_count = count
             return count
 
         except imaplib.IMAP4.error as e:
             raise IMAPConnectionError(f"Error selecting folder {folder}: {e}") from e
 
+    def select_folder_cached(
+        self, folder: str = "[Gmail]/All Mail", readonly: bool = True
+    ) -> int:
+        """Select mailbox folder unless it is already selected in that mode.
+
+        Args:
+            folder: IMAP folder name.
+            readonly: If True, open in read-only mode.
+
+        Returns:
+            Number of messages in the folder as of the last real SELECT.
+
+        Raises:
+            IMAPConnectionError: If not connected or selection fails.
+        """
+        if folder == self._selected_folder and readonly == self._selected_readonly:
+            return self._selected_count
+        return self.select_folder(folder, readonly=readonly)
+
     def list_folders(self) -> list[str]:
         """List all available IMAP folders/labels.
 
@@ -274,6 +379,73 @@ class GmailIMAPClient:
         except imaplib.IMAP4.error as e:
             raise IMAPConnectionError(f"Fetch error for UID {uid}: {e}") from e
 
+    def fetch_many(self, uids: list[int], parts: str) -> dict[int, dict[str, Any]]:
+        """Fetch the same parts for several messages in one round trip.
+
+        Args:
+            uids: Message UIDs.
+            parts: IMAP FETCH parts specification.
+
+        Returns:
+            Dictionary mapping each returned UID to its fetched data.
+
+        Raises:
+            IMAPConnectionError: If fetch fails after retries.
+        """
+        if not uids:
+            return {}
+        return self._retry_with_reconnect(
+            f"Fetch {len(uids)} UIDs",
+            self._fetch_many_internal,
+            uids,
+            parts,
+        )
+
+    def _fetch_many_internal(self, uids: list[int], parts: str) -> dict[int, dict[str, Any]]:
+        """Internal multi-message fetch without retry logic.
+
+        Args:
+            uids: Message UIDs.
+            parts: IMAP FETCH parts specification.
+
+        Returns:
+            Dictionary mapping each returned UID to its fetched data.
+
+        Raises:
+            IMAPConnectionError: If fetch fails.
+        """
+        self._ensure_connected()
+        self._ensure_folder_selected()
+
+        uid_set = _uid_set(uids)
+        try:
+            status, data = self._connection.uid("FETCH", uid_set, parts)  # type: ignore
+            if status != "OK":
+                raise IMAPConnectionError(f"Failed to fetch UIDs {uid_set}")
+        except imaplib.IMAP4.error as e:
+            raise IMAPConnectionError(f"Fetch error for UIDs {uid_set}: {e}") from e
+
+        # Each message starts with "<seq> (" (as a tuple when it carries a
+        # literal); trailing items like b")" belong to the message before
+        groups: list[list[Any]] = []
+        for item in data:
+            if item is None:
+                continue
+            line = item[0] if isinstance(item, tuple) else item
+            if _FETCH_START.match(line) or not groups:
+                groups.append([item])
+            else:
+                groups[-1].append(item)
+
+        results: dict[int, dict[str, Any]] = {}
+        for group in groups:
+            first = group[0][0] if isinstance(group[0], tuple) else group[0]
+            match = _FETCH_UID.search(first)
+            if match:
+                results[int(match.group(1))] = self._parse_fetch_response(group)
+
+        return results
+
     def fetch_raw_email(self, uid: int) -> bytes:
         """Fetch complete raw email by UID.
 
@@ -421,6 +593,30 @@ class GmailIMAPClient:
         except imaplib.IMAP4.error as e:
             raise IMAPConnectionError(f"APPEND error: {e}") from e
 
+    def store_labels_many(self, uids: list[int], labels: list[str], action: str = "+") -> bool:
+        """Add or remove the same Gmail labels on several messages at once.
+
+        Args:
+            uids: Message UIDs.
+            labels: List of labels to add/remove.
+            action: "+" to add, "-" to remove.
+
+        Returns:
+            True if successful.
+
+        Raises:
+            IMAPConnectionError: If operation fails after retries.
+        """
+        if not uids or not labels:
+            return True
+        return self._retry_with_reconnect(
+            f"Store labels for {len(uids)} UIDs",
+            self._store_labels_internal,
+            _uid_set(uids),
+            labels,
+            action,
+        )
+
     def store_labels(self, uid: int, labels: list[str], action: str = "+") -> bool:
         """Add or remove Gmail labels from message.
 
@@ -443,8 +639,13 @@ class GmailIMAPClient:
             action,
         )
 
-    def _store_labels_internal(self, uid: int, labels: list[str], action: str = "+") -> bool:
-        """Internal store labels implementation without retry logic."""
+    def _store_labels_internal(
+        self, uid: int | str, labels: list[str], action: str = "+"
+    ) -> bool:
+        """Internal store labels implementation without retry logic.
+
+        uid may also be a UID sequence set.
+        """
         self._ensure_connected()
         self._ensure_folder_selected()
 
@@ -489,6 +690,101 @@ class GmailIMAPClient:
         status, _ = self._connection.uid("COPY", str(uid), quoted_folder)  # type: ignore
         return status == "OK"
 
+    def uid_copy(self, uid: int, folder: str) -> int | None:
+        """Copy message to another folder server-side, returning its new UID.
+
+        Args:
+            uid: Message UID in the selected folder.
+            folder: Target folder name.
+
+        Returns:
+            UID of the copy from the COPYUID response (UIDPLUS), or None if
+            the server didn't report it.
+
+        Raises:
+            IMAPConnectionError: If the copy fails after retries.
+        """
+        return self._retry_with_reconnect(
+            f"Copy UID {uid} to {folder}",
+            self._uid_copy_internal,
+            uid,
+            folder,
+        )
+
+    def _uid_copy_internal(self, uid: int, folder: str) -> int | None:
+        """Internal UID COPY implementation without retry logic."""
+        self._ensure_connected()
+        self._ensure_folder_selected()
+
+        try:
+            quoted_folder = f'"{folder}"'
+            status, data = self._connection.uid("COPY", str(uid), quoted_folder)  # type: ignore
+        except imaplib.IMAP4.error as e:
+            raise IMAPConnectionError(f"COPY error: {e}") from e
+
+        if status != "OK":
+            raise IMAPConnectionError(f"COPY failed: {data}")
+
+        # Gmail returns: [b'[COPYUID uidvalidity source-uid dest-uid] (Success)']
+        if data and data[0]:
+            response = data[0].decode() if isinstance(data[0], bytes) else str(data[0])
+            match = re.search(r"COPYUID \d+ \S+ (\d+)", response)
+            if match:
+                return int(match.group(1))
+
+        return None
+
+    def uid_copy_many(self, uids: list[int], folder: str) -> dict[int, int]:
+        """Copy several messages to another folder with one UID COPY.
+
+        Args:
+            uids: Message UIDs in the selected folder.
+            folder: Target folder name.
+
+        Returns:
+            Mapping of source UID to the UID of its copy, from the COPYUID
+            response (UIDPLUS). Empty if the server didn't report it.
+
+        Raises:
+            IMAPConnectionError: If the copy fails after retries.
+        """
+        if not uids:
+            return {}
+        return self._retry_with_reconnect(
+            f"Copy {len(uids)} UIDs to {folder}",
+            self._uid_copy_many_internal,
+            uids,
+            folder,
+        )
+
+    def _uid_copy_many_internal(self, uids: list[int], folder: str) -> dict[int, int]:
+        """Internal batch UID COPY implementation without retry logic."""
+        self._ensure_connected()
+        self._ensure_folder_selected()
+
+        try:
+            quoted_folder = f'"{folder}"'
+            status, data = self._connection.uid(  # type: ignore
+                "COPY", _uid_set(uids), quoted_folder
+            )
+        except imaplib.IMAP4.error as e:
+            raise IMAPConnectionError(f"COPY error: {e}") from e
+
+        if status != "OK":
+            raise IMAPConnectionError(f"COPY failed: {data}")
+
+        # [COPYUID uidvalidity source-set dest-set]; the sets pair up in order
+        if data and data[0]:
+            response = data[0].decode() if isinstance(data[0], bytes) else str(data[0])
+            match = re.search(r"COPYUID \d+ ([\d:,]+) ([\d:,]+)", response)
+            if match:
+                sources = _expand_uid_set(match.group(1))
+                copies = _expand_uid_set(match.group(2))
+                if len(sources) == len(copies):
+                    return dict(zip(sources, copies, strict=True))
+
+        return {}
+
     def delete_message(self, uid: int) -> bool:
         """Mark message as deleted (will be removed on EXPUNGE).
 
@@ -560,6 +856,42 @@ class GmailIMAPClient:
             return True
         return False
 
+    def move_many_to_trash(self, uids: list[int]) -> bool:
+        """Move several messages to Gmail Trash with one STORE per label change.
+
+        Args:
+            uids: Message UIDs.
+
+        Returns:
+            True if successful.
+        """
+        if not uids:
+            return True
+        try:
+            return self._retry_with_reconnect(
+                f"Move {len(uids)} UIDs to trash",
+                self._move_many_to_trash_internal,
+                uids,
+            )
+        except IMAPConnectionError:
+            return False
+
+    def _move_many_to_trash_internal(self, uids: list[int]) -> bool:
+        """Internal batch move to trash implementation without retry logic."""
+        self._ensure_connected()
+        self._ensure_folder_selected()
+
+        uid_set = _uid_set(uids)
+        status, _ = self._connection.uid(  # type: ignore
+            "STORE", uid_set, "+X-GM-LABELS", "(\\Trash)"
+        )
+        if status == "OK":
+            self._connection.uid(  # type: ignore
+                "STORE", uid_set, "-X-GM-LABELS", "(\\Inbox)"
+            )
+            return True
+        return False
+
     def expunge(self) -> None:
         """Permanently remove messages marked as deleted."""
         self._ensure_connected()
@@ -600,6 +932,7 @@ class GmailIMAPClient:
                 pass
             self._connection = None
             self._selected_folder = None
+            self._selected_readonly = None
 
         # Reconnect and authenticate
         self.connect()
@@ -633,8 +966,8 @@ class GmailIMAPClient:
         return any(indicator in error_str for indicator in connection_indicators)
 
     def _retry_with_reconnect(
-        self, operation_name: str, operation_func: Any, *args: Any, **kwargs: Any
-    ) -> Any:
+        self, operation_name: str, operation_func: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
         """Execute an operation with retry logic and automatic reconnection.
 
         Args:
@@ -0,0 +1,311 @@
+"""Connection pool for reusing authenticated Gmail IMAP sessions."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.auth.oauth import GmailOAuth
+from src.imap.client import GmailIMAPClient, IMAPConnectionError
+from src.utils.logging import logger
+
+
+class GmailIMAPClientPool:
+    """Pool of authenticated IMAP connections for one Gmail account.
+
+    Connections are opened lazily, up to max_connections, and handed out
+    exclusively by acquire(). A connection idle for longer than
+    KEEPALIVE_INTERVAL, or released after an error, is checked with NOOP
+    before reuse and re-established if the server dropped it.
+    """
+
+    # Gmail allows only a few concurrent IMAP connections per account
+    MAX_CONNECTIONS = 4
+    # Gmail drops idle sessions after roughly 30 minutes
+    KEEPALIVE_INTERVAL = 25 * 60  # seconds
+
+    def __init__(
+        self,
+        factory: Callable[[], GmailIMAPClient],
+        max_connections: int = MAX_CONNECTIONS,
+    ) -> None:
+        """Initialize pool.
+
+        Args:
+            factory: Callable returning a connected, authenticated client.
+            max_connections: Maximum connections open at once.
+        """
+        self._factory = factory
+        self.max_connections = max(1, max_connections)
+        # Idle clients with the monotonic time they were released
+        self._idle: list[tuple[GmailIMAPClient, float]] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        # Localized Trash folder name, resolved once per account
+        self.trash_folder: str | None = None
+
+    @classmethod
+    def for_account(
+        cls,
+        oauth_handler: GmailOAuth,
+        email_address: str,
+        max_connections: int = MAX_CONNECTIONS,
+        **client_kwargs: Any,
+    ) -> "GmailIMAPClientPool":
+        """Create a pool that opens connections for a Gmail account.
+
+        Args:
+            oauth_handler: Configured GmailOAuth instance.
+            email_address: Gmail address to authenticate.
+            max_connections: Maximum connections open at once.
+            **client_kwargs: Extra GmailIMAPClient arguments.
+
+        Returns:
+            New connection pool.
+        """
+        def factory() -> GmailIMAPClient:
+            client = GmailIMAPClient(oauth_handler, email_address, **client_kwargs)
+            client.connect()
+            client.authenticate()
+            return client
+
+        return cls(factory, max_connections)
+
+    @classmethod
+    def from_client(cls, client: GmailIMAPClient) -> "GmailIMAPClientPool":
+        """Wrap an already connected client in a single-connection pool.
+
+        Args:
+            client: Connected, authenticated client.
+
+        Returns:
+            Pool that always hands out this client.
+        """
+        return cls(lambda: client, max_connections=1)
+
+    @contextmanager
+    def acquire(self) -> Iterator[GmailIMAPClient]:
+        """Check out a connection for exclusive use.
+
+        Blocks while all connections are in use.
+
+        Yields:
+            Connected, authenticated client.
+
+        Raises:
+            IMAPConnectionError: If the pool is closed.
+        """
+        client = self._checkout()
+        failed = False
+        try:
+            yield client
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._checkin(client, failed)
+
+    @contextmanager
+    def try_acquire(self) -> Iterator[GmailIMAPClient | None]:
+        """Check out an idle connection if one is available right now.
+
+        Never blocks and never opens a new connection, so it suits work
+        that can run alongside the caller's own connection but doesn't
+        justify waiting for one.
+
+        Yields:
+            Connected, authenticated client, or None.
+        """
+        client = self._try_checkout()
+        if client is None:
+            yield None
+            return
+
+        failed = False
+        try:
+            yield client
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._checkin(client, failed)
+
+    def close(self) -> None:
+        """Disconnect idle connections and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+
+        for client, _ in idle:
+            client.disconnect()
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def _checkout(self) -> GmailIMAPClient:
+        """Take an idle connection, or open one if under the limit.
+
+        Blocks while all connections are in use.
+
+        Returns:
+            Connected, authenticated client.
+
+        Raises:
+            IMAPConnectionError: If the pool is closed.
+        """
+        idle: tuple[GmailIMAPClient, float] | None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise IMAPConnectionError("Connection pool is closed")
+                if self._idle:
+                    idle = self._idle.pop()
+                    break
+                if self._size < self.max_connections:
+                    self._size += 1
+                    idle = None
+                    break
+                self._cond.wait()
+
+        if idle is None:
+            return self._open()
+        return self._revive(*idle)
+
+    def _try_checkout(self) -> GmailIMAPClient | None:
+        """Take an idle connection without blocking or opening one.
+
+        Returns:
+            Connected, authenticated client, or None if none is idle.
+
+        Raises:
+            IMAPConnectionError: If the pool is closed.
+        """
+        with self._cond:
+            if self._closed:
+                raise IMAPConnectionError("Connection pool is closed")
+            if not self._idle:
+                return None
+            idle = self._idle.pop()
+        return self._revive(*idle)
+
+    def _open(self) -> GmailIMAPClient:
+        """Open a connection for a slot already counted in _size.
+
+        Returns:
+            Connected, authenticated client.
+        """
+        try:
+            return self._factory()
+        except Exception:
+            self._release_slot()
+            raise
+
+    def _revive(self, client: GmailIMAPClient, idle_since: float) -> GmailIMAPClient:
+        """Check a connection taken from the idle list before handing it out.
+
+        Args:
+            client: Idle client.
+            idle_since: Monotonic time the client was released.
+
+        Returns:
+            The client, reconnected if the server had dropped it.
+        """
+        if time.monotonic() - idle_since >= self.KEEPALIVE_INTERVAL:
+            try:
+                self._keepalive(client)
+            except Exception:
+                # The connection is unusable; free its slot for a fresh one
+                client.disconnect()
+                self._release_slot()
+                raise
+        return client
+
+    def _release_slot(self) -> None:
+        """Give up a connection slot and wake one waiting checkout."""
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _checkin(self, client: GmailIMAPClient, failed: bool) -> None:
+        """Return a connection to the idle list.
+
+        Args:
+            client: Client being released.
+            failed: If True, the connection is health-checked before reuse.
+        """
+        # After an error, force a NOOP check on the next checkout
+        idle_since = float("-inf") if failed else time.monotonic()
+        with self._cond:
+            discard = self._closed
+            if discard:
+                self._size -= 1
+            else:
+                self._idle.append((client, idle_since))
+            self._cond.notify()
+
+        if discard:
+            client.disconnect()
+
+    def _keepalive(self, client: GmailIMAPClient) -> None:
+        """NOOP an idle connection, reconnecting if it was dropped.
+
+        Args:
+            client: Client to check.
+        """
+        try:
+            client.noop()
+        except Exception as e:
+            logger.debug(f"Pooled IMAP connection lost ({e}), reconnecting")
+            client.disconnect()
+            client.connect()
+            client.authenticate()
+
+    def __enter__(self) -> "GmailIMAPClientPool":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit - close all idle connections."""
+        self.close()
+
+
+# Process-wide pools keyed by (host, account)
+_pools: dict[tuple[str, str], GmailIMAPClientPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(
+    oauth_handler: GmailOAuth,
+    email_address: str,
+    max_connections: int = GmailIMAPClientPool.MAX_CONNECTIONS,
+    **client_kwargs: Any,
+) -> GmailIMAPClientPool:
+    """Get the shared connection pool for a Gmail account.
+
+    The same pool is returned for the lifetime of the process so TLS and
+    LOGIN are paid once per connection rather than once per operation.
+
+    Args:
+        oauth_handler: Configured GmailOAuth instance.
+        email_address: Gmail address to authenticate.
+        max_connections: Maximum connections when creating the pool.
+        **client_kwargs: Extra GmailIMAPClient arguments.
+
+    Returns:
+        Connection pool for the account.
+    """
+    key = (GmailIMAPClient.IMAP_HOST, email_address.lower())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = GmailIMAPClientPool.for_account(
+                oauth_handler, email_address, max_connections, **client_kwargs
+            )
+            _pools[key] = pool
+        return pool
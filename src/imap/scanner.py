@@ -155,9 +155,9 @@ class EmailScanner:
                 continue
 
             stats.total_attachments += len(strippable)
-            stats.total_attachment_size += result.strippable_size
+            stats.total_attachment_size += sum(a.size for a in strippable)
             # Add estimated decoded size (accounts for base64 overhead)
-            stats.estimated_backup_size += result.estimated_strippable_size
+            stats.estimated_backup_size += sum(a.estimated_decoded_size for a in strippable)
 
             # By content type
             for att in strippable:
@@ -1,8 +1,30 @@
 """Data models for email processing."""
 
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
+
+# Lower bound of each unit above bytes, and the matching format
+_SIZE_THRESHOLDS = (1024, 1024 * 1024, 1024 * 1024 * 1024)
+_SIZE_FORMATS = ("{:.1f} KB", "{:.1f} MB", "{:.2f} GB")
+
+
+def format_size(size: int) -> str:
+    """Format a byte count in human-readable form.
+
+    Args:
+        size: Size in bytes.
+
+    Returns:
+        Human-readable size string, e.g. "512 B", "1.5 MB" or "2.00 GB".
+    """
+    unit = bisect_right(_SIZE_THRESHOLDS, size)
+    if unit == 0:
+        return f"{size} B"
+    return _SIZE_FORMATS[unit - 1].format(size / _SIZE_THRESHOLDS[unit - 1])
 
 
 @dataclass
@@ -29,23 +51,52 @@ class EmailHeader:
         return f"[{date_str}] {self.sender}: {self.subject} ({size_kb:.1f}KB)"
 
 
-@dataclass
+# Labels Gmail applies itself; backslash-prefixed labels are IMAP system flags
+_SYSTEM_LABELS = frozenset({"INBOX", "SENT", "DRAFT", "SPAM", "TRASH"})
+_SYSTEM_LABEL_PREFIXES = ("\\",)
+
+
+def is_user_label(label: str) -> bool:
+    """Check whether a Gmail label was applied by the user.
+
+    Args:
+        label: Label from X-GM-LABELS.
+
+    Returns:
+        False for labels Gmail manages itself, True otherwise.
+    """
+    return label not in _SYSTEM_LABELS and not label.startswith(_SYSTEM_LABEL_PREFIXES)
+
+
+@dataclass(slots=True, frozen=True)
 class GmailMetadata:
-    """Gmail-specific metadata from IMAP extensions."""
+    """Gmail-specific metadata from IMAP extensions.
+
+    Labels are lowercased once at construction for has_label(), so the
+    labels list must not be modified in place.
+    """
 
     gmail_message_id: int  # X-GM-MSGID - unique message identifier
     gmail_thread_id: int  # X-GM-THRID - conversation thread ID
     labels: list[str]  # X-GM-LABELS - Gmail labels/folders
+    _labels_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the case-insensitive label set."""
+        object.__setattr__(self, "_labels_lower", frozenset(label.lower() for label in self.labels))
 
     def has_label(self, label: str) -> bool:
         """Check if message has a specific label (case-insensitive)."""
-        label_lower = label.lower()
-        return any(l.lower() == label_lower for l in self.labels)
+        return label.lower() in self._labels_lower
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttachmentInfo:
-    """Information about an email attachment."""
+    """Information about an email attachment.
+
+    Frozen so the is_inline and is_image flags can be derived once at
+    construction; use dataclasses.replace() to get a modified copy.
+    """
 
     filename: str
     content_type: str
@@ -54,6 +105,14 @@ class AttachmentInfo:
     part_number: str  # MIME part reference (e.g., "2", "1.2")
     content_id: str | None = None  # For inline images (CID)
     encoding: str | None = None  # Content-Transfer-Encoding
+    # Derived in __post_init__: inline attachment (usually image), image content type
+    is_inline: bool = field(init=False, repr=False, compare=False)
+    is_image: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the inline and image flags."""
+        object.__setattr__(self, "is_inline", self.content_disposition.lower() == "inline")
+        object.__setattr__(self, "is_image", self.content_type.lower().startswith("image/"))
 
     @property
     def estimated_decoded_size(self) -> int:
@@ -77,25 +136,10 @@ class AttachmentInfo:
             # No encoding or 7bit/8bit - size is accurate
             return self.size
 
-    @property
-    def is_inline(self) -> bool:
-        """Check if this is an inline attachment (usually image)."""
-        return self.content_disposition.lower() == "inline"
-
-    @property
-    def is_image(self) -> bool:
-        """Check if this is an image attachment."""
-        return self.content_type.lower().startswith("image/")
-
     @property
     def size_human(self) -> str:
         """Human-readable size string."""
-        if self.size < 1024:
-            return f"{self.size} B"
-        elif self.size < 1024 * 1024:
-            return f"{self.size / 1024:.1f} KB"
-        else:
-            return f"{self.size / (1024 * 1024):.1f} MB"
+        return format_size(self.size)
 
     def __str__(self) -> str:
         """Human-readable representation."""
@@ -122,10 +166,15 @@ class EmailScanResult:
         """Attachments that can be stripped (not inline images)."""
         return [a for a in self.attachments if not a.is_inline]
 
+    @property
+    def strippable_count(self) -> int:
+        """Number of strippable attachments, without building the list."""
+        return sum(not a.is_inline for a in self.attachments)
+
     @property
     def strippable_size(self) -> int:
         """Total size of strippable attachments (encoded/raw size from IMAP)."""
-        return sum(a.size for a in self.strippable_attachments)
+        return sum(a.size for a in self.attachments if not a.is_inline)
 
     @property
     def estimated_strippable_size(self) -> int:
@@ -134,12 +183,12 @@ class EmailScanResult:
         This is more accurate for estimating disk space savings since it
         accounts for base64 decoding (~25% smaller than encoded size).
         """
-        return sum(a.estimated_decoded_size for a in self.strippable_attachments)
+        return sum(a.estimated_decoded_size for a in self.attachments if not a.is_inline)
 
     @property
     def can_process(self) -> bool:
         """Check if this email can be processed (not encrypted, has strippable attachments)."""
-        return not self.is_encrypted and len(self.strippable_attachments) > 0
+        return not self.is_encrypted and any(not a.is_inline for a in self.attachments)
 
 
 @dataclass
@@ -221,9 +270,28 @@ class ReplaceResult:
         return self.original_size - self.new_size
 
 
-@dataclass
+@dataclass(slots=True)
 class ManifestEntry:
-    """Single manifest entry for a processed email."""
+    """Single manifest entry for a processed email.
+
+    Uses __slots__ since the manifest materializes one per stored email.
+    """
+
+    # Column order of to_csv_row()
+    CSV_FIELDS: ClassVar[tuple[str, ...]] = (
+        "email_id",
+        "imap_uid",
+        "subject",
+        "sender",
+        "date",
+        "labels",
+        "attachment_count",
+        "processed_at",
+        "status",
+        "original_size",
+        "stripped_size",
+        "error_message",
+    )
 
     email_id: str  # Gmail message ID (X-GM-MSGID)
     imap_uid: int
@@ -264,23 +332,56 @@ class ManifestEntry:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ManifestEntry":
-        """Create from dictionary."""
-        return cls(
-            email_id=data["email_id"],
-            imap_uid=data["imap_uid"],
-            subject=data["subject"],
-            sender=data["sender"],
-            date=datetime.fromisoformat(data["date"]),
-            labels=data["labels"],
-            attachments=data["attachments"],
-            processed_at=datetime.fromisoformat(data["processed_at"]),
-            status=data["status"],
-            original_size=data["original_size"],
-            stripped_size=data.get("stripped_size"),
-            error_message=data.get("error_message"),
-            stripped_uid=data.get("stripped_uid"),
-            original_message_id=data.get("original_message_id"),
-            gmail_thread_id=data.get("gmail_thread_id"),
+        """Create from dictionary.
+
+        Keys that aren't ManifestEntry fields are ignored; missing optional
+        fields take their defaults.
+        """
+        return _manifest_entry_from_dict(cls, data)
+
+    def to_csv_row(self) -> tuple[Any, ...]:
+        """Convert to a CSV export row with columns in CSV_FIELDS order."""
+        return (
+            self.email_id,
+            self.imap_uid,
+            self.subject,
+            self.sender,
+            self.date.isoformat(),
+            ";".join(self.labels),
+            len(self.attachments),
+            self.processed_at.isoformat(),
+            self.status,
+            self.original_size,
+            self.stripped_size or "",
+            self.error_message or "",
+        )
+
+    @staticmethod
+    def csv_row_from_dict(data: dict[str, Any]) -> tuple[Any, ...]:
+        """Build the to_csv_row() row straight from a to_dict() dictionary.
+
+        Dates are already ISO strings in the dictionary, so this skips
+        parsing them into an entry only to format them again.
+
+        Args:
+            data: Dictionary as produced by to_dict().
+
+        Returns:
+            CSV row with columns in CSV_FIELDS order.
+        """
+        return (
+            data["email_id"],
+            data["imap_uid"],
+            data["subject"],
+            data["sender"],
+            data["date"],
+            ";".join(data["labels"]),
+            len(data["attachments"]),
+            data["processed_at"],
+            data["status"],
+            data["original_size"],
+            data.get("stripped_size") or "",
+            data.get("error_message") or "",
         )
 
     @property
@@ -289,6 +390,44 @@ class ManifestEntry:
         return self.status == "completed" and self.original_message_id is not None
 
 
+# Signature of the generated ManifestEntry.from_dict implementation
+_EntryFromDict = Callable[[type[ManifestEntry], dict[str, Any]], ManifestEntry]
+
+
+def _compile_from_dict(entry_cls: type[ManifestEntry]) -> _EntryFromDict:
+    """Generate a from_dict(cls, data) function specialized to a dataclass.
+
+    The generated code passes every field positionally, parsing datetime
+    fields inline, so loading an entry needs no per-call field reflection
+    or keyword unpacking. Fields with a default are read with dict.get().
+
+    Args:
+        entry_cls: Dataclass whose fields have no default_factory.
+
+    Returns:
+        Function taking (cls, data) and returning a new instance.
+    """
+    namespace: dict[str, Any] = {"_fromisoformat": datetime.fromisoformat}
+    args = []
+    for f in fields(entry_cls):
+        if f.default is MISSING:
+            value = f"data[{f.name!r}]"
+        else:
+            namespace[f"_default_{f.name}"] = f.default
+            value = f"data.get({f.name!r}, _default_{f.name})"
+        if f.type is datetime:
+            value = f"_fromisoformat({value})"
+        args.append(value)
+
+    source = f"def from_dict(cls, data):\n    return cls({', '.join(args)})\n"
+    exec(source, namespace)
+    from_dict: _EntryFromDict = namespace["from_dict"]
+    return from_dict
+
+
+_manifest_entry_from_dict = _compile_from_dict(ManifestEntry)
+
+
 @dataclass
 class ScanStatistics:
     """Aggregate statistics from email scanning."""
@@ -303,6 +442,39 @@ class ScanStatistics:
     by_year: dict[int, int] = field(default_factory=dict)
     by_sender: dict[str, int] = field(default_factory=dict)
 
+    @classmethod
+    def aggregate(cls, parts: Iterable["ScanStatistics"]) -> "ScanStatistics":
+        """Combine statistics from several scans into one.
+
+        Breakdown dicts are merged with Counter.update(), which counts in C.
+
+        Args:
+            parts: Statistics to combine, e.g. one per scan batch or account.
+
+        Returns:
+            New ScanStatistics covering all parts.
+        """
+        parts = list(parts)
+        by_content_type: Counter[str] = Counter()
+        by_year: Counter[int] = Counter()
+        by_sender: Counter[str] = Counter()
+        for part in parts:
+            by_content_type.update(part.by_content_type)
+            by_year.update(part.by_year)
+            by_sender.update(part.by_sender)
+
+        return cls(
+            total_emails=sum(p.total_emails for p in parts),
+            total_attachments=sum(p.total_attachments for p in parts),
+            total_attachment_size=sum(p.total_attachment_size for p in parts),
+            emails_with_inline_only=sum(p.emails_with_inline_only for p in parts),
+            encrypted_emails_skipped=sum(p.encrypted_emails_skipped for p in parts),
+            estimated_backup_size=sum(p.estimated_backup_size for p in parts),
+            by_content_type=dict(by_content_type),
+            by_year=dict(by_year),
+            by_sender=dict(by_sender),
+        )
+
     @property
     def processable_emails(self) -> int:
         """Number of emails that can be processed."""
@@ -316,25 +488,13 @@ class ScanStatistics:
     @property
     def estimated_savings_human(self) -> str:
         """Human-readable estimated savings (raw/encoded size)."""
-        size = self.estimated_savings
-        return self._format_size(size)
+        return format_size(self.estimated_savings)
 
     @property
     def estimated_backup_size_human(self) -> str:
         """Human-readable estimated backup size (decoded/actual size)."""
         size = self.estimated_backup_size if self.estimated_backup_size > 0 else self.estimated_savings
-        return self._format_size(size)
-
-    def _format_size(self, size: int) -> str:
-        """Format size in human-readable form."""
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.2f} GB"
+        return format_size(size)
 
 
 @dataclass
@@ -359,12 +519,4 @@ class BatchResult:
     @property
     def bytes_saved_human(self) -> str:
         """Human-readable bytes saved."""
-        size = self.total_bytes_saved
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.2f} GB"
+        return format_size(self.total_bytes_saved)
@@ -1,6 +1,5 @@
 """Backup management for extracted attachments."""
 
-import re
 import shutil
 import unicodedata
 import zipfile
@@ -8,8 +7,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from src.models.email import EmailHeader, SavedAttachment
-from src.utils.hashing import compute_sha256
+from src.models.email import EmailHeader, SavedAttachment, format_size
+from src.utils.hashing import compute_sha256, invalidate_hash_cache, verify_file_hashes
 
 
 # File type categories for organization
@@ -59,7 +58,10 @@ class BackupManager:
     MAX_SUBJECT_LENGTH = 50
 
     # Invalid filename characters
-    INVALID_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+    INVALID_CHARS = '<>:"/\\|?*' + "".join(map(chr, range(0x20)))
+    # Each invalid character or space becomes "_"; extensions drop them instead
+    _SANITIZE_TABLE = str.maketrans(dict.fromkeys(INVALID_CHARS + " ", "_"))
+    _EXTENSION_TABLE = str.maketrans("", "", INVALID_CHARS)
 
     def __init__(
         self,
@@ -190,6 +192,7 @@ class BackupManager:
         file_hash = compute_sha256(data)
 
         # Write file
+        invalidate_hash_cache(path)
         with open(path, "wb") as f:
             f.write(data)
 
@@ -218,6 +221,21 @@ class BackupManager:
         full_path = self.backup_root / saved.saved_path
         return verify_file_hash(full_path, saved.sha256_hash)
 
+    def verify_backups(self, saved: list[SavedAttachment]) -> list[SavedAttachment]:
+        """Verify several backups, hashing the files in parallel.
+
+        Args:
+            saved: SavedAttachment records to verify.
+
+        Returns:
+            Records whose backup is missing or doesn't match its hash.
+        """
+        paths = [self.backup_root / s.saved_path for s in saved]
+        results = verify_file_hashes(
+            dict(zip(paths, (s.sha256_hash for s in saved), strict=True))
+        )
+        return [s for s, path in zip(saved, paths, strict=True) if not results[path]]
+
     def get_storage_stats(self) -> dict[str, Any]:
         """Calculate backup directory statistics.
 
@@ -331,29 +349,11 @@ class BackupManager:
                 stats[category] = {
                     "file_count": file_count,
                     "total_size": total_size,
-                    "total_size_human": self._format_size(total_size),
+                    "total_size_human": format_size(total_size),
                 }
 
         return stats
 
-    def _format_size(self, size: int) -> str:
-        """Format size in human-readable form.
-
-        Args:
-            size: Size in bytes.
-
-        Returns:
-            Human-readable size string.
-        """
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.2f} GB"
-
     def _get_date_path(self, date: datetime) -> Path:
         """Generate date-based path component.
 
@@ -424,11 +424,8 @@ class BackupManager:
         # Normalize unicode
         text = unicodedata.normalize("NFKD", text)
 
-        # Remove invalid characters
-        text = self.INVALID_CHARS.sub("_", text)
-
-        # Replace multiple underscores/spaces
-        text = re.sub(r"[_\s]+", "_", text)
+        # Replace invalid characters and spaces
+        text = text.translate(self._SANITIZE_TABLE)
 
         # Strip leading/trailing underscores and dots
         text = text.strip("_.")
@@ -461,9 +458,7 @@ class BackupManager:
         ext = f".{parts[1]}" if len(parts) > 1 else ""
 
         # Sanitize name
-        name = self.INVALID_CHARS.sub("_", name)
-        name = re.sub(r"[_\s]+", "_", name)
-        name = name.strip("_.")
+        name = name.translate(self._SANITIZE_TABLE).strip("_.")
 
         # Truncate name (leaving room for extension)
         max_name_length = self.MAX_FILENAME_LENGTH - len(ext)
@@ -471,7 +466,7 @@ class BackupManager:
             name = name[:max_name_length].rstrip("_.")
 
         # Sanitize extension
-        ext = self.INVALID_CHARS.sub("", ext).lower()
+        ext = ext.translate(self._EXTENSION_TABLE).lower()
         if len(ext) > 10:
             ext = ext[:10]
 
@@ -3,7 +3,7 @@
 import time
 from typing import TYPE_CHECKING, Any, Callable
 
-from src.models.email import BatchResult, EmailScanResult
+from src.models.email import BatchResult, EmailScanResult, format_size
 from src.processor.backup import BackupManager
 from src.processor.extractor import AttachmentExtractor
 from src.processor.replacer import EmailReplacer
@@ -88,6 +88,11 @@ class BatchProcessor:
         skipped = 0
         total_savings = 0
 
+        # Nothing is written during a dry run, so look up processed emails once
+        processed_ids = self.manifest.get_processed_ids(
+            str(r.gmail_metadata.gmail_message_id) for r in scan_results
+        )
+
         for i, scan_result in enumerate(scan_results):
             if progress_callback:
                 progress_callback(
@@ -103,7 +108,7 @@ class BatchProcessor:
 
             # Check if already processed
             email_id = str(scan_result.gmail_metadata.gmail_message_id)
-            if self.manifest.is_processed(email_id):
+            if email_id in processed_ids:
                 skipped += 1
                 continue
 
@@ -333,35 +338,30 @@ class BatchPreview:
         Returns:
             Dictionary with summary statistics.
         """
-        processable = [r for r in self.scan_results if r.can_process]
-        encrypted = [r for r in self.scan_results if r.is_encrypted]
-        inline_only = [
-            r for r in self.scan_results if r.attachments and not r.strippable_attachments
-        ]
-
-        total_size = sum(r.strippable_size for r in processable)
+        processable = encrypted = inline_only = total_attachments = total_size = 0
+
+        # One pass over the results, counting each email's attachments once
+        for r in self.scan_results:
+            strippable = r.strippable_count
+            if r.is_encrypted:
+                encrypted += 1
+            elif strippable:
+                processable += 1
+                total_attachments += strippable
+                total_size += r.strippable_size
+            if r.attachments and not strippable:
+                inline_only += 1
 
         return {
             "total_emails": len(self.scan_results),
-            "processable": len(processable),
-            "encrypted_skipped": len(encrypted),
-            "inline_only_skipped": len(inline_only),
-            "total_attachments": sum(len(r.strippable_attachments) for r in processable),
+            "processable": processable,
+            "encrypted_skipped": encrypted,
+            "inline_only_skipped": inline_only,
+            "total_attachments": total_attachments,
             "estimated_savings_bytes": total_size,
-            "estimated_savings_human": self._format_size(total_size),
+            "estimated_savings_human": format_size(total_size),
         }
 
-    def _format_size(self, size: int) -> str:
-        """Format size in human-readable form."""
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.2f} GB"
-
     def get_by_year(self) -> dict[int, int]:
         """Group processable emails by year.
 
@@ -11,6 +11,7 @@ from src.models.email import (
     SavedAttachment,
 )
 from src.processor.backup import BackupManager
+from src.utils.hashing import invalidate_hash_cache
 from src.utils.logging import logger
 
 if TYPE_CHECKING:
@@ -252,7 +253,6 @@ class StreamingExtractor:
         Returns:
             SavedAttachment if successful.
         """
-        import hashlib
         import tempfile
 
         # Get backup path
@@ -284,22 +284,11 @@ class StreamingExtractor:
             else:
                 decoded = raw_data
 
-            # Write to file and compute hash
-            hash_obj = hashlib.sha256()
-            with open(backup_path, "wb") as f:
-                for i in range(0, len(decoded), self.CHUNK_SIZE):
-                    chunk = decoded[i : i + self.CHUNK_SIZE]
-                    hash_obj.update(chunk)
-                    f.write(chunk)
-
-            relative_path = str(backup_path.relative_to(self.backup_manager.backup_root))
-
-            return SavedAttachment(
+            return self.backup_manager.save_attachment(
+                data=decoded,
+                path=backup_path,
                 original_filename=attachment.filename,
-                saved_path=relative_path,
-                size=len(decoded),
                 content_type=attachment.content_type,
-                sha256_hash=f"sha256:{hash_obj.hexdigest()}",
             )
 
     def _decode_base64_streaming(
@@ -327,6 +316,7 @@ class StreamingExtractor:
         # Clean up base64 data (remove whitespace)
         clean_data = b"".join(raw_data.split())
 
+        invalidate_hash_cache(output_path)
         with open(output_path, "wb") as f:
             # Process in chunks (must be multiple of 4 for base64)
             chunk_size = (self.CHUNK_SIZE // 3) * 4  # Adjust for base64 overhead
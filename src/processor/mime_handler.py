@@ -2,7 +2,7 @@
 
 from email import policy
 from email.header import decode_header, make_header
-from email.message import EmailMessage
+from email.message import EmailMessage, MIMEPart
 from urllib.parse import unquote
 
 
@@ -108,6 +108,24 @@ class MIMEHandler:
 
         return None
 
+    @staticmethod
+    def cached_part_filename(part: EmailMessage) -> str | None:
+        """get_part_filename() memoized on the part object.
+
+        Only use on parts whose headers won't change afterwards.
+
+        Args:
+            part: Email message part.
+
+        Returns:
+            Decoded filename or None.
+        """
+        cache = part.__dict__
+        if "_cached_filename" not in cache:
+            cache["_cached_filename"] = MIMEHandler.get_part_filename(part)
+        filename: str | None = cache["_cached_filename"]
+        return filename
+
     @staticmethod
     def _decode_filename(filename: str) -> str:
         """Decode RFC 2047/2231 encoded filename.
@@ -194,6 +212,22 @@ class MIMEHandler:
             return content_type.split("/")[1]
         return ""
 
+    @staticmethod
+    def cached_subtype(msg: EmailMessage) -> str:
+        """get_subtype() memoized on the message object.
+
+        Args:
+            msg: Email message.
+
+        Returns:
+            MIME subtype.
+        """
+        cache = msg.__dict__
+        if "_cached_subtype" not in cache:
+            cache["_cached_subtype"] = MIMEHandler.get_subtype(msg)
+        subtype: str = cache["_cached_subtype"]
+        return subtype
+
     @staticmethod
     def is_text_part(part: EmailMessage) -> bool:
         """Check if part is text (plain or HTML).
@@ -280,7 +314,7 @@ class EncodingHandler:
             return str(Header(value, "utf-8"))
 
     @staticmethod
-    def safe_decode_payload(part: EmailMessage) -> str:
+    def safe_decode_payload(part: MIMEPart) -> str:
         """Safely decode part payload with fallbacks.
 
         Args:
@@ -1,22 +1,154 @@
 """Email reconstruction with attachments stripped."""
 
+import quopri
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from email import policy
-from email.message import EmailMessage
-from email.parser import BytesParser
+from email.generator import BytesGenerator
+from email.message import EmailMessage, MIMEPart
+from email.parser import BytesHeaderParser, BytesParser
+from itertools import pairwise
 from pathlib import Path
+from string import Formatter
 from typing import Any
 
 from src.models.email import AttachmentInfo, SavedAttachment
 from src.processor.mime_handler import EncodingHandler, MIMEHandler
 from src.utils.logging import logger
 
+# Field order used when calling a compiled placeholder template
+PLACEHOLDER_FIELDS = ("filename", "size_human", "content_type", "backup_path", "processed_at")
+
+# Charsets whose encoded payload can take a notice appended as-is
+_UTF8_CHARSETS = frozenset({"utf-8", "utf8"})
+_ASCII_CHARSETS = frozenset({"us-ascii", "ascii"})
+
+# Blank line separating a header block from its body
+_HEADER_END = re.compile(rb"\r?\n\r?\n")
+
+
+def _fill_lookup(
+    attachments: list[AttachmentInfo],
+    saved_attachments: list[SavedAttachment],
+    filenames: set[str],
+    attachment_info: dict[str, AttachmentInfo],
+    backup_paths: dict[str, str],
+) -> None:
+    """Refill the filename lookups used while stripping.
+
+    The containers are cleared and reused rather than rebuilt, so batch
+    runs don't allocate a fresh set of lookups per email.
+
+    Args:
+        attachments: Attachments to strip.
+        saved_attachments: Saved attachment records.
+        filenames: Filenames to strip (cleared and refilled).
+        attachment_info: Filename -> AttachmentInfo (cleared and refilled).
+        backup_paths: Filename -> backup path (cleared and refilled).
+    """
+    filenames.clear()
+    attachment_info.clear()
+    backup_paths.clear()
+
+    for att in attachments:
+        filenames.add(att.filename)
+        attachment_info[att.filename] = att
+    for saved in saved_attachments:
+        backup_paths[saved.original_filename] = saved.saved_path
+
+
+def _compile_placeholder_template(template: str) -> Callable[..., str]:
+    """Compile a placeholder template into a positional formatter.
+
+    The template is split into literal segments and field references once,
+    so each placeholder is built with a plain join instead of re-parsing
+    the format string. Templates using conversions, format specs or unknown
+    fields fall back to str.format.
+
+    Args:
+        template: Template using the PLACEHOLDER_FIELDS names.
+
+    Returns:
+        Callable taking the fields positionally in PLACEHOLDER_FIELDS order.
+    """
+    segments: list[str] = []
+    indices: list[int] = []
+    literal_run = ""
+
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        literal_run += literal
+        if field_name is None:
+            continue
+        if format_spec or conversion or field_name not in PLACEHOLDER_FIELDS:
+
+            def format_fallback(*values: str) -> str:
+                return template.format(**dict(zip(PLACEHOLDER_FIELDS, values, strict=True)))
+
+            return format_fallback
+        segments.append(literal_run)
+        indices.append(PLACEHOLDER_FIELDS.index(field_name))
+        literal_run = ""
+
+    segments.append(literal_run)
+    head = segments[0]
+    pairs = tuple(zip(indices, segments[1:], strict=True))
+
+    def format_placeholder(*values: str) -> str:
+        out = [head]
+        for index, literal in pairs:
+            out.append(values[index])
+            out.append(literal)
+        return "".join(out)
+
+    return format_placeholder
+
+
+class _BytearrayWriter:
+    """Minimal file-like sink that appends generator output to a bytearray."""
+
+    def __init__(self, buf: bytearray) -> None:
+        """Initialize writer.
+
+        Args:
+            buf: Buffer to append to.
+        """
+        self._buf = buf
+
+    def write(self, data: bytes) -> int:
+        """Append data to the buffer.
+
+        Args:
+            data: Bytes to append.
+
+        Returns:
+            Number of bytes written.
+        """
+        self._buf.extend(data)
+        return len(data)
+
+
+@dataclass
+class _FastStripState:
+    """Lookup tables and counters shared across a fast_reconstruct() walk."""
+
+    view: memoryview
+    filenames: set[str]
+    attachment_info: dict[str, AttachmentInfo]
+    backup_paths: dict[str, str]
+    processed_at: str
+    stripped: int = 0
+
 
 class EmailReconstructor:
     """Reconstructs emails with attachments stripped.
 
     Preserves all headers (especially threading-related) and
     replaces attachment parts with placeholder text.
+
+    Instances reuse internal scratch containers between calls and are
+    not thread-safe; use one reconstructor per thread or process.
     """
 
     # Headers critical for threading - must be preserved exactly
@@ -62,7 +194,54 @@ class EmailReconstructor:
         """
         self.preserve_inline = preserve_inline
         self.placeholder_template = placeholder_template or self._default_placeholder_template()
+        self._placeholder_fmt = _compile_placeholder_template(self.placeholder_template)
         self._parser = BytesParser(policy=policy.default)
+        self._header_parser = BytesHeaderParser(policy=policy.default)
+        # Placeholder part header blocks keyed by (line ending, transfer encoding)
+        self._placeholder_headers_bytes = {
+            (eol, cte): eol.join(
+                (
+                    b'Content-Type: text/plain; charset="utf-8"',
+                    b"Content-Transfer-Encoding: " + cte,
+                    b"",
+                    b"",
+                )
+            )
+            for eol in (b"\r\n", b"\n")
+            for cte in (b"7bit", b"8bit")
+        }
+        # Compiled delimiter patterns, reset for each message
+        self._boundary_re_cache: dict[bytes, re.Pattern[bytes]] = {}
+        # Scratch containers reused across calls
+        self._scratch_filenames: set[str] = set()
+        self._scratch_attinfo: dict[str, AttachmentInfo] = {}
+        self._scratch_backup: dict[str, str] = {}
+        # Free list of part lists, one taken per multipart level in use
+        self._payload_pool: list[list[MIMEPart]] = []
+
+    def _lookups(
+        self,
+        attachments: list[AttachmentInfo],
+        saved_attachments: list[SavedAttachment],
+    ) -> tuple[set[str], dict[str, AttachmentInfo], dict[str, str]]:
+        """Refill and return the reusable filename lookups.
+
+        Args:
+            attachments: Attachments to strip.
+            saved_attachments: Saved attachment records.
+
+        Returns:
+            Tuple of (filenames to strip, filename -> AttachmentInfo,
+            filename -> backup path).
+        """
+        _fill_lookup(
+            attachments,
+            saved_attachments,
+            self._scratch_filenames,
+            self._scratch_attinfo,
+            self._scratch_backup,
+        )
+        return self._scratch_filenames, self._scratch_attinfo, self._scratch_backup
 
     def _default_placeholder_template(self) -> str:
         """Default placeholder template for removed attachments."""
@@ -98,14 +277,17 @@ Tool: gmail-clean-and-backup
         # Save the original Content-Type for recovery if needed
         original_content_type = original.get("Content-Type")
 
-        # Create mapping of filename to backup path
-        backup_paths = {
-            saved.original_filename: saved.saved_path for saved in saved_attachments
-        }
+        # Build filename lookups once for the whole MIME tree
+        filenames_to_strip, attachment_info, backup_paths = self._lookups(
+            attachments_to_strip, saved_attachments
+        )
+
+        # All placeholders in one email share the same processing timestamp
+        processed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Strip attachments
         reconstructed = self._strip_attachments(
-            original, attachments_to_strip, backup_paths
+            original, filenames_to_strip, attachment_info, backup_paths, processed_at
         )
 
         # Ensure Content-Type header exists before serialization
@@ -126,6 +308,33 @@ Tool: gmail-clean-and-backup
         # Serialize back to bytes
         return self.serialize(reconstructed)
 
+    def fast_reconstruct(
+        self,
+        raw_email: bytes,
+        attachments_to_strip: list[AttachmentInfo],
+        saved_attachments: list[SavedAttachment],
+    ) -> bytes:
+        """Reconstruct by rewriting MIME part ranges in the raw bytes.
+
+        Only part headers are parsed; untouched parts are copied verbatim
+        and stripped parts are dropped in favour of a placeholder part.
+        Falls back to reconstruct() for single-part messages or any
+        structure the byte-level scan can't handle.
+
+        Args:
+            raw_email: Original raw email bytes.
+            attachments_to_strip: List of attachments to remove.
+            saved_attachments: List of saved attachment records.
+
+        Returns:
+            Reconstructed email bytes.
+        """
+        rewritten = self._fast_strip(raw_email, attachments_to_strip, saved_attachments)
+        if rewritten is None:
+            logger.debug("Fast reconstruction not applicable, using full parse")
+            return self.reconstruct(raw_email, attachments_to_strip, saved_attachments)
+        return rewritten
+
     def parse_email(self, raw_email: bytes) -> EmailMessage:
         """Parse raw email into EmailMessage object.
 
@@ -146,27 +355,31 @@ Tool: gmail-clean-and-backup
         Returns:
             Raw email bytes.
         """
-        return msg.as_bytes(policy=policy.SMTP)
+        buf = bytearray()
+        generator = BytesGenerator(_BytearrayWriter(buf), mangle_from_=False, policy=policy.SMTP)
+        generator.flatten(msg)
+        return bytes(buf)
 
     def _strip_attachments(
         self,
         msg: EmailMessage,
-        attachments: list[AttachmentInfo],
+        filenames_to_strip: set[str],
+        attachment_info: dict[str, AttachmentInfo],
         backup_paths: dict[str, str],
+        processed_at: str,
     ) -> EmailMessage:
         """Strip specified attachments from message.
 
         Args:
             msg: Email message.
-            attachments: Attachments to strip.
+            filenames_to_strip: Set of filenames to strip.
+            attachment_info: Map of filename to attachment info.
             backup_paths: Map of filename to backup path.
+            processed_at: Formatted processing timestamp for placeholders.
 
         Returns:
             Modified message.
         """
-        # Create set of filenames to strip for fast lookup
-        filenames_to_strip = {att.filename for att in attachments}
-
         if not msg.is_multipart():
             # Simple message - check if it's an attachment
             filename = MIMEHandler.get_part_filename(msg)
@@ -174,114 +387,129 @@ Tool: gmail-clean-and-backup
                 # Replace entire message content with placeholder
                 placeholder = self._create_placeholder(
                     filename,
-                    attachments[0] if attachments else None,
+                    attachment_info.get(filename),
                     backup_paths.get(filename, ""),
+                    processed_at,
                 )
                 msg.set_content(placeholder, subtype="plain", charset="utf-8")
             return msg
 
         # Multipart message - process recursively
-        return self._process_multipart(msg, filenames_to_strip, backup_paths, attachments)
+        return self._process_multipart(
+            msg, filenames_to_strip, attachment_info, backup_paths, processed_at
+        )
 
     def _process_multipart(
         self,
         msg: EmailMessage,
         filenames_to_strip: set[str],
+        attachment_info: dict[str, AttachmentInfo],
         backup_paths: dict[str, str],
-        attachments: list[AttachmentInfo],
+        processed_at: str,
     ) -> EmailMessage:
         """Process multipart message, stripping attachments.
 
         Args:
             msg: Multipart message.
             filenames_to_strip: Set of filenames to strip.
+            attachment_info: Map of filename to attachment info.
             backup_paths: Map of filename to backup path.
-            attachments: Full attachment info list.
+            processed_at: Formatted processing timestamp for placeholders.
 
         Returns:
             Modified message.
         """
-        # Get attachment info lookup
-        attachment_info = {att.filename: att for att in attachments}
-
-        # Preserve the original Content-Type header before modifying payload
-        # set_payload() can clear or corrupt the Content-Type header
-        original_content_type = msg.get("Content-Type")
-        original_boundary = msg.get_boundary()
-
-        # Build new payload list
-        new_payload = []
-        placeholders_added = []
-
-        for part in msg.iter_parts():
-            # Check if this part should be stripped
-            filename = MIMEHandler.get_part_filename(part)
-
-            if filename and filename in filenames_to_strip:
-                # Check if we should preserve inline
-                if self.preserve_inline and MIMEHandler.has_content_id(part):
-                    # Keep inline attachment
-                    new_payload.append(part)
+        # Reuse a part list from the free list; nested levels take their own
+        pool = self._payload_pool
+        new_payload = pool.pop() if pool else []
+        try:
+            placeholders_added = []
+            create_placeholder = self._create_placeholder
+            get_filename = MIMEHandler.cached_part_filename
+
+            for part in msg.iter_parts():
+                # Check if this part should be stripped
+                filename = get_filename(part)
+
+                if filename and filename in filenames_to_strip:
+                    # Check if we should preserve inline
+                    if self.preserve_inline and MIMEHandler.has_content_id(part):
+                        # Keep inline attachment
+                        new_payload.append(part)
+                        continue
+
+                    # Create placeholder part
+                    att_info = attachment_info.get(filename)
+                    placeholder_text = create_placeholder(
+                        filename,
+                        att_info,
+                        backup_paths.get(filename, ""),
+                        processed_at,
+                    )
+                    placeholders_added.append(placeholder_text)
                     continue
 
-                # Create placeholder part
-                att_info = attachment_info.get(filename)
-                placeholder_text = self._create_placeholder(
-                    filename,
-                    att_info,
-                    backup_paths.get(filename, ""),
-                )
-                placeholders_added.append(placeholder_text)
-                continue
+                # Check for nested multipart
+                if part.is_multipart():
+                    # Recursively process
+                    processed = self._process_multipart(
+                        part, filenames_to_strip, attachment_info, backup_paths, processed_at
+                    )
+                    new_payload.append(processed)
+                else:
+                    # Keep this part
+                    new_payload.append(part)
 
-            # Check for nested multipart
-            if part.is_multipart():
-                # Recursively process
-                processed = self._process_multipart(
-                    part, filenames_to_strip, backup_paths, attachments
-                )
-                new_payload.append(processed)
-            else:
-                # Keep this part
-                new_payload.append(part)
+            # Nothing stripped at this level: nested parts were modified in
+            # place, so the payload list doesn't need replacing
+            if not placeholders_added:
+                return msg
 
-        # If we removed attachments, add a single combined placeholder
-        if placeholders_added:
-            # Add placeholder as text/plain part
+            # We removed attachments, so add a single combined placeholder
             combined_placeholder = "\n\n---\n\n".join(placeholders_added)
             placeholder_part = self._create_placeholder_part(combined_placeholder)
 
             # For multipart/mixed, add placeholder at the end
-            # For multipart/alternative, we need to handle differently
-            subtype = MIMEHandler.get_subtype(msg)
-
-            if subtype == "alternative":
-                # Insert before last part (usually HTML)
-                if new_payload:
-                    new_payload.insert(-1, placeholder_part)
-                else:
-                    new_payload.append(placeholder_part)
+            # For multipart/alternative, insert before last part (usually HTML)
+            subtype = MIMEHandler.cached_subtype(msg)
+            if subtype == "alternative" and new_payload:
+                new_payload.insert(-1, placeholder_part)
             else:
                 new_payload.append(placeholder_part)
 
-        # Replace message payload
-        msg.set_payload(new_payload)
+            payload = msg.get_payload()
+            if isinstance(payload, list):
+                # Swap parts in place; headers are never touched
+                payload[:] = new_payload
+                return msg
 
-        # Restore the Content-Type header if it was lost or corrupted
-        # Python's email library can lose Content-Type during set_payload()
-        if original_content_type and not msg.get("Content-Type"):
-            msg["Content-Type"] = original_content_type
-        elif original_boundary and msg.get_boundary() != original_boundary:
-            # Boundary was corrupted, restore it
-            msg.set_boundary(original_boundary)
+            # Preserve the original Content-Type header before modifying payload
+            # set_payload() can clear or corrupt the Content-Type header
+            original_content_type = msg.get("Content-Type")
+            original_boundary = msg.get_boundary()
 
-        return msg
+            # Replace message payload
+            msg.set_payload(list(new_payload))
+
+            # Restore the Content-Type header if it was lost or corrupted
+            # Python's email library can lose Content-Type during set_payload()
+            if original_content_type and not msg.get("Content-Type"):
+                msg["Content-Type"] = original_content_type
+            elif original_boundary and msg.get_boundary() != original_boundary:
+                # Boundary was corrupted, restore it
+                msg.set_boundary(original_boundary)
+
+            return msg
+        finally:
+            new_payload.clear()
+            pool.append(new_payload)
 
     def _create_placeholder(
         self,
         filename: str,
         attachment_info: AttachmentInfo | None,
         backup_path: str,
+        processed_at: str,
     ) -> str:
         """Create placeholder text for removed attachment.
 
@@ -289,6 +517,7 @@ Tool: gmail-clean-and-backup
             filename: Original filename.
             attachment_info: Full attachment info.
             backup_path: Path where attachment was saved.
+            processed_at: Formatted processing timestamp.
 
         Returns:
             Placeholder text.
@@ -300,28 +529,283 @@ Tool: gmail-clean-and-backup
             size_human = attachment_info.size_human
             content_type = attachment_info.content_type
 
-        return self.placeholder_template.format(
-            filename=filename,
-            size_human=size_human,
-            content_type=content_type,
-            backup_path=backup_path,
-            processed_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        return self._placeholder_fmt(
+            filename, size_human, content_type, backup_path, processed_at
         )
 
-    def _create_placeholder_part(self, text: str) -> EmailMessage:
+    def _create_placeholder_part(self, text: str) -> MIMEPart:
         """Create a text/plain part for placeholder.
 
+        Headers are set directly instead of going through set_content(),
+        which would re-run charset and transfer-encoding detection.
+
         Args:
             text: Placeholder text.
 
         Returns:
-            EmailMessage part.
+            MIMEPart with the placeholder as its body.
         """
-        part = EmailMessage(policy=policy.default)
-        part.set_content(text, subtype="plain", charset="utf-8")
+        part = MIMEPart(policy=policy.default)
+        part["Content-Type"] = 'text/plain; charset="utf-8"'
+        if text.isascii():
+            part["Content-Transfer-Encoding"] = "7bit"
+            part.set_payload(text)
+        else:
+            # Stored the way the parser keeps 8bit bodies, so the
+            # generator writes the UTF-8 bytes back out unchanged
+            part["Content-Transfer-Encoding"] = "8bit"
+            part.set_payload(text.encode("utf-8").decode("ascii", errors="surrogateescape"))
         return part
 
 
+    def _fast_strip(
+        self,
+        raw_email: bytes,
+        attachments: list[AttachmentInfo],
+        saved_attachments: list[SavedAttachment],
+    ) -> bytes | None:
+        """Byte-level attachment stripping used by fast_reconstruct().
+
+        Args:
+            raw_email: Original raw email bytes.
+            attachments: Attachments to strip.
+            saved_attachments: Saved attachment records.
+
+        Returns:
+            Reconstructed email bytes, or None if the message needs the
+            full parse path.
+        """
+        header_end = _HEADER_END.search(raw_email)
+        if header_end is None:
+            return None
+
+        headers = self._header_parser.parsebytes(raw_email[: header_end.end()])
+        boundary = headers.get_boundary()
+        if headers.get_content_maintype() != "multipart" or not boundary:
+            return None
+
+        filenames, attachment_info, backup_paths = self._lookups(
+            attachments, saved_attachments
+        )
+        self._boundary_re_cache.clear()
+        state = _FastStripState(
+            view=memoryview(raw_email),
+            filenames=filenames,
+            attachment_info=attachment_info,
+            backup_paths=backup_paths,
+            processed_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+        out: list[bytes | memoryview] = [state.view[: header_end.end()]]
+        rewritten = self._fast_rewrite_multipart(
+            raw_email,
+            header_end.end(),
+            len(raw_email),
+            boundary.encode("ascii", errors="replace"),
+            headers.get_content_subtype(),
+            state,
+            out,
+            depth=1,
+        )
+        # Nothing matched: let the full parser decide what to do
+        if not rewritten or not state.stripped:
+            return None
+
+        return b"".join(out)
+
+    def _fast_rewrite_multipart(
+        self,
+        data: bytes,
+        start: int,
+        end: int,
+        boundary: bytes,
+        subtype: str,
+        state: "_FastStripState",
+        out: list[bytes | memoryview],
+        depth: int,
+    ) -> bool:
+        """Rewrite one multipart body, recursing into nested multiparts.
+
+        Output chunks are appended to ``out`` as slices of the original
+        message wherever a part is kept unchanged.
+
+        Args:
+            data: Complete raw email bytes.
+            start: Offset where this multipart body starts.
+            end: Offset where this multipart body ends.
+            boundary: Boundary parameter of this multipart.
+            subtype: MIME subtype (e.g., 'mixed', 'alternative').
+            state: Lookup tables and results shared across the walk.
+            out: Output chunk list.
+            depth: Current nesting depth.
+
+        Returns:
+            False if the structure is unsupported.
+        """
+        if depth > MIMETreeWalker.MAX_DEPTH:
+            return False
+
+        delimiters = self._find_delimiters(data, start, end, boundary)
+        if len(delimiters) < 2 or not delimiters[-1][2]:
+            return False
+        if any(is_close for _, _, is_close in delimiters[:-1]):
+            return False
+
+        view = state.view
+        first_start, first_end, _ = delimiters[0]
+        eol = b"\r\n" if data[first_end - 2 : first_end] == b"\r\n" else b"\n"
+        open_line = view[first_start:first_end]
+
+        # Each kept part is a list of output chunks
+        parts: list[list[bytes | memoryview]] = []
+        placeholders: list[str] = []
+
+        for (_, part_start, _), (next_start, _, _) in pairwise(delimiters):
+            # The line break before a delimiter belongs to the delimiter
+            part_end = next_start
+            if data[part_end - 2 : part_end] == b"\r\n":
+                part_end -= 2
+            elif data[part_end - 1 : part_end] == b"\n":
+                part_end -= 1
+
+            header_end = _HEADER_END.search(data, part_start, part_end)
+            if header_end is None or data[part_start : part_start + 1] in (b"\r", b"\n"):
+                # No header block - implicit text/plain part
+                parts.append([view[part_start:part_end]])
+                continue
+
+            part_headers = self._header_parser.parsebytes(data[part_start : header_end.end()])
+            maintype = part_headers.get_content_maintype()
+            if maintype == "message":
+                return False
+
+            filename = MIMEHandler.get_part_filename(part_headers)
+            if filename and filename in state.filenames:
+                if self.preserve_inline and MIMEHandler.has_content_id(part_headers):
+                    parts.append([view[part_start:part_end]])
+                    continue
+                placeholders.append(
+                    self._create_placeholder(
+                        filename,
+                        state.attachment_info.get(filename),
+                        state.backup_paths.get(filename, ""),
+                        state.processed_at,
+                    )
+                )
+                state.stripped += 1
+                continue
+
+            if maintype == "multipart":
+                nested_boundary = part_headers.get_boundary()
+                if not nested_boundary:
+                    return False
+                nested: list[bytes | memoryview] = [view[part_start : header_end.end()]]
+                if not self._fast_rewrite_multipart(
+                    data,
+                    header_end.end(),
+                    part_end,
+                    nested_boundary.encode("ascii", errors="replace"),
+                    part_headers.get_content_subtype(),
+                    state,
+                    nested,
+                    depth + 1,
+                ):
+                    return False
+                parts.append(nested)
+                continue
+
+            parts.append([view[part_start:part_end]])
+
+        if placeholders:
+            placeholder_part: list[bytes | memoryview] = [
+                self._placeholder_part_bytes("\n\n---\n\n".join(placeholders), eol)
+            ]
+            if subtype == "alternative" and parts:
+                parts.insert(-1, placeholder_part)
+            else:
+                parts.append(placeholder_part)
+
+        out.append(view[start:first_start])
+        for chunks in parts:
+            out.append(open_line)
+            out.extend(chunks)
+            out.append(eol)
+        out.append(view[delimiters[-1][0] : end])
+        return True
+
+    def _find_delimiters(
+        self, data: bytes, start: int, end: int, boundary: bytes
+    ) -> list[tuple[int, int, bool]]:
+        """Locate boundary delimiter lines within a multipart body.
+
+        Args:
+            data: Complete raw email bytes.
+            start: Offset where the multipart body starts (after a newline).
+            end: Offset where the multipart body ends.
+            boundary: Boundary parameter.
+
+        Returns:
+            List of (line_start, line_end, is_close) tuples, where line_end
+            is the offset just past the line break. Scanning stops at the
+            close delimiter.
+        """
+        pattern = self._boundary_re_cache.get(boundary)
+        if pattern is None:
+            # Delimiter line: "--boundary" or "--boundary--" plus optional padding
+            pattern = re.compile(rb"(?m)^--" + re.escape(boundary) + rb"(--)?[ \t]*\r?$")
+            self._boundary_re_cache[boundary] = pattern
+
+        delimiters: list[tuple[int, int, bool]] = []
+        for match in pattern.finditer(data, start, end):
+            line_end = match.end()
+            if data[line_end : line_end + 1] == b"\n":
+                line_end += 1
+            is_close = match.group(1) is not None
+            delimiters.append((match.start(), line_end, is_close))
+            if is_close:
+                break
+
+        return delimiters
+
+    def _placeholder_part_bytes(self, text: str, eol: bytes) -> bytes:
+        """Serialize a text/plain placeholder part.
+
+        Args:
+            text: Placeholder text.
+            eol: Line ending used by the surrounding message.
+
+        Returns:
+            Part bytes (headers and body) without the trailing line break.
+        """
+        encoded = text.encode("utf-8")
+        cte = b"7bit" if encoded.isascii() else b"8bit"
+        return self._placeholder_headers_bytes[eol, cte] + eol.join(encoded.splitlines())
+
+
+@dataclass
+class TreeSummary:
+    """Parallel per-part arrays from a single MIME tree walk.
+
+    Index i of parts, depths and content_types describes the same part,
+    in depth-first order; text_indices lists the leaf text parts.
+    """
+
+    parts: list[EmailMessage] = field(default_factory=list)
+    depths: list[int] = field(default_factory=list)
+    content_types: list[str] = field(default_factory=list)
+    text_indices: list[int] = field(default_factory=list)
+
+    @property
+    def max_depth(self) -> int:
+        """Maximum nesting depth (a single part is depth 1)."""
+        return max(self.depths, default=0)
+
+    @property
+    def text_parts(self) -> list[EmailMessage]:
+        """Leaf text/plain and text/html parts."""
+        return [self.parts[i] for i in self.text_indices]
+
+
 class MIMETreeWalker:
     """Recursively process MIME tree structure."""
 
@@ -352,10 +836,6 @@ class MIMETreeWalker:
             result = modifier(msg, depth)
             return result if result is not None else msg
 
-        # Preserve Content-Type header before modifying payload
-        original_content_type = msg.get("Content-Type")
-        original_boundary = msg.get_boundary()
-
         # Process each part
         new_parts = []
         for part in msg.iter_parts():
@@ -363,9 +843,21 @@ class MIMETreeWalker:
             if modified_part is not None:
                 new_parts.append(modified_part)
 
+        if not new_parts:
+            return msg
+
+        payload = msg.get_payload()
+        if isinstance(payload, list):
+            # Swap parts in place; headers are never touched
+            payload[:] = new_parts
+            return msg
+
+        # Preserve Content-Type header before modifying payload
+        original_content_type = msg.get("Content-Type")
+        original_boundary = msg.get_boundary()
+
         # Update message with modified parts
-        if new_parts:
-            msg.set_payload(new_parts)
+        msg.set_payload(new_parts)
 
         # Restore Content-Type header if lost
         if original_content_type and not msg.get("Content-Type"):
@@ -375,6 +867,37 @@ class MIMETreeWalker:
 
         return msg
 
+    @staticmethod
+    def summarize(msg: EmailMessage) -> TreeSummary:
+        """Walk the MIME tree once, recording every part.
+
+        Args:
+            msg: Email message.
+
+        Returns:
+            TreeSummary with parts in depth-first order.
+        """
+        summary = TreeSummary()
+        parts = summary.parts
+        depths = summary.depths
+        content_types = summary.content_types
+        text_indices = summary.text_indices
+
+        stack: list[tuple[EmailMessage, int]] = [(msg, 1)]
+        while stack:
+            part, depth = stack.pop()
+            index = len(parts)
+            parts.append(part)
+            depths.append(depth)
+            content_types.append(part.get_content_type())
+
+            if part.is_multipart():
+                stack.extend((child, depth + 1) for child in reversed(list(part.iter_parts())))
+            elif MIMEHandler.is_text_part(part):
+                text_indices.append(index)
+
+        return summary
+
     @staticmethod
     def get_depth(msg: EmailMessage) -> int:
         """Get maximum depth of MIME tree.
@@ -385,15 +908,7 @@ class MIMETreeWalker:
         Returns:
             Maximum nesting depth.
         """
-        if not msg.is_multipart():
-            return 1
-
-        max_child_depth = 0
-        for part in msg.iter_parts():
-            child_depth = MIMETreeWalker.get_depth(part)
-            max_child_depth = max(max_child_depth, child_depth)
-
-        return 1 + max_child_depth
+        return MIMETreeWalker.summarize(msg).max_depth
 
     @staticmethod
     def count_parts(msg: EmailMessage) -> int:
@@ -405,14 +920,7 @@ class MIMETreeWalker:
         Returns:
             Total part count.
         """
-        if not msg.is_multipart():
-            return 1
-
-        count = 1
-        for part in msg.iter_parts():
-            count += MIMETreeWalker.count_parts(part)
-
-        return count
+        return len(MIMETreeWalker.summarize(msg).parts)
 
     @staticmethod
     def find_text_parts(msg: EmailMessage) -> list[EmailMessage]:
@@ -424,17 +932,7 @@ class MIMETreeWalker:
         Returns:
             List of text parts.
         """
-        text_parts = []
-
-        if not msg.is_multipart():
-            if MIMEHandler.is_text_part(msg):
-                text_parts.append(msg)
-            return text_parts
-
-        for part in msg.iter_parts():
-            text_parts.extend(MIMETreeWalker.find_text_parts(part))
-
-        return text_parts
+        return MIMETreeWalker.summarize(msg).text_parts
 
 
 class SimpleReconstructor:
@@ -490,15 +988,80 @@ class SimpleReconstructor:
     def _append_to_text_parts(self, msg: EmailMessage, notice: str) -> None:
         """Append notice to text parts of message.
 
+        Where the part's transfer encoding allows it, the notice is
+        appended to the still-encoded payload so the body is never
+        decoded and re-encoded. Other parts use the decode path.
+
         Args:
             msg: Email message.
             notice: Text to append.
         """
-        if not msg.is_multipart():
-            if msg.get_content_type() == "text/plain":
-                content = EncodingHandler.safe_decode_payload(msg)
-                msg.set_content(content + notice, subtype="plain", charset="utf-8")
-            return
+        raw_notices = self._encode_notice(notice)
+        raw_charsets = _UTF8_CHARSETS
+        if notice.isascii():
+            raw_charsets = raw_charsets | _ASCII_CHARSETS
+
+        stack: list[MIMEPart] = [msg]
+        while stack:
+            part = stack.pop()
+            if part.is_multipart():
+                stack.extend(reversed(list(part.iter_parts())))
+                continue
 
-        for part in msg.iter_parts():
-            self._append_to_text_parts(part, notice)
+            if part.get_content_type() != "text/plain":
+                continue
+
+            cte = str(part.get("Content-Transfer-Encoding", "7bit")).strip().lower()
+            charset = (part.get_content_charset() or "us-ascii").lower()
+            raw_notice = raw_notices.get(cte) if charset in raw_charsets else None
+
+            if raw_notice is not None:
+                raw_payload = self._raw_payload(part, cte)
+                if raw_payload is not None:
+                    # Stored as surrogate-escaped str, as the parser does
+                    part.set_payload(
+                        (raw_payload + raw_notice).decode("ascii", errors="surrogateescape")
+                    )
+                    continue
+
+            content = EncodingHandler.safe_decode_payload(part)
+            part.set_content(content + notice, subtype="plain", charset="utf-8")
+
+    @staticmethod
+    def _encode_notice(notice: str) -> dict[str, bytes | None]:
+        """Pre-encode the notice for each transfer encoding it can be appended to.
+
+        Args:
+            notice: Text to append.
+
+        Returns:
+            Map of Content-Transfer-Encoding to encoded notice, or None
+            where the notice can't be represented.
+        """
+        encoded = notice.encode("utf-8")
+        return {
+            "7bit": encoded if encoded.isascii() else None,
+            "8bit": encoded,
+            "quoted-printable": quopri.encodestring(encoded),
+        }
+
+    @staticmethod
+    def _raw_payload(part: MIMEPart, cte: str) -> bytes | None:
+        """Get a part's payload exactly as it appears on the wire.
+
+        Args:
+            part: Leaf text part.
+            cte: Lowercased Content-Transfer-Encoding.
+
+        Returns:
+            Still-encoded payload bytes, or None if unavailable.
+        """
+        if cte in ("7bit", "8bit"):
+            # No transfer decoding is applied for these encodings
+            raw = part.get_payload(decode=True)
+            return raw if isinstance(raw, bytes) else None
+
+        payload = part.get_payload(decode=False)
+        if not isinstance(payload, str) or not payload.isascii():
+            return None
+        return payload.encode("ascii")
@@ -1,24 +1,56 @@
 """Safe email replacement with two-phase commit."""
 
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 from src.models.email import (
+    AttachmentInfo,
     EmailScanResult,
     ExtractionResult,
     GmailMetadata,
     ReplaceResult,
     SavedAttachment,
+    is_user_label,
 )
 from src.processor.reconstructor import EmailReconstructor
 from src.processor.transaction import TransactionManager
 from src.processor.validator import ReconstructionValidator
-from src.utils.hashing import compute_sha256
 from src.utils.logging import logger
 
 if TYPE_CHECKING:
     from src.imap.client import GmailIMAPClient
 
+# Per-worker reconstructor, set by _init_reconstruct_worker
+_worker_reconstructor: EmailReconstructor | None = None
+
+
+def _init_reconstruct_worker() -> None:
+    """Create the reconstructor used by a pool worker process."""
+    global _worker_reconstructor
+    _worker_reconstructor = EmailReconstructor()
+
+
+def _reconstruct_one(
+    job: tuple[bytes, list[AttachmentInfo], list[SavedAttachment]],
+) -> tuple[bytes | None, str | None]:
+    """Reconstruct a single email in a pool worker.
+
+    Args:
+        job: Tuple of (raw_email, attachments_to_strip, saved_attachments).
+
+    Returns:
+        Tuple of (stripped_email, error). Exactly one is None.
+    """
+    reconstructor = _worker_reconstructor or EmailReconstructor()
+    raw_email, attachments, saved = job
+    try:
+        return reconstructor.fast_reconstruct(raw_email, attachments, saved), None
+    except Exception as e:
+        return None, str(e)
+
 
 class EmailReplacer:
     """Safely replaces emails on Gmail with stripped versions.
@@ -30,19 +62,27 @@ class EmailReplacer:
     4. Delete original (move to Trash)
     """
 
+    # Emails saving less than this get lightweight checks only
+    LIGHT_CHECK_THRESHOLD = 64 * 1024
+
     def __init__(
         self,
         client: "GmailIMAPClient",
         transaction_manager: TransactionManager,
+        light_check_threshold: int = LIGHT_CHECK_THRESHOLD,
     ) -> None:
         """Initialize replacer.
 
         Args:
             client: Connected IMAP client.
             transaction_manager: Transaction manager for logging.
+            light_check_threshold: Below this many bytes of attachment
+                savings, full validation and the upload re-fetch are
+                skipped. 0 always runs the full checks.
         """
         self.client = client
         self.txn_manager = transaction_manager
+        self.light_check_threshold = light_check_threshold
         self.reconstructor = EmailReconstructor()
         self.validator = ReconstructionValidator()
 
@@ -81,70 +121,234 @@ class EmailReplacer:
                     original_uid, original_size, extraction_result, gmail_metadata
                 )
 
-            # Phase 2: Reconstruct email
-            stripped_email = self.reconstructor.reconstruct(
+            # Phase 2: Reconstruct email (byte-level rewrite, full parse fallback)
+            stripped_email = self.reconstructor.fast_reconstruct(
                 raw_email,
                 scan_result.strippable_attachments,
                 extraction_result.attachments_saved,
             )
-            self.txn_manager.log_step(txn_id, "reconstructed")
+            return self._complete_replacement(
+                txn_id,
+                original_uid,
+                raw_email,
+                stripped_email,
+                gmail_metadata,
+                scan_result.strippable_size,
+            )
+
+        except Exception as e:
+            return self._fail(txn_id, original_uid, e)
+
+    def replace_email_batch(
+        self,
+        items: list[tuple[int, EmailScanResult, ExtractionResult]],
+        batch_size: int = 1,
+        max_workers: int | None = None,
+    ) -> list[ReplaceResult]:
+        """Replace several emails, reconstructing them in a process pool.
+
+        Emails are fetched and reconstructed batch_size at a time; the
+        CPU-bound reconstruction of each batch is spread over worker
+        processes. All IMAP work (fetch, upload, verify, labels, delete)
+        stays on the calling thread since it shares one connection.
+
+        Args:
+            items: Tuples of (original_uid, scan_result, extraction_result).
+            batch_size: Emails reconstructed concurrently. 1 disables the
+                process pool and replaces emails one by one.
+            max_workers: Worker processes (defaults to CPU count).
+
+        Returns:
+            ReplaceResult for each item, in input order.
+        """
+        if batch_size <= 1 or len(items) <= 1:
+            return [
+                self.replace_email(uid, scan_result, extraction_result)
+                for uid, scan_result, extraction_result in items
+            ]
+
+        results: list[ReplaceResult] = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            initializer=_init_reconstruct_worker,
+        ) as executor:
+            for start in range(0, len(items), batch_size):
+                results.extend(
+                    self._replace_chunk(items[start : start + batch_size], executor)
+                )
+
+        return results
 
-            # Phase 3: Validate reconstruction
+    def _replace_chunk(
+        self,
+        items: list[tuple[int, EmailScanResult, ExtractionResult]],
+        executor: ProcessPoolExecutor,
+    ) -> list[ReplaceResult]:
+        """Fetch, reconstruct in parallel, then upload one chunk of emails.
+
+        Args:
+            items: Tuples of (original_uid, scan_result, extraction_result).
+            executor: Pool used for reconstruction.
+
+        Returns:
+            ReplaceResult for each item, in input order.
+        """
+        results: dict[int, ReplaceResult] = {}
+        pending: list[tuple[int, int, str, bytes, EmailScanResult]] = []
+        jobs: list[tuple[bytes, list[AttachmentInfo], list[SavedAttachment]]] = []
+
+        # Phase 1: Fetch originals on this thread
+        for index, (original_uid, scan_result, extraction_result) in enumerate(items):
+            email_id = str(scan_result.gmail_metadata.gmail_message_id)
+            txn_id = self.txn_manager.begin_transaction(email_id)
+            try:
+                raw_email = self.client.fetch_raw_email(original_uid)
+            except Exception as e:
+                results[index] = self._fail(txn_id, original_uid, e)
+                continue
+
+            pending.append((index, original_uid, txn_id, raw_email, scan_result))
+            jobs.append(
+                (
+                    raw_email,
+                    scan_result.strippable_attachments,
+                    extraction_result.attachments_saved,
+                )
+            )
+
+        # Phase 2: Reconstruct in worker processes
+        futures = [executor.submit(_reconstruct_one, job) for job in jobs]
+
+        # Phases 3-7 run serially on the shared connection
+        for (index, original_uid, txn_id, raw_email, scan_result), future in zip(
+            pending, futures, strict=True
+        ):
+            try:
+                # Raises here if the worker died or the job couldn't be pickled,
+                # so the failure is recorded against this email's transaction
+                stripped_email, error = future.result()
+                if stripped_email is None:
+                    raise ValueError(f"Reconstruction failed: {error}")
+                results[index] = self._complete_replacement(
+                    txn_id,
+                    original_uid,
+                    raw_email,
+                    stripped_email,
+                    scan_result.gmail_metadata,
+                    scan_result.strippable_size,
+                )
+            except Exception as e:
+                results[index] = self._fail(txn_id, original_uid, e)
+
+        return [results[index] for index in range(len(items))]
+
+    def _fail(self, txn_id: str, original_uid: int, error: Exception) -> ReplaceResult:
+        """Mark a transaction failed and build the failure result.
+
+        Args:
+            txn_id: Open transaction ID.
+            original_uid: UID of original message.
+            error: Exception that aborted the replacement.
+
+        Returns:
+            Failed ReplaceResult.
+        """
+        self.txn_manager.fail(txn_id, str(error))
+        logger.error(f"Replace failed for UID {original_uid}: {error}")
+
+        return ReplaceResult(
+            success=False,
+            original_uid=original_uid,
+            error=str(error),
+        )
+
+    def _complete_replacement(
+        self,
+        txn_id: str,
+        original_uid: int,
+        raw_email: bytes,
+        stripped_email: bytes,
+        gmail_metadata: GmailMetadata,
+        savings: int,
+    ) -> ReplaceResult:
+        """Run the validate/upload/verify/label/delete phases.
+
+        Exceptions propagate so the caller can fail the transaction.
+
+        Args:
+            txn_id: Open transaction ID.
+            original_uid: UID of original message.
+            raw_email: Original email bytes.
+            stripped_email: Reconstructed email bytes.
+            gmail_metadata: Gmail metadata of the original.
+            savings: Bytes of attachments being stripped.
+
+        Returns:
+            ReplaceResult for the completed replacement.
+        """
+        original_size = len(raw_email)
+        self.txn_manager.log_step(txn_id, "reconstructed")
+
+        # Small savings don't justify the full compare and re-fetch
+        light_checks = savings < self.light_check_threshold
+        if light_checks:
+            logger.info(
+                f"UID {original_uid}: {savings} bytes saved, using lightweight checks"
+            )
+
+        # Phase 3: Validate reconstruction
+        if light_checks:
+            if not self.validator.quick_validate(stripped_email):
+                raise ValueError("Validation failed: reconstructed email is malformed")
+        else:
             validation = self.validator.validate(raw_email, stripped_email)
             if not validation.is_valid:
                 raise ValueError(
                     f"Validation failed: {validation.header_issues + validation.mime_issues}"
                 )
 
-            # Phase 4: Upload stripped version
-            new_uid = self._upload_email(stripped_email, original_uid)
-            if not new_uid:
-                raise ValueError("Upload failed - no UID returned")
+        # Phase 4: Upload stripped version
+        new_uid = self._upload_email(stripped_email, original_uid)
+        if not new_uid:
+            raise ValueError("Upload failed - no UID returned")
 
-            self.txn_manager.log_step(
-                txn_id, "uploaded", {"new_uid": new_uid, "size": len(stripped_email)}
-            )
+        self.txn_manager.log_step(
+            txn_id, "uploaded", {"new_uid": new_uid, "size": len(stripped_email)}
+        )
 
-            # Phase 5: Verify upload
+        # Phase 5: Verify upload (APPENDUID already confirmed it landed)
+        if light_checks:
+            self.txn_manager.log_step(txn_id, "verified", {"skipped": True})
+        else:
             if not self._verify_upload(new_uid, stripped_email):
                 raise ValueError("Upload verification failed")
 
             self.txn_manager.log_step(txn_id, "verified")
 
-            # Phase 6: Apply labels
-            labels_applied = self._apply_labels(new_uid, gmail_metadata.labels)
-            self.txn_manager.log_step(txn_id, "labeled", {"labels": labels_applied})
-
-            # Phase 7: Delete original (move to Trash)
-            if not self.client.move_to_trash(original_uid):
-                logger.warning(f"Failed to move original UID {original_uid} to trash")
+        # Phase 6: Apply labels
+        labels_applied = self._apply_labels(new_uid, gmail_metadata.labels)
+        self.txn_manager.log_step(txn_id, "labeled", {"labels": labels_applied})
 
-            self.txn_manager.log_step(
-                txn_id, "deleted", {"original_uid": original_uid}
-            )
+        # Phase 7: Delete original (move to Trash)
+        if not self.client.move_to_trash(original_uid):
+            logger.warning(f"Failed to move original UID {original_uid} to trash")
 
-            # Commit transaction
-            self.txn_manager.commit(txn_id)
+        self.txn_manager.log_step(
+            txn_id, "deleted", {"original_uid": original_uid}
+        )
 
-            return ReplaceResult(
-                success=True,
-                original_uid=original_uid,
-                new_uid=new_uid,
-                original_size=original_size,
-                new_size=len(stripped_email),
-                labels_applied=labels_applied,
-                phase_completed="completed",
-            )
+        # Commit transaction
+        self.txn_manager.commit(txn_id)
 
-        except Exception as e:
-            self.txn_manager.fail(txn_id, str(e))
-            logger.error(f"Replace failed for UID {original_uid}: {e}")
-
-            return ReplaceResult(
-                success=False,
-                original_uid=original_uid,
-                error=str(e),
-            )
+        return ReplaceResult(
+            success=True,
+            original_uid=original_uid,
+            new_uid=new_uid,
+            original_size=original_size,
+            new_size=len(stripped_email),
+            labels_applied=labels_applied,
+            phase_completed="completed",
+        )
 
     def _dry_run_result(
         self,
@@ -200,12 +404,16 @@ class EmailReplacer:
             date_time=None,  # Use current date
         )
 
-    def _verify_upload(self, new_uid: int, expected_data: bytes) -> bool:
+    def _verify_upload(
+        self, new_uid: int, expected_data: bytes, strict: bool = False
+    ) -> bool:
         """Verify uploaded email matches expected content.
 
         Args:
             new_uid: UID of uploaded message.
             expected_data: Expected email content.
+            strict: If True, require a byte-identical match instead
+                of the size heuristic.
 
         Returns:
             True if verification passes.
@@ -214,20 +422,20 @@ class EmailReplacer:
             # Fetch uploaded message
             uploaded_data = self.client.fetch_raw_email(new_uid)
 
-            # Compare hashes
-            # Note: Headers may be modified by server, so compare body content
-            expected_hash = compute_sha256(expected_data)
-            uploaded_hash = compute_sha256(uploaded_data)
+            if strict:
+                # Both copies are in memory, so compare them directly; a
+                # length mismatch short-circuits before any byte is read
+                return uploaded_data == expected_data
 
-            # For now, accept if sizes are similar (server may modify headers)
-            size_diff = abs(len(uploaded_data) - len(expected_data))
+            # Accept if sizes are similar (server may modify headers)
+            expected_size = len(expected_data)
+            size_diff = abs(len(uploaded_data) - expected_size)
             if size_diff < 1000:  # Allow up to 1KB difference for header changes
                 return True
 
-            logger.warning(
-                f"Upload verification: size difference {size_diff} bytes"
-            )
-            return size_diff < len(expected_data) * 0.1  # Allow 10% difference
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Upload verification: size difference %d bytes", size_diff)
+            return size_diff * 10 < expected_size  # Allow 10% difference
 
         except Exception as e:
             logger.error(f"Upload verification failed: {e}")
@@ -246,11 +454,7 @@ class EmailReplacer:
         applied = []
 
         # Filter out system labels that are auto-applied
-        user_labels = [
-            label
-            for label in labels
-            if not label.startswith(("\\", "INBOX", "SENT", "DRAFT", "SPAM", "TRASH"))
-        ]
+        user_labels = [label for label in labels if is_user_label(label)]
 
         if user_labels:
             try:
@@ -327,13 +531,13 @@ class SafeReplacer:
             ReplaceResult.
         """
         # Verify all backups exist and are valid
-        for saved in extraction_result.attachments_saved:
-            if not backup_manager.verify_backup(saved):
-                return ReplaceResult(
-                    success=False,
-                    original_uid=original_uid,
-                    error=f"Backup verification failed for: {saved.original_filename}",
-                )
+        failed = backup_manager.verify_backups(extraction_result.attachments_saved)
+        if failed:
+            return ReplaceResult(
+                success=False,
+                original_uid=original_uid,
+                error=f"Backup verification failed for: {failed[0].original_filename}",
+            )
 
         # Proceed with replacement
         return self.replacer.replace_email(
@@ -1,14 +1,55 @@
 """Revert processed emails by restoring originals from Trash."""
 
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email import policy
+from email.parser import BytesHeaderParser
 from typing import TYPE_CHECKING
 
-from src.models.email import ManifestEntry
+from src.imap.pool import GmailIMAPClientPool
+from src.models.email import ManifestEntry, is_user_label
 from src.utils.logging import logger
 
 if TYPE_CHECKING:
     from src.imap.client import GmailIMAPClient
     from src.utils.manifest import ManifestManager
 
+# Message-IDs combined into one Trash SEARCH
+TRASH_SEARCH_CHUNK = 100
+
+# Emails reverted together on one connection by revert_many
+REVERT_BATCH_SIZE = 50
+
+# Characters that would end or alter an rfc822msgid: term in X-GM-RAW
+_GMAIL_RAW_UNSAFE = re.compile(r'[\s"\\(){}]')
+
+
+def _message_id_criteria(message_ids: list[str], gmail_raw: bool = False) -> str:
+    """Build a SEARCH matching any of the given Message-IDs.
+
+    With gmail_raw, the IDs go into one X-GM-RAW rfc822msgid: query, which
+    Gmail answers from its search index instead of scanning headers. IDs
+    that can't be written as a Gmail search term fall back to HEADER keys,
+    where IMAP OR takes two keys, so N IDs become a chain of N-1 ORs.
+
+    Args:
+        message_ids: Message-ID header values (at least one).
+        gmail_raw: Whether the server supports Gmail's X-GM-RAW search.
+
+    Returns:
+        IMAP search criteria string.
+    """
+    if gmail_raw and not any(_GMAIL_RAW_UNSAFE.search(m) for m in message_ids):
+        terms = " OR ".join(f"rfc822msgid:{m.strip().strip('<>')}" for m in message_ids)
+        return f'X-GM-RAW "{terms}"'
+
+    keys = []
+    for message_id in message_ids:
+        quoted = message_id.replace("\\", "\\\\").replace('"', '\\"')
+        keys.append(f'HEADER Message-ID "{quoted}"')
+    return "OR " * (len(keys) - 1) + " ".join(keys)
+
 
 class RevertError(Exception):
     """Raised when revert operation fails."""
@@ -49,27 +90,34 @@ class RevertResult:
 class EmailReverter:
     """Reverts processed emails by restoring originals from Gmail Trash.
 
-    The revert process:
-    1. Search Trash for original email by Message-ID
-    2. Copy original back to All Mail
+    The revert process, run for a whole batch of emails at a time:
+    1. Search Trash for the originals by Message-ID
+    2. Copy the originals back to All Mail
     3. Apply original labels
-    4. Delete the stripped version
+    4. Delete the stripped versions
     5. Update manifest status to 'reverted'
+
+    Each step is one round of IMAP commands over UID sets for the batch,
+    with Trash and All Mail each selected once.
     """
 
     def __init__(
         self,
-        client: "GmailIMAPClient",
+        client: "GmailIMAPClient | GmailIMAPClientPool",
         manifest_manager: "ManifestManager",
     ) -> None:
         """Initialize reverter.
 
         Args:
-            client: Connected IMAP client.
+            client: Connection pool, or a single connected IMAP client.
             manifest_manager: Manifest manager for tracking.
         """
-        self.client = client
+        if isinstance(client, GmailIMAPClientPool):
+            self.pool = client
+        else:
+            self.pool = GmailIMAPClientPool.from_client(client)
         self.manifest = manifest_manager
+        self._trash_folder: str | None = self.pool.trash_folder
 
     def revert_email(self, entry: ManifestEntry, dry_run: bool = False) -> RevertResult:
         """Revert a single processed email.
@@ -81,68 +129,167 @@ class EmailReverter:
         Returns:
             RevertResult with operation outcome.
         """
-        email_id = entry.email_id
+        if dry_run and entry.can_revert:
+            return self._dry_run_revert(entry)
 
-        if not entry.can_revert:
-            return RevertResult(
-                success=False,
-                email_id=email_id,
-                error="Entry cannot be reverted (missing tracking info or already reverted)",
-            )
+        return self.revert_batch([entry])[0]
 
-        if dry_run:
-            return self._dry_run_revert(entry)
+    def revert_batch(self, entries: list[ManifestEntry]) -> list[RevertResult]:
+        """Revert several emails on one connection, step by step for all of them.
 
-        try:
-            # Step 1: Find original in Trash by Message-ID
-            original_uid = self._find_in_trash(entry.original_message_id)
-            if not original_uid:
-                return RevertResult(
+        Args:
+            entries: Manifest entries to revert.
+
+        Returns:
+            RevertResult for each entry, in input order.
+        """
+        results: dict[int, RevertResult] = {}
+        pending: list[tuple[int, ManifestEntry]] = []
+
+        for index, entry in enumerate(entries):
+            if entry.can_revert:
+                pending.append((index, entry))
+            else:
+                results[index] = RevertResult(
+                    success=False,
+                    email_id=entry.email_id,
+                    error="Entry cannot be reverted (missing tracking info or already reverted)",
+                )
+
+        if pending:
+            try:
+                with self.pool.acquire() as client:
+                    self._revert_batch_with_client(client, pending, results)
+            except Exception as e:
+                for index, entry in pending:
+                    if index not in results:
+                        logger.error(f"Revert failed for {entry.email_id}: {e}")
+                        results[index] = RevertResult(
+                            success=False,
+                            email_id=entry.email_id,
+                            error=str(e),
+                        )
+
+        return [results[index] for index in range(len(entries))]
+
+    def _revert_batch_with_client(
+        self,
+        client: "GmailIMAPClient",
+        pending: list[tuple[int, ManifestEntry]],
+        results: dict[int, RevertResult],
+    ) -> None:
+        """Run the revert steps for a batch on one connection.
+
+        Results are written to results as soon as they are known, so an
+        exception part way through leaves finished entries reported.
+
+        Args:
+            client: Checked-out IMAP client.
+            pending: (index, entry) pairs of revertible entries.
+            results: Results by index, filled in place.
+        """
+        # Step 1: Find originals in Trash by Message-ID
+        trash_uids = self._find_many_in_trash(
+            client,
+            [entry.original_message_id for _, entry in pending if entry.original_message_id],
+        )
+        found: list[tuple[int, ManifestEntry, int]] = []
+        for index, entry in pending:
+            trash_uid = (
+                trash_uids.get(entry.original_message_id)
+                if entry.original_message_id is not None
+                else None
+            )
+            if trash_uid:
+                found.append((index, entry, trash_uid))
+            else:
+                results[index] = RevertResult(
                     success=False,
-                    email_id=email_id,
+                    email_id=entry.email_id,
                     error=f"Original email not found in Trash (Message-ID: {entry.original_message_id}). "
                     "It may have been permanently deleted.",
                 )
 
-            # Step 2: Copy original from Trash back to All Mail
-            restored_uid = self._restore_from_trash(original_uid)
-            if not restored_uid:
-                return RevertResult(
+        if not found:
+            return
+
+        # Step 2: Copy originals from Trash back to All Mail
+        restored_uids = self._restore_many_from_trash(client, [uid for _, _, uid in found])
+        restored: list[tuple[int, ManifestEntry, int]] = []
+        for index, entry, trash_uid in found:
+            restored_uid = restored_uids.get(trash_uid)
+            if restored_uid:
+                restored.append((index, entry, restored_uid))
+            else:
+                results[index] = RevertResult(
                     success=False,
-                    email_id=email_id,
+                    email_id=entry.email_id,
                     error="Failed to restore original email from Trash",
                 )
 
-            # Step 3: Apply original labels to restored email
-            labels_applied = self._apply_labels(restored_uid, entry.labels)
+        if not restored:
+            return
+
+        # Steps 3 and 4 don't depend on each other: apply original labels
+        # to restored emails and delete the stripped versions, overlapping
+        # the two on an idle pooled connection when there is one
+        labels_by_uid = {uid: entry.labels for _, entry, uid in restored}
+        stripped_uids = [entry.stripped_uid for _, entry, _ in restored if entry.stripped_uid]
+        with self.pool.try_acquire() as spare:
+            if spare is None or not stripped_uids:
+                labels_applied = self._apply_labels(client, labels_by_uid)
+                stripped_deleted = self._delete_stripped(client, stripped_uids)
+            else:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    deletion = executor.submit(self._delete_stripped, spare, stripped_uids)
+                    labels_applied = self._apply_labels(client, labels_by_uid)
+                    stripped_deleted = deletion.result()
+
+        if not stripped_deleted:
+            logger.warning(f"Could not delete stripped versions: UIDs {stripped_uids}")
+
+        # Step 5: Update manifest, one transaction for the whole batch
+        with self.manifest.batch():
+            for index, entry, restored_uid in restored:
+                self.manifest.mark_reverted(entry.email_id, restored_uid)
+                results[index] = RevertResult(
+                    success=True,
+                    email_id=entry.email_id,
+                    original_restored=True,
+                    stripped_deleted=bool(entry.stripped_uid) and stripped_deleted,
+                    labels_applied=labels_applied.get(restored_uid, []),
+                )
 
-            # Step 4: Delete the stripped version
-            stripped_deleted = False
-            if entry.stripped_uid:
-                stripped_deleted = self._delete_stripped(entry.stripped_uid)
-                if not stripped_deleted:
-                    logger.warning(
-                        f"Could not delete stripped version UID {entry.stripped_uid}"
-                    )
+    def revert_many(
+        self,
+        entries: list[ManifestEntry],
+        max_workers: int | None = None,
+        batch_size: int = REVERT_BATCH_SIZE,
+    ) -> Iterator[RevertResult]:
+        """Revert several emails concurrently on pooled connections.
 
-            # Step 5: Update manifest
-            self.manifest.mark_reverted(email_id, restored_uid)
+        Entries are split into batches of batch_size; each batch is
+        reverted with revert_batch() on its own pooled connection, so
+        concurrency is bounded by the pool size.
 
-            return RevertResult(
-                success=True,
-                email_id=email_id,
-                original_restored=True,
-                stripped_deleted=stripped_deleted,
-                labels_applied=labels_applied,
-            )
+        Args:
+            entries: Manifest entries to revert.
+            max_workers: Maximum concurrent batches (defaults to, and is
+                capped by, the pool's connection limit).
+            batch_size: Emails reverted together on one connection.
 
-        except Exception as e:
-            logger.error(f"Revert failed for {email_id}: {e}")
-            return RevertResult(
-                success=False,
-                email_id=email_id,
-                error=str(e),
-            )
+        Yields:
+            RevertResult for each entry, batch by batch in completion order.
+        """
+        workers = min(max_workers or self.pool.max_connections, self.pool.max_connections)
+        batch_size = max(1, batch_size)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [
+                executor.submit(self.revert_batch, entries[start : start + batch_size])
+                for start in range(0, len(entries), batch_size)
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
 
     def _dry_run_revert(self, entry: ManifestEntry) -> RevertResult:
         """Simulate revert without making changes.
@@ -154,7 +301,8 @@ class EmailReverter:
             Simulated RevertResult.
         """
         # Check if original exists in Trash
-        original_uid = self._find_in_trash(entry.original_message_id)
+        with self.pool.acquire() as client:
+            original_uid = self._find_in_trash(client, entry.original_message_id)
 
         if not original_uid:
             return RevertResult(
@@ -171,13 +319,31 @@ class EmailReverter:
             labels_applied=entry.labels,  # Would be applied
         )
 
-    def _get_trash_folder(self) -> str:
+    def _get_trash_folder(self, client: "GmailIMAPClient") -> str:
         """Get the Trash folder name (varies by locale).
 
+        Args:
+            client: Checked-out IMAP client.
+
         Returns:
             Trash folder name (e.g., '[Gmail]/Trash' or '[Gmail]/Bin').
         """
-        folders = self.client.list_folders()
+        # Folder names don't change during a session; LIST only once
+        if self._trash_folder is None:
+            self._trash_folder = self.pool.trash_folder or self._lookup_trash_folder(client)
+            self.pool.trash_folder = self._trash_folder
+        return self._trash_folder
+
+    def _lookup_trash_folder(self, client: "GmailIMAPClient") -> str:
+        """Find the Trash folder name with a LIST round trip.
+
+        Args:
+            client: Checked-out IMAP client.
+
+        Returns:
+            Trash folder name.
+        """
+        folders = client.list_folders()
         # Check for common Trash folder names
         for folder in folders:
             if folder in ("[Gmail]/Trash", "[Gmail]/Bin", "[Gmail]/Papierkorb"):
@@ -185,10 +351,11 @@ class EmailReverter:
         # Fallback to default
         return "[Gmail]/Trash"
 
-    def _find_in_trash(self, message_id: str | None) -> int | None:
+    def _find_in_trash(self, client: "GmailIMAPClient", message_id: str | None) -> int | None:
         """Find email in Trash by Message-ID header.
 
         Args:
+            client: Checked-out IMAP client.
             message_id: Message-ID header value.
 
         Returns:
@@ -198,15 +365,15 @@ class EmailReverter:
             return None
 
         # Select Trash folder (handle different locales)
-        trash_folder = self._get_trash_folder()
-        self.client.select_folder(trash_folder, readonly=True)
+        trash_folder = self._get_trash_folder(client)
+        client.select_folder_cached(trash_folder, readonly=True)
 
-        # Search by Message-ID using Gmail's IMAP search
-        # Escape any special characters in Message-ID
-        search_criteria = f'HEADER Message-ID "{message_id}"'
+        search_criteria = _message_id_criteria(
+            [message_id], client.has_capability(client.GMAIL_EXTENSION_CAPABILITY)
+        )
 
         try:
-            uids = self.client.search(search_criteria)
+            uids = client.search(search_criteria)
             if uids:
                 return uids[0]  # Return first match
         except Exception as e:
@@ -214,29 +381,93 @@ class EmailReverter:
 
         return None
 
-    def _restore_from_trash(self, trash_uid: int) -> int | None:
+    def _find_many_in_trash(
+        self, client: "GmailIMAPClient", message_ids: list[str]
+    ) -> dict[str, int | None]:
+        """Find several emails in Trash by Message-ID with batched requests.
+
+        Trash is selected once, then each chunk of Message-IDs costs one
+        OR-combined SEARCH and one FETCH of the matches' Message-ID
+        headers to map UIDs back to IDs.
+
+        Args:
+            client: Checked-out IMAP client.
+            message_ids: Message-ID header values.
+
+        Returns:
+            Dictionary mapping each Message-ID to its UID in Trash, or None
+            if not found.
+        """
+        found: dict[str, int | None] = dict.fromkeys(message_ids)
+        if not found:
+            return found
+
+        trash_folder = self._get_trash_folder(client)
+        client.select_folder_cached(trash_folder, readonly=True)
+
+        unique_ids = list(found)
+        gmail_raw = client.has_capability(client.GMAIL_EXTENSION_CAPABILITY)
+        header_parser = BytesHeaderParser(policy=policy.default)
+        for start in range(0, len(unique_ids), TRASH_SEARCH_CHUNK):
+            chunk = unique_ids[start : start + TRASH_SEARCH_CHUNK]
+            try:
+                uids = client.search(_message_id_criteria(chunk, gmail_raw))
+                if not uids:
+                    continue
+
+                fetched = client.fetch_many(
+                    uids, "(BODY.PEEK[HEADER.FIELDS (MESSAGE-ID)])"
+                )
+            except Exception as e:
+                logger.warning(f"Error searching Trash: {e}")
+                continue
+
+            # Lowest UID wins, matching _find_in_trash
+            for uid in sorted(fetched):
+                header = fetched[uid].get("BODY[HEADER.FIELDS (MESSAGE-ID)]")
+                if not header:
+                    continue
+                message_id = header_parser.parsebytes(header).get("Message-ID")
+                message_id = str(message_id).strip() if message_id else None
+                if message_id in found and found[message_id] is None:
+                    found[message_id] = uid
+
+        return found
+
+    def _restore_from_trash(self, client: "GmailIMAPClient", trash_uid: int) -> int | None:
         """Restore email from Trash to All Mail.
 
         Args:
+            client: Checked-out IMAP client.
             trash_uid: UID of email in Trash.
 
         Returns:
             UID of restored email in All Mail, or None if failed.
         """
-        # First, fetch the raw email from Trash
-        trash_folder = self._get_trash_folder()
-        self.client.select_folder(trash_folder, readonly=False)
-        raw_email = self.client.fetch_raw_email(trash_uid)
+        trash_folder = self._get_trash_folder(client)
+        client.select_folder_cached(trash_folder, readonly=False)
+
+        # Copy server-side when the new UID can be learned from COPYUID.
+        # Copying out of Trash untrashes the message in Gmail, so nothing
+        # is left in Trash to delete.
+        if client.has_capability("UIDPLUS"):
+            new_uid = client.uid_copy(trash_uid, "[Gmail]/All Mail")
+            if not new_uid:
+                logger.warning(f"COPY of Trash UID {trash_uid} returned no COPYUID")
+            return new_uid
+
+        # Otherwise download the email and upload it again
+        raw_email = client.fetch_raw_email(trash_uid)
 
         if not raw_email:
             return None
 
         # Get original flags
-        fetch_result = self.client.fetch(trash_uid, "(FLAGS)")
+        fetch_result = client.fetch(trash_uid, "(FLAGS)")
         flags = fetch_result.get("FLAGS", ["\\Seen"])
 
         # Append to All Mail
-        new_uid = self.client.append(
+        new_uid = client.append(
             folder="[Gmail]/All Mail",
             email_data=raw_email,
             flags=flags if isinstance(flags, list) else ["\\Seen"],
@@ -244,58 +475,102 @@ class EmailReverter:
 
         if new_uid:
             # Permanently delete from Trash
-            self.client.delete_message(trash_uid)
-            self.client.expunge()
+            client.delete_message(trash_uid)
+            client.expunge()
 
         return new_uid
 
-    def _apply_labels(self, uid: int, labels: list[str]) -> list[str]:
-        """Apply Gmail labels to restored email.
+    def _restore_many_from_trash(
+        self, client: "GmailIMAPClient", trash_uids: list[int]
+    ) -> dict[int, int]:
+        """Restore several emails from Trash to All Mail.
+
+        With UIDPLUS this is a single UID COPY over the whole UID set;
+        otherwise each email is restored with _restore_from_trash().
 
         Args:
-            uid: Message UID.
-            labels: Labels to apply.
+            client: Checked-out IMAP client.
+            trash_uids: UIDs of emails in Trash.
 
         Returns:
-            List of successfully applied labels.
+            Mapping of Trash UID to restored UID, for restored emails only.
         """
-        # Select All Mail to apply labels
-        self.client.select_folder("[Gmail]/All Mail", readonly=False)
+        if not client.has_capability("UIDPLUS"):
+            attempted = {uid: self._restore_from_trash(client, uid) for uid in trash_uids}
+            return {uid: new_uid for uid, new_uid in attempted.items() if new_uid}
+
+        trash_folder = self._get_trash_folder(client)
+        client.select_folder_cached(trash_folder, readonly=False)
+
+        # Copying out of Trash untrashes the message in Gmail (see
+        # _restore_from_trash), so nothing is expunged from Trash
+        restored = client.uid_copy_many(trash_uids, "[Gmail]/All Mail")
+        if len(restored) < len(set(trash_uids)):
+            logger.warning(
+                f"COPY restored {len(restored)} of {len(set(trash_uids))} emails from Trash"
+            )
+        return restored
+
+    def _apply_labels(
+        self, client: "GmailIMAPClient", labels_by_uid: dict[int, list[str]]
+    ) -> dict[int, list[str]]:
+        """Apply Gmail labels to restored emails.
+
+        Emails with the same user labels share one STORE over a UID set.
 
-        applied = []
+        Args:
+            client: Checked-out IMAP client.
+            labels_by_uid: Labels to apply, by restored message UID.
+
+        Returns:
+            Successfully applied labels, by UID.
+        """
+        # Select All Mail to apply labels
+        client.select_folder_cached("[Gmail]/All Mail", readonly=False)
 
-        # Filter out system labels
-        user_labels = [
-            label
-            for label in labels
-            if not label.startswith(("\\", "INBOX", "SENT", "DRAFT", "SPAM", "TRASH"))
-        ]
+        # Filter out system labels and group UIDs by the labels they need
+        uids_by_labels: dict[tuple[str, ...], list[int]] = {}
+        for uid, labels in labels_by_uid.items():
+            user_labels = tuple(label for label in labels if is_user_label(label))
+            if user_labels:
+                uids_by_labels.setdefault(user_labels, []).append(uid)
 
-        if user_labels:
+        applied: dict[int, list[str]] = {}
+        for user_labels, uids in uids_by_labels.items():
             try:
-                self.client.store_labels(uid, user_labels, action="+")
-                applied = user_labels
+                client.store_labels_many(uids, list(user_labels), action="+")
             except Exception as e:
                 logger.warning(f"Failed to apply labels: {e}")
+                continue
+            for uid in uids:
+                applied[uid] = list(user_labels)
 
         return applied
 
-    def _delete_stripped(self, stripped_uid: int) -> bool:
-        """Delete the stripped version of the email.
+    def _delete_stripped(self, client: "GmailIMAPClient", stripped_uids: list[int]) -> bool:
+        """Delete the stripped versions of emails.
+
+        All Mail is selected once and every UID is trashed with a single
+        STORE over a UID set, followed by one EXPUNGE.
 
         Args:
-            stripped_uid: UID of stripped email to delete.
+            client: Checked-out IMAP client.
+            stripped_uids: UIDs of stripped emails to delete.
 
         Returns:
             True if deletion successful.
         """
+        if not stripped_uids:
+            return True
+
         try:
-            self.client.select_folder("[Gmail]/All Mail", readonly=False)
-            self.client.move_to_trash(stripped_uid)
-            self.client.expunge()
+            client.select_folder_cached("[Gmail]/All Mail", readonly=False)
+            if not client.move_many_to_trash(stripped_uids):
+                return False
+            client.expunge()
             return True
         except Exception as e:
-            logger.warning(f"Failed to delete stripped email: {e}")
+            logger.warning(f"Failed to delete stripped emails: {e}")
             return False
 
     def get_revertible_emails(self) -> list[ManifestEntry]:
@@ -317,13 +592,17 @@ class EmailReverter:
         Returns:
             Dictionary mapping email_id to availability status.
         """
-        availability = {}
+        with self.pool.acquire() as client:
+            trash_uids = self._find_many_in_trash(
+                client,
+                [entry.original_message_id for entry in entries if entry.original_message_id],
+            )
 
-        for entry in entries:
-            if entry.original_message_id:
-                uid = self._find_in_trash(entry.original_message_id)
-                availability[entry.email_id] = uid is not None
-            else:
-                availability[entry.email_id] = False
+        return {
+            entry.email_id: (
+                entry.original_message_id is not None
+                and trash_uids.get(entry.original_message_id) is not None
+            )
+            for entry in entries
+        }
 
-        return availability
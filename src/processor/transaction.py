@@ -1,16 +1,36 @@
 """Transaction management for safe email operations."""
 
+import atexit
 import json
+import os
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-from src.utils.logging import logger
+from src.utils.logging import logger, now_iso
 
 if TYPE_CHECKING:
     from src.processor.replacer import EmailReplacer
 
+try:
+    import orjson
+
+    def _dumps(entry: dict[str, Any]) -> bytes:
+        return orjson.dumps(entry)
+
+    def _loads(data: bytes | str) -> dict[str, Any]:
+        entry: dict[str, Any] = orjson.loads(data)
+        return entry
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _dumps(entry: dict[str, Any]) -> bytes:
+        return json.dumps(entry).encode("utf-8")
+
+    def _loads(data: bytes | str) -> dict[str, Any]:
+        entry: dict[str, Any] = json.loads(data)
+        return entry
+
 
 class TransactionManager:
     """Manages transactions with logging and rollback capability.
@@ -45,7 +65,7 @@ class TransactionManager:
                 "txn_id": txn_id,
                 "email_id": email_id,
                 "status": "started",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         )
 
@@ -68,7 +88,7 @@ class TransactionManager:
         entry = {
             "txn_id": txn_id,
             "status": step,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
         if data:
             entry["data"] = data
@@ -86,9 +106,10 @@ class TransactionManager:
             {
                 "txn_id": txn_id,
                 "status": "completed",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         )
+        self._log.sync()
         logger.debug(f"Transaction {txn_id} committed")
 
     def fail(self, txn_id: str, error: str) -> None:
@@ -103,9 +124,10 @@ class TransactionManager:
                 "txn_id": txn_id,
                 "status": "failed",
                 "error": error,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         )
+        self._log.sync()
         logger.warning(f"Transaction {txn_id} failed: {error}")
 
     def get_transaction_state(self, txn_id: str) -> dict[str, Any] | None:
@@ -243,37 +265,22 @@ class TransactionManager:
         Returns:
             Number of entries removed.
         """
-        cutoff = datetime.now()
-        from datetime import timedelta
+        cutoff = datetime.now() - timedelta(days=days)
+        return self._log.remove_older_than(cutoff)
 
-        cutoff = cutoff - timedelta(days=days)
-
-        # Read all entries, filter, rewrite
-        all_entries = self._log.read_all()
-        kept = []
-        removed = 0
-
-        for entry in all_entries:
-            timestamp_str = entry.get("timestamp", "")
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str)
-                if timestamp >= cutoff:
-                    kept.append(entry)
-                else:
-                    removed += 1
-            except Exception:
-                kept.append(entry)  # Keep entries with invalid timestamps
-
-        # Rewrite log file
-        with open(self.log_path, "w", encoding="utf-8") as f:
-            for entry in kept:
-                f.write(json.dumps(entry) + "\n")
-
-        return removed
+    def close(self) -> None:
+        """Close the underlying transaction log file."""
+        self._log.close()
 
 
 class TransactionLog:
-    """Append-only transaction log (JSONL format)."""
+    """Append-only transaction log (JSONL format).
+
+    The file is opened on the first append and kept open, unbuffered so each
+    entry reaches the OS in one write, until close() or interpreter exit.
+    Reads are served from an in-memory index loaded once and kept current
+    by append().
+    """
 
     def __init__(self, path: Path) -> None:
         """Initialize with log file path.
@@ -283,6 +290,10 @@ class TransactionLog:
         """
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: BinaryIO | None = None
+        # Entries in file order and by txn_id, loaded on first read
+        self._entries: list[dict[str, Any]] | None = None
+        self._index: dict[str, list[dict[str, Any]]] = {}
 
     def append(self, entry: dict[str, Any]) -> None:
         """Append entry to log.
@@ -290,36 +301,92 @@ class TransactionLog:
         Args:
             entry: Dictionary to log.
         """
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._handle().write(_dumps(entry) + b"\n")
+        if self._entries is not None:
+            self._add_to_index(entry)
 
-    def read_transaction(self, txn_id: str) -> list[dict[str, Any]]:
-        """Read all entries for a transaction.
+    def sync(self) -> None:
+        """Force appended entries to disk."""
+        if self._fh is not None:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+
+    def remove_older_than(self, cutoff: datetime) -> int:
+        """Drop entries timestamped before a cutoff.
+
+        The log is filtered line by line into a temporary file, which then
+        atomically replaces it. Kept lines are copied without re-encoding.
+        Entries with a missing or invalid timestamp are kept; lines that
+        are not valid JSON are dropped.
 
         Args:
-            txn_id: Transaction ID.
+            cutoff: Entries older than this are removed.
 
         Returns:
-            List of entries for this transaction.
+            Number of entries removed.
         """
-        entries = []
+        self.close()
+        self._entries = None
+        self._index = {}
 
         if not self.path.exists():
-            return entries
+            return 0
 
-        with open(self.path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        removed = 0
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+
+        with open(self.path, "rb") as src, open(tmp_path, "wb") as dst:
+            for line in src:
+                if not line.strip():
                     continue
                 try:
-                    entry = json.loads(line)
-                    if entry.get("txn_id") == txn_id:
-                        entries.append(entry)
+                    entry = _loads(line)
                 except json.JSONDecodeError:
                     continue
 
-        return entries
+                try:
+                    timestamp = datetime.fromisoformat(entry.get("timestamp", ""))
+                except Exception:
+                    timestamp = None  # Keep entries with invalid timestamps
+
+                if timestamp is not None and timestamp < cutoff:
+                    removed += 1
+                    continue
+
+                dst.write(line if line.endswith(b"\n") else line + b"\n")
+
+        os.replace(tmp_path, self.path)
+        return removed
+
+    def close(self) -> None:
+        """Close the append handle. A later append reopens it."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            atexit.unregister(self.close)
+
+    def _handle(self) -> BinaryIO:
+        """Get the append handle, opening it if needed.
+
+        Returns:
+            Unbuffered binary file opened for append.
+        """
+        if self._fh is None:
+            self._fh = open(self.path, "ab", buffering=0)
+            atexit.register(self.close)
+        return self._fh
+
+    def read_transaction(self, txn_id: str) -> list[dict[str, Any]]:
+        """Read all entries for a transaction.
+
+        Args:
+            txn_id: Transaction ID.
+
+        Returns:
+            List of entries for this transaction.
+        """
+        self._ensure_index()
+        return list(self._index.get(txn_id, []))
 
     def read_all(self) -> list[dict[str, Any]]:
         """Read all entries from log.
@@ -327,22 +394,47 @@ class TransactionLog:
         Returns:
             List of all entries.
         """
-        entries = []
+        return list(self._ensure_index())
+
+    def _ensure_index(self) -> list[dict[str, Any]]:
+        """Load the log into memory on first read.
+
+        Returns:
+            All entries in file order.
+        """
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = []
+        self._index = {}
 
         if not self.path.exists():
-            return entries
+            return self._entries
 
-        with open(self.path, "r", encoding="utf-8") as f:
+        with open(self.path, "rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    entries.append(json.loads(line))
+                    self._add_to_index(_loads(line))
                 except json.JSONDecodeError:
                     continue
 
-        return entries
+        return self._entries
+
+    def _add_to_index(self, entry: dict[str, Any]) -> None:
+        """Record an entry in the in-memory index, if it has been loaded.
+
+        Args:
+            entry: Log entry.
+        """
+        if self._entries is None:
+            return  # _ensure_index() will read the entry from the file
+        self._entries.append(entry)
+        txn_id = entry.get("txn_id")
+        if txn_id:
+            self._index.setdefault(txn_id, []).append(entry)
 
     def get_last_state(self, txn_id: str) -> str | None:
         """Get last recorded state of transaction.
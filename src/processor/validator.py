@@ -1,10 +1,37 @@
 """Validation of reconstructed emails."""
 
+import re
+from collections.abc import Iterator
 from email import policy
+from email.message import EmailMessage, MIMEPart
 from email.parser import BytesParser
 
 from src.models.email import ValidationResult
-from src.processor.mime_handler import MIMEHandler
+from src.processor.mime_handler import EncodingHandler, MIMEHandler
+
+_WHITESPACE_RUN = re.compile(rb"\s+")
+_HEADER_END = re.compile(rb"\r?\n\r?\n")
+_MESSAGE_ID_HEADER = re.compile(rb"^message-id:", re.IGNORECASE | re.MULTILINE)
+
+# Smallest plausible reconstruction: a few headers and a placeholder body
+MIN_EMAIL_SIZE = 64
+# Emails larger than this are not processed
+MAX_EMAIL_SIZE = 50 * 1024 * 1024
+
+# Parsers keep no state between parsebytes() calls, so one can be shared
+_PARSER = BytesParser(policy=policy.default)
+
+
+def _normalize_ws_bytes(data: bytes) -> bytes:
+    """Collapse whitespace runs to single spaces and strip the ends.
+
+    Args:
+        data: Raw bytes.
+
+    Returns:
+        Normalized bytes.
+    """
+    return _WHITESPACE_RUN.sub(b" ", data).strip()
 
 
 class ReconstructionValidator:
@@ -15,25 +42,28 @@ class ReconstructionValidator:
     """
 
     # Headers that must be preserved exactly
-    CRITICAL_HEADERS = [
+    CRITICAL_HEADERS = (
         "Message-ID",
         "Date",
         "From",
         "Subject",
         "In-Reply-To",
         "References",
-    ]
+    )
 
     # Headers that should be preserved but minor changes are OK
-    IMPORTANT_HEADERS = [
+    IMPORTANT_HEADERS = (
         "To",
         "Cc",
         "Reply-To",
-    ]
+    )
+
+    # Lower-cased names of every header compared above
+    _CHECKED_HEADERS = frozenset(h.lower() for h in CRITICAL_HEADERS + IMPORTANT_HEADERS)
 
     def __init__(self) -> None:
         """Initialize validator."""
-        self._parser = BytesParser(policy=policy.default)
+        self._parser = _PARSER
 
     def validate(
         self,
@@ -49,6 +79,10 @@ class ReconstructionValidator:
         Returns:
             ValidationResult with detailed analysis.
         """
+        rejection = self._precheck(original, reconstructed)
+        if rejection is not None:
+            return rejection
+
         original_msg = self._parser.parsebytes(original)
         reconstructed_msg = self._parser.parsebytes(reconstructed)
 
@@ -60,7 +94,7 @@ class ReconstructionValidator:
 
         # Check body preserved
         warnings = []
-        if not self._check_body_preserved(original_msg, reconstructed_msg):
+        if not self._check_body_preserved(original_msg, reconstructed_msg, reconstructed):
             warnings.append("Original body text may have been modified")
 
         # Calculate sizes
@@ -79,6 +113,43 @@ class ReconstructionValidator:
             warnings=warnings,
         )
 
+    def _precheck(self, original: bytes, reconstructed: bytes) -> ValidationResult | None:
+        """Reject obviously broken reconstructions without parsing them.
+
+        Args:
+            original: Original email bytes.
+            reconstructed: Reconstructed email bytes.
+
+        Returns:
+            Failed ValidationResult, or None if full validation should run.
+        """
+        header_issues: list[str] = []
+        mime_issues: list[str] = []
+
+        header_end = _HEADER_END.search(reconstructed)
+        if len(reconstructed) < MIN_EMAIL_SIZE:
+            mime_issues.append(f"Reconstructed email is only {len(reconstructed)} bytes")
+        elif header_end is None:
+            mime_issues.append("Reconstructed email has no header/body separator")
+        else:
+            original_end = _HEADER_END.search(original)
+            original_headers = original[: original_end.start()] if original_end else original
+            if _MESSAGE_ID_HEADER.search(original_headers) and not _MESSAGE_ID_HEADER.search(
+                reconstructed, 0, header_end.start()
+            ):
+                header_issues.append("Missing critical header: Message-ID")
+
+        if not header_issues and not mime_issues:
+            return None
+
+        return ValidationResult(
+            is_valid=False,
+            original_size=len(original),
+            reconstructed_size=len(reconstructed),
+            header_issues=header_issues,
+            mime_issues=mime_issues,
+        )
+
     def _check_headers_preserved(
         self,
         original: "EmailMessage",  # type: ignore
@@ -94,10 +165,12 @@ class ReconstructionValidator:
             List of issues found.
         """
         issues = []
+        original_values = self._checked_header_values(original)
+        reconstructed_values = self._checked_header_values(reconstructed)
 
         for header in self.CRITICAL_HEADERS:
-            original_value = original.get(header, "")
-            reconstructed_value = reconstructed.get(header, "")
+            original_value = original_values.get(header.lower(), "")
+            reconstructed_value = reconstructed_values.get(header.lower(), "")
 
             if original_value and not reconstructed_value:
                 issues.append(f"Missing critical header: {header}")
@@ -106,8 +179,8 @@ class ReconstructionValidator:
 
         # Check important headers (just warn, don't fail)
         for header in self.IMPORTANT_HEADERS:
-            original_value = original.get(header, "")
-            reconstructed_value = reconstructed.get(header, "")
+            original_value = original_values.get(header.lower(), "")
+            reconstructed_value = reconstructed_values.get(header.lower(), "")
 
             if original_value and not reconstructed_value:
                 # This is a warning, not an error
@@ -115,6 +188,28 @@ class ReconstructionValidator:
 
         return issues
 
+    def _checked_header_values(
+        self,
+        msg: "EmailMessage",  # type: ignore
+    ) -> dict[str, str]:
+        """Collect the compared headers in one pass over the header list.
+
+        Matches msg.get(): the first occurrence wins and values are parsed
+        by the message policy, but only for the headers being compared.
+
+        Args:
+            msg: Email message.
+
+        Returns:
+            Dictionary of lower-cased header name to value.
+        """
+        values: dict[str, str] = {}
+        for name, raw_value in msg.raw_items():
+            key = name.lower()
+            if key in self._CHECKED_HEADERS and key not in values:
+                values[key] = msg.policy.header_fetch_parse(name, raw_value)
+        return values
+
     def _check_mime_validity(
         self,
         msg: "EmailMessage",  # type: ignore
@@ -127,28 +222,37 @@ class ReconstructionValidator:
         Returns:
             List of issues found.
         """
-        issues = []
-
-        # Check Content-Type exists
-        if not msg.get("Content-Type"):
-            issues.append("Missing Content-Type header")
-
-        # Check multipart has valid boundary
-        if msg.is_multipart():
-            boundary = msg.get_boundary()
-            if not boundary:
-                issues.append("Multipart message missing boundary")
-
-            # Check at least one part exists
-            parts = list(msg.iter_parts())
-            if not parts:
-                issues.append("Multipart message has no parts")
-
-            # Recursively check parts
-            for i, part in enumerate(parts):
-                part_issues = self._check_mime_validity(part)
-                for issue in part_issues:
-                    issues.append(f"Part {i + 1}: {issue}")
+        issues: list[str] = []
+
+        # Iterative DFS; path holds 1-based part numbers and is joined
+        # into a prefix only when an issue is reported
+        stack: list[tuple[MIMEPart, tuple[int, ...]]] = [(msg, ())]
+        while stack:
+            part, path = stack.pop()
+            part_issues = []
+
+            # Check Content-Type exists
+            if not part.get("Content-Type"):
+                part_issues.append("Missing Content-Type header")
+
+            # Check multipart has valid boundary
+            if part.is_multipart():
+                if not part.get_boundary():
+                    part_issues.append("Multipart message missing boundary")
+
+                # Check at least one part exists
+                children = list(part.iter_parts())
+                if not children:
+                    part_issues.append("Multipart message has no parts")
+
+                for i in range(len(children), 0, -1):
+                    stack.append((children[i - 1], path + (i,)))
+
+            if path:
+                prefix = f"Part {'/'.join(map(str, path))}: "
+                issues.extend(prefix + issue for issue in part_issues)
+            else:
+                issues.extend(part_issues)
 
         return issues
 
@@ -156,17 +260,27 @@ class ReconstructionValidator:
         self,
         original: "EmailMessage",  # type: ignore
         reconstructed: "EmailMessage",  # type: ignore
+        reconstructed_raw: bytes | None = None,
     ) -> bool:
         """Verify text body is preserved.
 
+        When the reconstructed bytes are given, the encoded text parts of
+        the original are first looked up in them directly. Only if that
+        fails (e.g. a part was re-encoded) are both messages decoded and
+        compared as text.
+
         Args:
             original: Original email message.
             reconstructed: Reconstructed email message.
+            reconstructed_raw: Reconstructed email bytes, if available.
 
         Returns:
             True if body appears preserved.
         """
-        from src.processor.mime_handler import EncodingHandler
+        if reconstructed_raw is not None and self._raw_body_preserved(
+            original, reconstructed_raw
+        ):
+            return True
 
         # Find text parts in both messages
         original_text = self._extract_text_content(original)
@@ -183,6 +297,41 @@ class ReconstructionValidator:
 
         return True
 
+    def _raw_body_preserved(
+        self,
+        original: "EmailMessage",  # type: ignore
+        reconstructed_raw: bytes,
+    ) -> bool:
+        """Check each original text/plain part appears verbatim in raw bytes.
+
+        Compares the still-encoded payloads, so no part is decoded.
+
+        Args:
+            original: Original email message.
+            reconstructed_raw: Reconstructed email bytes.
+
+        Returns:
+            True if every text/plain payload is found, whitespace-normalized.
+        """
+        haystack = _normalize_ws_bytes(reconstructed_raw)
+
+        for part in original.walk():
+            if part.is_multipart() or part.get_content_type() != "text/plain":
+                continue
+            payload = part.get_payload()
+            if not isinstance(payload, str):
+                return False
+            try:
+                # The parser keeps 8-bit bytes as surrogate escapes
+                encoded = payload.encode("ascii", errors="surrogateescape")
+            except UnicodeEncodeError:
+                return False
+            needle = _normalize_ws_bytes(encoded)
+            if needle and needle not in haystack:
+                return False
+
+        return True
+
     def _extract_text_content(
         self,
         msg: "EmailMessage",  # type: ignore
@@ -195,19 +344,24 @@ class ReconstructionValidator:
         Returns:
             Combined text content.
         """
-        from src.processor.mime_handler import EncodingHandler
-
-        text_parts = []
+        return "\n".join(self._iter_text_parts(msg))
 
-        if not msg.is_multipart():
-            if msg.get_content_type() == "text/plain":
-                text_parts.append(EncodingHandler.safe_decode_payload(msg))
-            return "\n".join(text_parts)
+    def _iter_text_parts(self, msg: EmailMessage) -> Iterator[str]:
+        """Yield decoded text/plain parts in document order.
 
-        for part in msg.iter_parts():
-            text_parts.append(self._extract_text_content(part))
+        Args:
+            msg: Email message.
 
-        return "\n".join(text_parts)
+        Yields:
+            Decoded text of each text/plain leaf part.
+        """
+        stack: list[MIMEPart] = [msg]
+        while stack:
+            part = stack.pop()
+            if part.is_multipart():
+                stack.extend(reversed(list(part.iter_parts())))
+            elif part.get_content_type() == "text/plain":
+                yield EncodingHandler.safe_decode_payload(part)
 
     def quick_validate(self, reconstructed: bytes) -> bool:
         """Quick validation - just check it parses.
@@ -244,10 +398,13 @@ class PreflightChecker:
             Tuple of (can_process, list of reasons if not).
         """
         reasons = []
-        parser = BytesParser(policy=policy.default)
+
+        # Check for unreasonable size before paying for a parse
+        if len(raw_email) > MAX_EMAIL_SIZE:
+            return False, ["Email exceeds 50MB size limit"]
 
         try:
-            msg = parser.parsebytes(raw_email)
+            msg = _PARSER.parsebytes(raw_email)
         except Exception as e:
             return False, [f"Failed to parse email: {e}"]
 
@@ -259,10 +416,6 @@ class PreflightChecker:
         if not msg.get("Message-ID"):
             reasons.append("Missing Message-ID header")
 
-        # Check for unreasonable size
-        if len(raw_email) > 50 * 1024 * 1024:  # 50MB
-            reasons.append("Email exceeds 50MB size limit")
-
         # Check for valid structure
         content_type = msg.get("Content-Type")
         if not content_type:
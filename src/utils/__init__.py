@@ -1,11 +1,23 @@
 """Utility modules for logging, manifest, and hashing."""
 
-from src.utils.hashing import compute_file_hash, compute_sha256, verify_hash
+from src.utils.hashing import (
+    compute_file_hash,
+    compute_file_hashes,
+    compute_sha256,
+    compute_sha256_bytes,
+    invalidate_hash_cache,
+    verify_file_hashes,
+    verify_hash,
+)
 from src.utils.manifest import ManifestManager
 
 __all__ = [
     "compute_sha256",
+    "compute_sha256_bytes",
     "verify_hash",
+    "verify_file_hashes",
     "compute_file_hash",
+    "compute_file_hashes",
+    "invalidate_hash_cache",
     "ManifestManager",
 ]
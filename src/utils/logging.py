@@ -1,14 +1,49 @@
 """Logging configuration and utilities."""
 
+import atexit
+import json
 import logging
+import os
 import sys
-from datetime import datetime
+import time
+import traceback
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    def _dumps(entry: dict[str, Any]) -> bytes:
+        return orjson.dumps(entry)
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _dumps(entry: dict[str, Any]) -> bytes:
+        return json.dumps(entry, separators=(",", ":")).encode()
+
 # Create module logger
 logger = logging.getLogger("gmail_clean")
 
+# (epoch second, formatted local time) for the most recent now_iso() call
+_second_cache: tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """Get the current local time in ISO 8601 format with microseconds.
+
+    The date and time up to seconds are formatted once per second and
+    reused, since log entries are written many times per second.
+
+    Returns:
+        Timestamp string, e.g. "2024-01-15T10:30:00.123456".
+    """
+    global _second_cache
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _second_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _second_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}"
+
 
 def setup_logging(
     level: str = "INFO",
@@ -60,7 +95,16 @@ def setup_logging(
 
 
 class OperationLogger:
-    """Structured logging for operations with JSONL output."""
+    """Structured logging for operations with JSONL output.
+
+    Entries are buffered in memory and written together once BUFFER_ENTRIES
+    or BUFFER_BYTES is reached, FLUSH_INTERVAL has passed, or a batch
+    completes. Use flush() or close() to force buffered entries to disk.
+    """
+
+    BUFFER_ENTRIES = 64
+    BUFFER_BYTES = 64 * 1024
+    FLUSH_INTERVAL = 1.0  # seconds
 
     def __init__(self, log_path: Path | None = None) -> None:
         """Initialize operation logger.
@@ -69,8 +113,65 @@ class OperationLogger:
             log_path: Path to JSONL log file.
         """
         self.log_path = log_path
+        self._fd: int | None = None
+        self._buf: list[bytes] = []
+        self._buf_bytes = 0
+        self._buf_since = 0.0
         if log_path:
             log_path.parent.mkdir(parents=True, exist_ok=True)
+            # O_APPEND makes each os.write() land atomically at the end of file
+            self._fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            atexit.register(self.close)
+
+    def flush(self) -> None:
+        """Write buffered entries to the JSONL log."""
+        if not self._buf or self._fd is None:
+            return
+        if hasattr(os, "writev"):
+            os.writev(self._fd, self._buf)
+        else:
+            os.write(self._fd, b"".join(self._buf))
+        self._buf.clear()
+        self._buf_bytes = 0
+
+    def close(self) -> None:
+        """Flush buffered entries and close the JSONL log file."""
+        if self._fd is not None:
+            self.flush()
+            os.close(self._fd)
+            self._fd = None
+            atexit.unregister(self.close)
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        """Buffer one entry for the JSONL log, flushing if a threshold is hit.
+
+        Args:
+            entry: JSON-serializable log entry.
+        """
+        if self._fd is None:
+            return
+
+        line = _dumps(entry) + b"\n"
+        now = time.monotonic()
+        if not self._buf:
+            self._buf_since = now
+        self._buf.append(line)
+        self._buf_bytes += len(line)
+
+        if (
+            len(self._buf) >= self.BUFFER_ENTRIES
+            or self._buf_bytes >= self.BUFFER_BYTES
+            or now - self._buf_since >= self.FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def __enter__(self) -> "OperationLogger":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit - flush buffered entries."""
+        self.flush()
 
     def log_operation(
         self,
@@ -88,7 +189,7 @@ class OperationLogger:
             details: Additional details.
         """
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "operation": operation,
             "email_id": email_id,
             "success": success,
@@ -102,11 +203,7 @@ class OperationLogger:
             logger.warning(f"{operation}: {email_id} - failed")
 
         # Append to JSONL file
-        if self.log_path:
-            import json
-
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+        self._write(entry)
 
     def log_error(
         self,
@@ -121,8 +218,6 @@ class OperationLogger:
             email_id: Email identifier.
             error: Exception that occurred.
         """
-        import traceback
-
         details = {
             "error_type": type(error).__name__,
             "error_message": str(error),
@@ -143,16 +238,13 @@ class OperationLogger:
         logger.info(f"Starting batch processing ({mode}): {batch_size} emails")
 
         if self.log_path:
-            import json
-
             entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "event": "batch_start",
                 "batch_size": batch_size,
                 "dry_run": dry_run,
             }
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+            self._write(entry)
 
     def log_batch_complete(
         self,
@@ -178,10 +270,8 @@ class OperationLogger:
         )
 
         if self.log_path:
-            import json
-
             entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "event": "batch_complete",
                 "successful": successful,
                 "failed": failed,
@@ -189,5 +279,5 @@ class OperationLogger:
                 "bytes_saved": bytes_saved,
                 "duration_seconds": duration_seconds,
             }
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+            self._write(entry)
+            self.flush()
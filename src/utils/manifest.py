@@ -1,31 +1,363 @@
-"""Manifest management using TinyDB for tracking processed emails."""
+"""Manifest management using SQLite for tracking processed emails."""
 
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-
-from tinydb import Query, TinyDB
+from typing import Any, Literal
 
 from src.models.email import ManifestEntry
+from src.utils.logging import logger
+
+try:
+    import orjson
+
+    def _loads(data: bytes | str) -> dict[str, Any]:
+        # Decodes stored entry payloads several times faster than json.loads
+        payload: dict[str, Any] = orjson.loads(data)
+        return payload
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, default=str)
+
+    def _dumps_indented(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _loads(data: bytes | str) -> dict[str, Any]:
+        payload: dict[str, Any] = json.loads(data)
+        return payload
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+    def _dumps_indented(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS emails (
+    email_id TEXT PRIMARY KEY,
+    imap_uid INTEGER,
+    status TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS emails_imap_uid ON emails (imap_uid);
+CREATE INDEX IF NOT EXISTS emails_status_uid ON emails (status, imap_uid);
+-- Status-only lookups; rowid order within the index avoids an ORDER BY sort
+CREATE INDEX IF NOT EXISTS emails_status ON emails (status);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# meta key holding the running get_processing_stats() aggregates
+_STATS_KEY = "processing_stats"
+
+# Recomputes what _add_entry_stats() accumulates, per status
+_STATS_QUERY = """
+SELECT
+    COALESCE(status, 'unknown'),
+    COUNT(*),
+    COALESCE(SUM(json_extract(payload, '$.original_size')), 0),
+    COALESCE(SUM(json_extract(payload, '$.stripped_size')), 0),
+    COALESCE(SUM(json_array_length(payload, '$.attachments')), 0)
+FROM emails
+GROUP BY 1
+"""
+
+# Write buffer for manifest exports
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Stay under SQLite's default limit of 999 bound parameters per statement
+_SQL_PARAM_LIMIT = 900
+
+
+def _empty_stats() -> dict[str, Any]:
+    """Create processing statistics for an empty manifest."""
+    return {
+        "total": 0,
+        "by_status": {},
+        "total_original_size": 0,
+        "total_stripped_size": 0,
+        "total_attachments": 0,
+    }
+
+
+def _add_entry_stats(stats: dict[str, Any], entry: dict[str, Any], sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) one entry's share of the statistics.
+
+    Args:
+        stats: Statistics to update in place.
+        entry: Stored manifest entry.
+        sign: 1 to add the entry, -1 to remove it.
+    """
+    status = entry.get("status", "unknown")
+    count = stats["by_status"].get(status, 0) + sign
+    if count:
+        stats["by_status"][status] = count
+    else:
+        stats["by_status"].pop(status, None)
+
+    stats["total"] += sign
+    stats["total_original_size"] += sign * entry.get("original_size", 0)
+    stats["total_stripped_size"] += sign * (entry.get("stripped_size") or 0)
+    stats["total_attachments"] += sign * len(entry.get("attachments", []))
 
 
 class ManifestManager:
     """Manages the processing manifest database.
 
-    Uses TinyDB for lightweight JSON-based storage that's
-    human-readable and doesn't require external services.
+    Entries live in a single SQLite table, indexed by email ID, IMAP UID
+    and (status, IMAP UID), with the full entry stored as JSON so the
+    schema doesn't change when ManifestEntry gains fields. Processing
+    statistics are kept up to date in a meta row by every write. A
+    manifest left by the older TinyDB backend (same path with a .json
+    suffix) is imported on first open.
     """
 
-    def __init__(self, manifest_path: Path) -> None:
+    # Pass as manifest_path for a private in-memory manifest
+    MEMORY = ":memory:"
+
+    def __init__(
+        self, manifest_path: Path | str, durability: Literal["normal", "full"] = "normal"
+    ) -> None:
         """Initialize with path to manifest database.
 
         Args:
-            manifest_path: Path to manifest JSON file.
+            manifest_path: Path to manifest SQLite file, or MEMORY for a
+                manifest that lives only as long as this manager.
+            durability: "normal" syncs the write-ahead log only at
+                checkpoints, so a power loss can drop the latest commits but
+                never corrupts the database. "full" syncs every commit.
+
+        Raises:
+            ValueError: If durability is not "normal" or "full".
         """
+        if durability not in ("normal", "full"):
+            raise ValueError(f"Invalid durability: {durability}")
+
+        in_memory = str(manifest_path) == self.MEMORY
         self.manifest_path = Path(manifest_path)
-        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db = TinyDB(self.manifest_path)
-        self._emails = self._db.table("emails")
+        if in_memory:
+            is_new = False  # Nothing to import
+        else:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not self.manifest_path.exists()
+
+        # Shared by worker threads; every access goes through _lock
+        self._db = sqlite3.connect(
+            self.MEMORY if in_memory else self.manifest_path,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={durability.upper()}")
+        # Keep sort/temp tables off disk and allow a ~20 MB page cache
+        self._db.execute("PRAGMA temp_store=MEMORY")
+        self._db.execute("PRAGMA cache_size=-20000")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # get_entries_by_status() results, dropped on every write
+        self._status_cache: dict[str, list[ManifestEntry]] = {}
+
+        legacy_path = self.manifest_path.with_suffix(".json")
+        if is_new and legacy_path != self.manifest_path and legacy_path.exists():
+            self._import_legacy(legacy_path)
+
+    @staticmethod
+    def exists(manifest_path: Path) -> bool:
+        """Check whether a manifest, or a legacy one to import, exists.
+
+        Args:
+            manifest_path: Path to manifest SQLite file.
+
+        Returns:
+            True if there is a manifest to open.
+        """
+        manifest_path = Path(manifest_path)
+        return manifest_path.exists() or manifest_path.with_suffix(".json").exists()
+
+    @contextmanager
+    def batch(self) -> Iterator["ManifestManager"]:
+        """Group many writes into one transaction, committed on exit.
+
+        Writes made inside the batch become savepoints of a single
+        transaction, so a failed write only undoes itself. Nested batches
+        join the outer one.
+
+        Yields:
+            This manifest manager.
+        """
+        with self._lock:
+            owner = not self._db.in_transaction
+            if owner:
+                self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield self
+        finally:
+            if owner:
+                with self._lock:
+                    self._db.execute("COMMIT")
+
+    @contextmanager
+    def rolled_back(self) -> Iterator["ManifestManager"]:
+        """Undo every write made inside the block on exit.
+
+        Lets tests share one manager: the block runs inside a savepoint
+        that is rolled back afterwards, and cached query results are
+        dropped with it.
+
+        Yields:
+            This manifest manager.
+        """
+        with self._lock:
+            self._db.execute("SAVEPOINT rolled_back")
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._db.execute("ROLLBACK TO rolled_back")
+                self._db.execute("RELEASE rolled_back")
+                self._status_cache.clear()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction, or a savepoint in a batch.
+
+        Yields:
+            Database connection.
+        """
+        with self._lock:
+            self._status_cache.clear()
+            nested = self._db.in_transaction
+            self._db.execute("SAVEPOINT write" if nested else "BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                if nested:
+                    self._db.execute("ROLLBACK TO write")
+                    self._db.execute("RELEASE write")
+                else:
+                    self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("RELEASE write" if nested else "COMMIT")
+
+    def _query(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read query.
+
+        Args:
+            sql: SQL statement.
+            params: Statement parameters.
+
+        Returns:
+            All result rows.
+        """
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _import_legacy(self, legacy_path: Path) -> None:
+        """Copy entries from a TinyDB JSON manifest into the database.
+
+        Args:
+            legacy_path: Path to the TinyDB manifest file.
+        """
+        try:
+            with open(legacy_path, encoding="utf-8") as f:
+                records = list(json.load(f).get("emails", {}).values())
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not import legacy manifest {legacy_path}: {e}")
+            return
+
+        with self._write() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO emails (email_id, imap_uid, status, payload) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (r["email_id"], r.get("imap_uid"), r.get("status"), json.dumps(r))
+                    for r in records
+                    if "email_id" in r
+                ],
+            )
+        logger.info(f"Imported {len(records)} entries from legacy manifest {legacy_path}")
+
+    def _read_stats(self, db: sqlite3.Connection) -> dict[str, Any]:
+        """Load the stored statistics, computing them if not stored yet.
+
+        Args:
+            db: Database connection, with _lock held.
+
+        Returns:
+            Processing statistics without the derived total_savings.
+        """
+        row = db.execute("SELECT value FROM meta WHERE key = ?", (_STATS_KEY,)).fetchone()
+        if row is not None:
+            return _loads(row[0])
+
+        # Manifests written before statistics were stored need one full
+        # scan, aggregated by SQLite without decoding entries in Python
+        stats = _empty_stats()
+        for status, count, original, stripped, attachments in db.execute(_STATS_QUERY):
+            stats["by_status"][status] = count
+            stats["total"] += count
+            stats["total_original_size"] += original
+            stats["total_stripped_size"] += stripped
+            stats["total_attachments"] += attachments
+        return stats
+
+    def _save_entry(
+        self,
+        db: sqlite3.Connection,
+        email_id: str,
+        old: dict[str, Any] | None,
+        new: dict[str, Any] | None,
+    ) -> None:
+        """Replace or delete an entry and update the stored statistics.
+
+        Must run inside _write() so the entry and statistics change together.
+
+        Args:
+            db: Database connection.
+            email_id: Gmail message ID.
+            old: Currently stored entry, or None if there is none.
+            new: Entry to store, or None to delete it.
+        """
+        # Read first: without a stored row, statistics come from a scan of the table
+        stats = self._read_stats(db)
+        if new is None:
+            db.execute("DELETE FROM emails WHERE email_id = ?", (email_id,))
+        else:
+            db.execute(
+                "INSERT OR REPLACE INTO emails (email_id, imap_uid, status, payload) "
+                "VALUES (?, ?, ?, ?)",
+                (email_id, new.get("imap_uid"), new.get("status"), json.dumps(new)),
+            )
+
+        if old is not None:
+            _add_entry_stats(stats, old, -1)
+        if new is not None:
+            _add_entry_stats(stats, new, 1)
+        db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (_STATS_KEY, json.dumps(stats)),
+        )
+
+    @staticmethod
+    def _load_entry(db: sqlite3.Connection, email_id: str) -> dict[str, Any] | None:
+        """Read a stored entry as a dictionary.
+
+        Args:
+            db: Database connection, with _lock held.
+            email_id: Gmail message ID.
+
+        Returns:
+            Stored entry, or None if not found.
+        """
+        row = db.execute("SELECT payload FROM emails WHERE email_id = ?", (email_id,)).fetchone()
+        return _loads(row[0]) if row is not None else None
 
     def record_extraction(
         self,
@@ -69,11 +401,56 @@ class ManifestManager:
         )
 
         # Upsert by email_id
-        Email = Query()
-        self._emails.upsert(entry.to_dict(), Email.email_id == email_id)
+        with self._write() as db:
+            self._save_entry(db, email_id, self._load_entry(db, email_id), entry.to_dict())
 
         return entry
 
+    def record_extractions(self, records: Iterable[dict[str, Any]]) -> list[ManifestEntry]:
+        """Record many extractions with one statement in one transaction.
+
+        Args:
+            records: Keyword arguments of record_extraction() for each email.
+
+        Returns:
+            Created ManifestEntry objects, in input order.
+        """
+        processed_at = datetime.now()
+        entries = [
+            ManifestEntry(**{"status": "extracted", **record}, processed_at=processed_at)
+            for record in records
+        ]
+        if not entries:
+            return entries
+
+        with self._write() as db:
+            stats = self._read_stats(db)
+            # Later records for the same email_id replace earlier ones, as
+            # sequential record_extraction() calls would
+            stored: dict[str, dict[str, Any]] = {}
+            for entry in entries:
+                old = stored.get(entry.email_id) or self._load_entry(db, entry.email_id)
+                if old is not None:
+                    _add_entry_stats(stats, old, -1)
+                new = entry.to_dict()
+                _add_entry_stats(stats, new, 1)
+                stored[entry.email_id] = new
+
+            db.executemany(
+                "INSERT OR REPLACE INTO emails (email_id, imap_uid, status, payload) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (email_id, data["imap_uid"], data["status"], json.dumps(data))
+                    for email_id, data in stored.items()
+                ],
+            )
+            db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (_STATS_KEY, json.dumps(stats)),
+            )
+
+        return entries
+
     def get_entry(self, email_id: str) -> ManifestEntry | None:
         """Retrieve manifest entry by email ID.
 
@@ -83,11 +460,10 @@ class ManifestManager:
         Returns:
             ManifestEntry if found, None otherwise.
         """
-        Email = Query()
-        results = self._emails.search(Email.email_id == email_id)
+        rows = self._query("SELECT payload FROM emails WHERE email_id = ?", (email_id,))
 
-        if results:
-            return ManifestEntry.from_dict(results[0])
+        if rows:
+            return ManifestEntry.from_dict(_loads(rows[0][0]))
         return None
 
     def get_entry_by_uid(self, imap_uid: int) -> ManifestEntry | None:
@@ -99,25 +475,35 @@ class ManifestManager:
         Returns:
             ManifestEntry if found, None otherwise.
         """
-        Email = Query()
-        results = self._emails.search(Email.imap_uid == imap_uid)
+        rows = self._query(
+            "SELECT payload FROM emails WHERE imap_uid = ? ORDER BY rowid LIMIT 1", (imap_uid,)
+        )
 
-        if results:
-            return ManifestEntry.from_dict(results[0])
+        if rows:
+            return ManifestEntry.from_dict(_loads(rows[0][0]))
         return None
 
     def get_entries_by_status(self, status: str) -> list[ManifestEntry]:
         """Query entries by processing status.
 
+        Results are cached until the next write through this manager, so
+        the returned entries are shared and must not be modified.
+
         Args:
             status: Status to filter by.
 
         Returns:
             List of matching ManifestEntry objects.
         """
-        Email = Query()
-        results = self._emails.search(Email.status == status)
-        return [ManifestEntry.from_dict(r) for r in results]
+        with self._lock:
+            cached = self._status_cache.get(status)
+            if cached is None:
+                rows = self._db.execute(
+                    "SELECT payload FROM emails WHERE status = ? ORDER BY rowid", (status,)
+                )
+                cached = [ManifestEntry.from_dict(_loads(payload)) for (payload,) in rows]
+                self._status_cache[status] = cached
+        return list(cached)
 
     def update_status(
         self,
@@ -143,7 +529,6 @@ class ManifestManager:
         Returns:
             True if entry was updated.
         """
-        Email = Query()
         updates: dict[str, Any] = {"status": status}
 
         if stripped_size is not None:
@@ -157,8 +542,24 @@ class ManifestManager:
         if gmail_thread_id is not None:
             updates["gmail_thread_id"] = gmail_thread_id
 
-        result = self._emails.update(updates, Email.email_id == email_id)
-        return len(result) > 0
+        return self._update(email_id, updates)
+
+    def _update(self, email_id: str, updates: dict[str, Any]) -> bool:
+        """Merge fields into a stored entry.
+
+        Args:
+            email_id: Gmail message ID.
+            updates: Fields to overwrite.
+
+        Returns:
+            True if entry was updated.
+        """
+        with self._write() as db:
+            old = self._load_entry(db, email_id)
+            if old is None:
+                return False
+            self._save_entry(db, email_id, old, {**old, **updates})
+        return True
 
     def get_revertible_entries(self) -> list[ManifestEntry]:
         """Get entries that can be reverted (completed with tracking info).
@@ -166,11 +567,14 @@ class ManifestManager:
         Returns:
             List of ManifestEntry objects that can be reverted.
         """
-        Email = Query()
-        results = self._emails.search(
-            (Email.status == "completed") & (Email.original_message_id.exists())
+        rows = self._query(
+            "SELECT payload FROM emails WHERE status = 'completed' ORDER BY rowid"
         )
-        return [ManifestEntry.from_dict(r) for r in results]
+        # Check the raw dict first so non-revertible rows never become entries
+        data = (_loads(payload) for (payload,) in rows)
+        return [
+            ManifestEntry.from_dict(d) for d in data if d.get("original_message_id") is not None
+        ]
 
     def mark_reverted(self, email_id: str, new_uid: int | None = None) -> bool:
         """Mark an entry as reverted.
@@ -182,7 +586,6 @@ class ManifestManager:
         Returns:
             True if entry was updated.
         """
-        Email = Query()
         updates: dict[str, Any] = {
             "status": "reverted",
             "reverted_at": datetime.now().isoformat(),
@@ -190,8 +593,7 @@ class ManifestManager:
         if new_uid is not None:
             updates["reverted_uid"] = new_uid
 
-        result = self._emails.update(updates, Email.email_id == email_id)
-        return len(result) > 0
+        return self._update(email_id, updates)
 
     def is_processed(self, email_id: str) -> bool:
         """Check if email has been processed.
@@ -202,8 +604,19 @@ class ManifestManager:
         Returns:
             True if email exists in manifest with completed status.
         """
-        entry = self.get_entry(email_id)
-        return entry is not None and entry.status == "completed"
+        return self._status_of(email_id) == "completed"
+
+    def _status_of(self, email_id: str) -> str | None:
+        """Look up just the status of an entry.
+
+        Args:
+            email_id: Gmail message ID.
+
+        Returns:
+            Status string, or None if the entry doesn't exist.
+        """
+        rows = self._query("SELECT status FROM emails WHERE email_id = ?", (email_id,))
+        return rows[0][0] if rows else None
 
     def get_unprocessed_uids(self, all_uids: list[int]) -> list[int]:
         """Filter out already-processed UIDs.
@@ -214,19 +627,93 @@ class ManifestManager:
         Returns:
             List of UIDs not yet processed or not completed.
         """
-        # Get all completed email_ids
-        completed = self.get_entries_by_status("completed")
-        completed_uids = {e.imap_uid for e in completed}
-
+        completed_uids = self._completed_among("imap_uid", list(all_uids))
         return [uid for uid in all_uids if uid not in completed_uids]
 
+    def get_processed_ids(self, email_ids: Iterable[str]) -> set[str]:
+        """Find which of many emails have been processed, in bulk.
+
+        Equivalent to calling is_processed() for each ID, but with one
+        query per few hundred IDs instead of one per email.
+
+        Args:
+            email_ids: Gmail message IDs to check.
+
+        Returns:
+            The subset of email_ids with completed status.
+        """
+        return self._completed_among("email_id", list(email_ids))
+
+    def _completed_among(self, column: str, values: list[Any]) -> set[Any]:
+        """Find which values of an indexed column belong to completed entries.
+
+        Probes the index for just the candidates rather than reading every
+        completed row, in chunks that stay under SQLite's parameter limit.
+
+        Args:
+            column: "email_id" or "imap_uid".
+            values: Candidate values.
+
+        Returns:
+            Values that have a completed entry.
+        """
+        found: set[Any] = set()
+        with self._lock:
+            for start in range(0, len(values), _SQL_PARAM_LIMIT):
+                chunk = values[start : start + _SQL_PARAM_LIMIT]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._db.execute(
+                    f"SELECT {column} FROM emails "
+                    f"WHERE status = 'completed' AND {column} IN ({placeholders})",
+                    chunk,
+                )
+                found.update(value for (value,) in cursor)
+        return found
+
     def get_all_entries(self) -> list[ManifestEntry]:
         """Get all manifest entries.
 
         Returns:
             List of all ManifestEntry objects.
         """
-        return [ManifestEntry.from_dict(r) for r in self._emails.all()]
+        rows = self._query("SELECT payload FROM emails ORDER BY rowid")
+        return [ManifestEntry.from_dict(_loads(payload)) for (payload,) in rows]
+
+    def _iter_entries(self) -> Iterator[ManifestEntry]:
+        """Yield all manifest entries without loading them all at once.
+
+        Yields:
+            ManifestEntry objects in insertion order.
+        """
+        return map(ManifestEntry.from_dict, self._iter_payloads())
+
+    def _iter_payloads(self) -> Iterator[dict[str, Any]]:
+        """Yield all stored entry dictionaries without loading them all at once.
+
+        The email IDs are listed first, then payloads are loaded a chunk at
+        a time, so _lock is never held while the caller consumes rows. An
+        entry updated meanwhile keeps its place (REPLACE gives it a new
+        rowid); one deleted meanwhile is skipped.
+
+        Yields:
+            ManifestEntry.to_dict() dictionaries in insertion order.
+        """
+        email_ids = [
+            email_id for (email_id,) in self._query("SELECT email_id FROM emails ORDER BY rowid")
+        ]
+        for start in range(0, len(email_ids), _SQL_PARAM_LIMIT):
+            chunk = email_ids[start : start + _SQL_PARAM_LIMIT]
+            placeholders = ",".join("?" * len(chunk))
+            payloads = dict(
+                self._query(
+                    f"SELECT email_id, payload FROM emails WHERE email_id IN ({placeholders})",
+                    tuple(chunk),
+                )
+            )
+            for email_id in chunk:
+                payload = payloads.get(email_id)
+                if payload is not None:
+                    yield _loads(payload)
 
     def get_processing_stats(self) -> dict[str, Any]:
         """Get summary statistics from manifest.
@@ -234,30 +721,8 @@ class ManifestManager:
         Returns:
             Dictionary with processing statistics.
         """
-        all_entries = self._emails.all()
-
-        stats = {
-            "total": len(all_entries),
-            "by_status": {},
-            "total_original_size": 0,
-            "total_stripped_size": 0,
-            "total_attachments": 0,
-            "total_savings": 0,
-        }
-
-        for entry in all_entries:
-            # Count by status
-            status = entry.get("status", "unknown")
-            stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-
-            # Sum sizes
-            stats["total_original_size"] += entry.get("original_size", 0)
-            stripped = entry.get("stripped_size")
-            if stripped:
-                stats["total_stripped_size"] += stripped
-
-            # Count attachments
-            stats["total_attachments"] += len(entry.get("attachments", []))
+        with self._lock:
+            stats = self._read_stats(self._db)
 
         # Calculate savings
         stats["total_savings"] = stats["total_original_size"] - stats["total_stripped_size"]
@@ -265,61 +730,43 @@ class ManifestManager:
         return stats
 
     def export_manifest(self, path: Path, format: str = "json") -> None:
-        """Export manifest to JSON or CSV.
+        """Export manifest to JSON, JSON Lines or CSV.
+
+        A "json" export to a path ending in .jsonl is written as JSON Lines,
+        one compact object per line.
 
         Args:
             path: Output file path.
-            format: Export format ("json" or "csv").
+            format: Export format ("json", "jsonl" or "csv").
         """
-        entries = self.get_all_entries()
-
-        if format == "json":
-            import json
-
-            data = [e.to_dict() for e in entries]
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+        if format == "json" and Path(path).suffix.lower() == ".jsonl":
+            format = "jsonl"
+
+        # JSON exports stream entries from the database a chunk of rows at a time
+        if format == "jsonl":
+            with open(path, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+                f.writelines(_dumps(entry.to_dict()) + b"\n" for entry in self._iter_entries())
+
+        elif format == "json":
+            with open(path, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+                # Same layout as json.dump(list, indent=2), written per entry
+                separator = b"[\n  "
+                for entry in self._iter_entries():
+                    f.write(separator)
+                    f.write(_dumps_indented(entry.to_dict()).replace(b"\n", b"\n  "))
+                    separator = b",\n  "
+                f.write(b"[]" if separator == b"[\n  " else b"\n]")
 
         elif format == "csv":
             import csv
 
-            with open(path, "w", encoding="utf-8", newline="") as f:
+            with open(
+                path, "w", encoding="utf-8", newline="", buffering=_EXPORT_BUFFER_SIZE
+            ) as f:
                 writer = csv.writer(f)
-                # Header
-                writer.writerow(
-                    [
-                        "email_id",
-                        "imap_uid",
-                        "subject",
-                        "sender",
-                        "date",
-                        "labels",
-                        "attachment_count",
-                        "processed_at",
-                        "status",
-                        "original_size",
-                        "stripped_size",
-                        "error_message",
-                    ]
-                )
-                # Data
-                for entry in entries:
-                    writer.writerow(
-                        [
-                            entry.email_id,
-                            entry.imap_uid,
-                            entry.subject,
-                            entry.sender,
-                            entry.date.isoformat(),
-                            ";".join(entry.labels),
-                            len(entry.attachments),
-                            entry.processed_at.isoformat(),
-                            entry.status,
-                            entry.original_size,
-                            entry.stripped_size or "",
-                            entry.error_message or "",
-                        ]
-                    )
+                writer.writerow(ManifestEntry.CSV_FIELDS)
+                # Rows come straight from the stored dicts, dates already formatted
+                writer.writerows(map(ManifestEntry.csv_row_from_dict, self._iter_payloads()))
 
     def delete_entry(self, email_id: str) -> bool:
         """Delete manifest entry.
@@ -330,17 +777,44 @@ class ManifestManager:
         Returns:
             True if entry was deleted.
         """
-        Email = Query()
-        result = self._emails.remove(Email.email_id == email_id)
-        return len(result) > 0
+        with self._write() as db:
+            old = self._load_entry(db, email_id)
+            if old is None:
+                return False
+            self._save_entry(db, email_id, old, None)
+        return True
 
     def clear(self) -> None:
         """Clear all manifest entries."""
-        self._emails.truncate()
+        with self._write() as db:
+            db.execute("DELETE FROM emails")
+            db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (_STATS_KEY, json.dumps(_empty_stats())),
+            )
+
+    def backup_to(self, path: Path) -> None:
+        """Write a consistent snapshot of the manifest to a database file.
+
+        Uses SQLite's online backup, so it works for in-memory manifests
+        and while other threads keep writing.
+
+        Args:
+            path: Destination SQLite file, replaced if it exists.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        target = sqlite3.connect(path)
+        try:
+            with self._lock:
+                self._db.backup(target)
+        finally:
+            target.close()
 
     def close(self) -> None:
         """Close database connection."""
-        self._db.close()
+        with self._lock:
+            self._db.close()
 
     def __enter__(self) -> "ManifestManager":
         """Context manager entry."""
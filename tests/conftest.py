@@ -1,16 +1,19 @@
 """Pytest configuration and shared fixtures."""
 
-import pytest
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.models.email import (
     AttachmentInfo,
     EmailHeader,
     EmailScanResult,
     GmailMetadata,
 )
+from src.utils.manifest import ManifestManager
 
 
 @pytest.fixture
@@ -93,7 +96,26 @@ def temp_backup_dir(tmp_path: Path) -> Path:
 @pytest.fixture
 def temp_manifest_path(tmp_path: Path) -> Path:
     """Create a temporary manifest path for testing."""
-    return tmp_path / "manifest.json"
+    return tmp_path / "manifest.db"
+
+
+@pytest.fixture(scope="session")
+def session_manifest() -> Iterator[ManifestManager]:
+    """Open one in-memory manifest database for the whole test session."""
+    manifest = ManifestManager(ManifestManager.MEMORY)
+    yield manifest
+    manifest.close()
+
+
+@pytest.fixture
+def manifest(session_manifest: ManifestManager) -> Iterator[ManifestManager]:
+    """Provide the session manifest with each test's changes rolled back afterwards.
+
+    Tests that reopen the database or check transaction boundaries should
+    use temp_manifest_path instead.
+    """
+    with session_manifest.rolled_back():
+        yield session_manifest
 
 
 @pytest.fixture
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from src.models.email import EmailHeader
 from src.processor.backup import BackupManager
+from src.utils import hashing
 
 
 class TestBackupManager:
@@ -108,3 +109,37 @@ class TestBackupManager:
 
         # Should fail verification
         assert manager.verify_backup(saved) is False
+
+    def test_save_attachment_hashes_in_memory_data(
+        self, temp_backup_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the saved hash comes from the buffer, not from reading the file back."""
+        monkeypatch.setattr(hashing, "compute_file_hash", None)  # Would fail if called
+        manager = BackupManager(temp_backup_dir)
+
+        saved = manager.save_attachment(
+            data=b"in memory",
+            path=temp_backup_dir / "memory.txt",
+            original_filename="memory.txt",
+            content_type="text/plain",
+        )
+
+        assert saved.sha256_hash == hashing.compute_sha256(b"in memory")
+
+    def test_verify_backups_returns_failures(self, temp_backup_dir: Path):
+        """Test batch verification reports only corrupted or missing backups."""
+        manager = BackupManager(temp_backup_dir)
+        saved = [
+            manager.save_attachment(
+                data=f"content {i}".encode(),
+                path=temp_backup_dir / f"batch_{i}.txt",
+                original_filename=f"batch_{i}.txt",
+                content_type="text/plain",
+            )
+            for i in range(3)
+        ]
+
+        (temp_backup_dir / "batch_1.txt").write_bytes(b"corrupted content")
+        (temp_backup_dir / "batch_2.txt").unlink()
+
+        assert manager.verify_backups(saved) == saved[1:]
@@ -0,0 +1,43 @@
+"""Tests for batch processing."""
+
+from src.models.email import AttachmentInfo, EmailHeader, EmailScanResult, GmailMetadata
+from src.processor.batch import BatchPreview
+
+
+class TestBatchPreview:
+    """Tests for BatchPreview class."""
+
+    def test_generate_summary_counts_each_category(
+        self, sample_email_header: EmailHeader, sample_gmail_metadata: GmailMetadata
+    ):
+        """Test processable, encrypted and inline-only emails are counted correctly."""
+        pdf = AttachmentInfo("doc.pdf", "application/pdf", 2048, "attachment", "2")
+        logo = AttachmentInfo("logo.png", "image/png", 512, "inline", "3")
+
+        def result(attachments: list[AttachmentInfo], encrypted: bool = False) -> EmailScanResult:
+            return EmailScanResult(
+                header=sample_email_header,
+                gmail_metadata=sample_gmail_metadata,
+                attachments=attachments,
+                is_encrypted=encrypted,
+            )
+
+        preview = BatchPreview(
+            [
+                result([pdf, pdf, logo]),
+                result([pdf], encrypted=True),
+                result([logo], encrypted=True),
+                result([logo]),
+                result([]),
+            ]
+        )
+
+        summary = preview.generate_summary()
+
+        assert summary["total_emails"] == 5
+        assert summary["processable"] == 1
+        assert summary["encrypted_skipped"] == 2
+        assert summary["inline_only_skipped"] == 2
+        assert summary["total_attachments"] == 2
+        assert summary["estimated_savings_bytes"] == 4096
+        assert summary["estimated_savings_human"] == "4.0 KB"
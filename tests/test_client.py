@@ -0,0 +1,69 @@
+"""Tests for the Gmail IMAP client."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.imap.client import GmailIMAPClient, IMAPConnectionError, _uid_set
+
+
+@pytest.fixture
+def client() -> GmailIMAPClient:
+    """Create a client with a mock connection."""
+    client = GmailIMAPClient(MagicMock(), "user@example.com", operation_delay=0)
+    client._connection = MagicMock()
+    client._connection.select.return_value = ("OK", [b"42"])
+    return client
+
+
+class TestGmailIMAPClient:
+    """Tests for GmailIMAPClient class."""
+
+    def test_select_folder_cached_skips_reselect(self, client: GmailIMAPClient):
+        """Test re-selecting the same folder and mode is a no-op."""
+        client.select_folder_cached("[Gmail]/All Mail", readonly=False)
+
+        count = client.select_folder_cached("[Gmail]/All Mail", readonly=False)
+
+        assert count == 42
+        client._connection.select.assert_called_once()
+
+    def test_select_folder_cached_reselects_on_mode_change(self, client: GmailIMAPClient):
+        """Test a different readonly flag issues a new SELECT."""
+        client.select_folder_cached("[Gmail]/Trash", readonly=True)
+        client.select_folder_cached("[Gmail]/Trash", readonly=False)
+
+        assert client._connection.select.call_count == 2
+
+    def test_failed_select_clears_selection(self, client: GmailIMAPClient):
+        """Test a failed SELECT isn't treated as cached."""
+        client.select_folder_cached("[Gmail]/Trash", readonly=True)
+        client._connection.select.return_value = ("NO", [b"nope"])
+
+        with pytest.raises(IMAPConnectionError):
+            client.select_folder("[Gmail]/Trash", readonly=True)
+        client._connection.select.return_value = ("OK", [b"1"])
+        client.select_folder_cached("[Gmail]/Trash", readonly=True)
+
+        assert client._connection.select.call_count == 3
+
+    def test_uid_set_compresses_ranges(self):
+        """Test UIDs are formatted as a compact sequence set."""
+        assert _uid_set([110, 100, 101, 102, 105, 101]) == "100:102,105,110"
+        assert _uid_set([7]) == "7"
+
+    def test_has_capability_reads_cached_capabilities(self, client: GmailIMAPClient):
+        """Test capabilities come from the connection without a round trip."""
+        client._connection.capabilities = ("IMAP4REV1", "UIDPLUS", "X-GM-EXT-1")
+
+        assert client.has_capability("uidplus")
+        assert client.has_capability(GmailIMAPClient.GMAIL_EXTENSION_CAPABILITY)
+        assert not client.has_capability("MOVE")
+
+    def test_uid_copy_returns_copyuid(self, client: GmailIMAPClient):
+        """Test the destination UID is read from the COPYUID response code."""
+        client.select_folder("[Gmail]/Trash", readonly=False)
+        client._connection.uid.return_value = ("OK", [b"[COPYUID 11 5 321] (Success)"])
+
+        assert client.uid_copy(5, "[Gmail]/All Mail") == 321
+        client._connection.uid.assert_called_once_with("COPY", "5", '"[Gmail]/All Mail"')
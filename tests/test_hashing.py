@@ -0,0 +1,159 @@
+"""Tests for hashing utilities."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from src.utils import hashing
+from src.utils.hashing import (
+    compute_file_hash,
+    compute_file_hashes,
+    compute_sha256,
+    content_digest,
+    invalidate_hash_cache,
+    short_hash,
+    verify_file_hash,
+    verify_file_hashes,
+    verify_hash,
+)
+
+
+class TestComputeFileHash:
+    """Tests for compute_file_hash."""
+
+    @pytest.mark.parametrize("size", [0, 100, 70 * 1024, 3 * 1024 * 1024 + 5, 5 * 1024 * 1024])
+    def test_matches_hashlib_across_read_strategies(self, tmp_path: Path, size: int):
+        """Test single-read, chunked and mmap paths all hash the full file."""
+        data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+        path = tmp_path / "blob.bin"
+        path.write_bytes(data)
+        expected = f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+        assert compute_file_hash(path) == expected
+        assert compute_file_hash(path, chunk_size=4096) == expected
+
+    def test_mmap_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test files above the mmap threshold are hashed correctly."""
+        monkeypatch.setattr(hashing, "MMAP_FILE_SIZE", 128 * 1024)
+        data = b"attachment" * 20_000
+        path = tmp_path / "large.bin"
+        path.write_bytes(data)
+
+        assert compute_file_hash(path) == f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+    def test_cached_until_file_changes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test an unchanged file is served from the cache and a rewrite is rehashed."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"first")
+        first = compute_file_hash(path)
+
+        monkeypatch.setattr(hashing.hashlib, "sha256", None)  # Would fail if called
+        assert compute_file_hash(path) == first
+        monkeypatch.undo()
+
+        invalidate_hash_cache(path)
+        path.write_bytes(b"second!")
+        assert compute_file_hash(path) == compute_sha256(b"second!")
+
+
+    def test_large_file_released_from_page_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test large files get a DONTNEED hint after hashing, small ones don't."""
+        calls = []
+        monkeypatch.setattr(hashing, "_fadvise", lambda fd, advice: calls.append(advice))
+        monkeypatch.setattr(hashing, "MMAP_FILE_SIZE", 128 * 1024)
+        small = tmp_path / "small.bin"
+        large = tmp_path / "large.bin"
+        small.write_bytes(b"s" * 100)
+        large.write_bytes(b"l" * 200_000)
+
+        compute_file_hash(small)
+        assert calls == []
+        compute_file_hash(large)
+        assert calls == ["POSIX_FADV_DONTNEED"]
+
+
+class TestComputeFileHashes:
+    """Tests for compute_file_hashes and verify_file_hashes."""
+
+    def test_hashes_files_in_parallel_and_skips_missing(self, tmp_path: Path):
+        """Test each readable file is hashed and unreadable ones are left out."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"file{i}.bin"
+            path.write_bytes(bytes([i]) * 1000)
+            paths.append(path)
+        missing = tmp_path / "missing.bin"
+
+        hashes = compute_file_hashes(paths + [missing], max_workers=2)
+
+        assert hashes == {path: compute_sha256(path.read_bytes()) for path in paths}
+
+    def test_verify_file_hashes(self, tmp_path: Path):
+        """Test matches, mismatches, malformed hashes and missing files."""
+        good = tmp_path / "good.bin"
+        bad = tmp_path / "bad.bin"
+        good.write_bytes(b"good")
+        bad.write_bytes(b"bad")
+
+        results = verify_file_hashes(
+            {
+                good: compute_sha256(b"good"),
+                bad: compute_sha256(b"good"),
+                tmp_path / "missing.bin": compute_sha256(b"good"),
+                tmp_path / "malformed.bin": "md5:abc",
+            }
+        )
+
+        assert list(results.values()) == [True, False, False, False]
+
+
+class TestVerifyHash:
+    """Tests for verify_hash and verify_file_hash."""
+
+    def test_malformed_expected_hash_skips_hashing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a malformed expected hash is rejected without reading the file."""
+        monkeypatch.setattr(hashing, "compute_file_hash", None)  # Would fail if called
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"data")
+
+        assert not verify_file_hash(path, "md5:abc")
+        assert not verify_file_hash(path, "sha256:" + "0" * 10)
+        assert not verify_file_hash(path, "sha256:" + "é" * 64)
+
+    def test_non_hex_expected_hash_is_rejected(self, tmp_path: Path):
+        """Test non-ASCII or non-hex digests return False rather than raising."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"x")
+
+        assert not verify_hash(b"x", "sha256:" + "é" * 64)
+        assert not verify_hash(b"x", "sha256:" + "g" * 64)
+        assert verify_file_hashes({path: "sha256:" + "é" * 64}) == {path: False}
+
+    def test_matching_hash(self, tmp_path: Path):
+        """Test correct hashes verify and wrong ones don't."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"data")
+        expected = compute_sha256(b"data")
+
+        assert verify_hash(b"data", expected)
+        assert verify_file_hash(path, expected)
+        assert not verify_hash(b"other", expected)
+
+
+class TestContentDigest:
+    """Tests for content_digest and short_hash."""
+
+    def test_digest_is_stable_and_distinguishes_content(self):
+        """Test equal data gives equal 32-byte digests and different data doesn't."""
+        digest = content_digest(b"attachment")
+
+        assert len(digest) == 32
+        assert content_digest(bytearray(b"attachment")) == digest
+        assert content_digest(b"attachment!") != digest
+        assert short_hash(b"attachment") == digest.hex()[:8]
+        assert len(short_hash(b"attachment", length=12)) == 12
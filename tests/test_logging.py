@@ -0,0 +1,63 @@
+"""Tests for structured operation logging."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from src.utils.logging import OperationLogger, now_iso
+
+
+class TestNowIso:
+    """Tests for now_iso."""
+
+    def test_matches_datetime_isoformat(self):
+        """Test the cached timestamp parses and matches the current time."""
+        before = datetime.now()
+        stamp = now_iso()
+        after = datetime.now()
+
+        assert len(stamp) == len("2024-01-15T10:30:00.123456")
+        assert before.replace(microsecond=0) <= datetime.fromisoformat(stamp) <= after
+
+
+class TestOperationLogger:
+    """Tests for OperationLogger class."""
+
+    def test_entries_written_as_compact_jsonl(self, tmp_path: Path):
+        """Test each call appends one compact JSON line to the open file."""
+        log_path = tmp_path / "logs" / "operations.jsonl"
+        op_logger = OperationLogger(log_path)
+
+        op_logger.log_batch_start(2)
+        op_logger.log_operation("process", "email-1", success=True, details={"saved": 10})
+        op_logger.log_batch_complete(1, 0, 1, 10, 0.5)
+        op_logger.close()
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert [e.get("event", e.get("operation")) for e in entries] == [
+            "batch_start",
+            "process",
+            "batch_complete",
+        ]
+        assert entries[1]["details"] == {"saved": 10}
+        assert all(", " not in line and '": ' not in line for line in lines)
+
+    def test_entries_buffered_until_threshold_or_batch_complete(self, tmp_path: Path):
+        """Test entries stay buffered until the entry limit or batch end."""
+        log_path = tmp_path / "operations.jsonl"
+        op_logger = OperationLogger(log_path)
+        op_logger.BUFFER_ENTRIES = 3
+        op_logger.FLUSH_INTERVAL = float("inf")
+
+        op_logger.log_operation("process", "email-1", success=True)
+        op_logger.log_operation("process", "email-2", success=True)
+        assert log_path.read_bytes() == b""
+
+        op_logger.log_operation("process", "email-3", success=False)
+        assert len(log_path.read_bytes().splitlines()) == 3
+
+        op_logger.log_operation("process", "email-4", success=True)
+        op_logger.log_batch_complete(3, 1, 0, 0, 1.0)
+        assert len(log_path.read_bytes().splitlines()) == 5
+        op_logger.close()
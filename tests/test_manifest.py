@@ -1,190 +1,484 @@
 """Tests for manifest management."""
 
+import json
+import threading
 import pytest
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+from src.models.email import ManifestEntry
 from src.utils.manifest import ManifestManager
 
+# Fixed email date so entries and exports are deterministic
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _record(email_id: str, **overrides: Any) -> dict[str, Any]:
+    """Build record_extraction() arguments for a minimal entry."""
+    return {
+        "email_id": email_id,
+        "imap_uid": 1,
+        "subject": "Test",
+        "sender": "test@example.com",
+        "date": _FIXED_NOW,
+        "labels": [],
+        "attachments": [],
+        "original_size": 1024,
+        **overrides,
+    }
+
+
+def _check_get_entry(manifest: ManifestManager, tmp_path: Path) -> None:
+    entry = manifest.get_entry("single")
+    assert entry is not None
+    assert entry.email_id == "single"
+
+    # Non-existent entry
+    assert manifest.get_entry("nonexistent") is None
+
+
+def _check_update_status(manifest: ManifestManager, tmp_path: Path) -> None:
+    manifest.update_status("single", "completed", stripped_size=512)
+
+    entry = manifest.get_entry("single")
+    assert entry.status == "completed"
+    assert entry.stripped_size == 512
+
+
+def _check_is_processed(manifest: ManifestManager, tmp_path: Path) -> None:
+    # Not completed yet, or not in the manifest at all
+    assert manifest.is_processed("single") is False
+    assert manifest.is_processed("missing") is False
+
+    manifest.update_status("single", "completed")
+    assert manifest.is_processed("single") is True
+
+
+def _check_export_json(manifest: ManifestManager, tmp_path: Path) -> None:
+    export_path = tmp_path / "export.json"
+    manifest.export_manifest(export_path, format="json")
+
+    assert "single" in export_path.read_text()
+
+
+def _check_export_csv(manifest: ManifestManager, tmp_path: Path) -> None:
+    export_path = tmp_path / "export.csv"
+    manifest.export_manifest(export_path, format="csv")
+
+    content = export_path.read_text()
+    assert "single" in content
+    assert "Single Subject" in content
+
 
 class TestManifestManager:
     """Tests for ManifestManager class."""
 
-    def test_record_extraction(self, temp_manifest_path: Path):
+    @pytest.mark.parametrize(
+        "check",
+        [
+            _check_get_entry,
+            _check_update_status,
+            _check_is_processed,
+            _check_export_json,
+            _check_export_csv,
+        ],
+        ids=lambda check: check.__name__.removeprefix("_check_"),
+    )
+    def test_single_entry_operations(
+        self,
+        manifest: ManifestManager,
+        tmp_path: Path,
+        check: Callable[[ManifestManager, Path], None],
+    ):
+        """Test lookups, updates and exports against one recorded entry."""
+        manifest.record_extraction(**_record("single", subject="Single Subject"))
+
+        check(manifest, tmp_path)
+
+    def test_record_extraction(self, manifest: ManifestManager):
         """Test recording an extraction."""
-        with ManifestManager(temp_manifest_path) as manifest:
-            entry = manifest.record_extraction(
-                email_id="123456",
-                imap_uid=789,
-                subject="Test Subject",
+        entry = manifest.record_extraction(
+            email_id="123456",
+            imap_uid=789,
+            subject="Test Subject",
+            sender="test@example.com",
+            date=datetime(2024, 1, 15),
+            labels=["INBOX", "Important"],
+            attachments=[{"filename": "test.pdf", "size": 1024}],
+            original_size=10240,
+        )
+
+        assert entry.email_id == "123456"
+        assert entry.status == "extracted"
+
+    def test_get_entries_by_status(self, manifest: ManifestManager):
+        """Test filtering entries by status."""
+        # Create multiple entries with different statuses
+        manifest.record_extractions(
+            {
+                "email_id": f"test{i}",
+                "imap_uid": i,
+                "subject": f"Test {i}",
+                "sender": "test@example.com",
+                "date": _FIXED_NOW,
+                "labels": [],
+                "attachments": [],
+                "original_size": 1024,
+            }
+            for i in range(5)
+        )
+
+        # Update some to completed
+        manifest.update_status("test0", "completed")
+        manifest.update_status("test1", "completed")
+        manifest.update_status("test2", "failed")
+
+        # Query by status
+        completed = manifest.get_entries_by_status("completed")
+        assert len(completed) == 2
+
+        failed = manifest.get_entries_by_status("failed")
+        assert len(failed) == 1
+
+        extracted = manifest.get_entries_by_status("extracted")
+        assert len(extracted) == 2
+
+    def test_status_query_uses_index(self, manifest: ManifestManager):
+        """Test status filtering is an index search with no sort step."""
+        plan = manifest._db.execute(
+            "EXPLAIN QUERY PLAN SELECT payload FROM emails WHERE status = ? ORDER BY rowid",
+            ("completed",),
+        ).fetchall()
+        details = [row[-1] for row in plan]
+
+        assert details == ["SEARCH emails USING INDEX emails_status (status=?)"]
+
+    def test_get_entries_by_status_cached_until_write(self, manifest: ManifestManager):
+        """Test repeated status queries hit the cache and writes invalidate it."""
+        manifest.record_extraction(**_record("cached"))
+        first = manifest.get_entries_by_status("extracted")
+        second = manifest.get_entries_by_status("extracted")
+
+        assert second == first and second is not first
+        assert second[0] is first[0]
+
+        manifest.update_status("cached", "completed")
+        assert manifest.get_entries_by_status("extracted") == []
+        assert [e.email_id for e in manifest.get_entries_by_status("completed")] == ["cached"]
+
+    def test_get_processing_stats(self, manifest: ManifestManager):
+        """Test getting processing statistics."""
+        # Create entries
+        manifest.record_extractions(
+            {
+                "email_id": f"stats{i}",
+                "imap_uid": i,
+                "subject": f"Test {i}",
+                "sender": "test@example.com",
+                "date": _FIXED_NOW,
+                "labels": [],
+                "attachments": [{"filename": "test.pdf"}],
+                "original_size": 1024 * (i + 1),
+            }
+            for i in range(10)
+        )
+
+        stats = manifest.get_processing_stats()
+
+        assert stats["total"] == 10
+        assert stats["total_attachments"] == 10
+        assert stats["total_original_size"] > 0
+
+    def test_record_extractions_replaces_duplicates(self, manifest: ManifestManager):
+        """Test a bulk insert upserts like repeated record_extraction calls."""
+        record = _record("dup", original_size=1000)
+        manifest.record_extraction(**record)
+
+        entries = manifest.record_extractions(
+            [{**record, "original_size": 2000}, {**record, "original_size": 3000}]
+        )
+
+        assert [e.original_size for e in entries] == [2000, 3000]
+        assert manifest.get_entry("dup").original_size == 3000
+        stats = manifest.get_processing_stats()
+        assert (stats["total"], stats["total_original_size"]) == (1, 3000)
+        assert manifest.record_extractions([]) == []
+
+    def test_processing_stats_track_updates(self, manifest: ManifestManager):
+        """Test stored statistics follow updates and match a full rescan."""
+        for i in range(4):
+            manifest.record_extraction(
+                email_id=f"delta{i}",
+                imap_uid=i,
+                subject=f"Test {i}",
                 sender="test@example.com",
-                date=datetime(2024, 1, 15),
-                labels=["INBOX", "Important"],
-                attachments=[{"filename": "test.pdf", "size": 1024}],
-                original_size=10240,
+                date=_FIXED_NOW,
+                labels=[],
+                attachments=[{"filename": "a.pdf"}, {"filename": "b.pdf"}],
+                original_size=1000,
             )
+        manifest.update_status("delta0", "completed", stripped_size=100)
+        manifest.update_status("delta1", "completed", stripped_size=200)
+        manifest.mark_reverted("delta1")
+        manifest.delete_entry("delta3")
 
-            assert entry.email_id == "123456"
-            assert entry.status == "extracted"
+        stats = manifest.get_processing_stats()
+        assert stats == {
+            "total": 3,
+            "by_status": {"extracted": 1, "completed": 1, "reverted": 1},
+            "total_original_size": 3000,
+            "total_stripped_size": 300,
+            "total_attachments": 6,
+            "total_savings": 2700,
+        }
 
-    def test_get_entry(self, temp_manifest_path: Path):
-        """Test retrieving an entry."""
-        with ManifestManager(temp_manifest_path) as manifest:
-            # Record an entry
+        manifest._db.execute("DELETE FROM meta")
+        rescanned = manifest.get_processing_stats()
+        assert rescanned == stats
+        assert all(type(value) is int for key, value in rescanned.items() if key != "by_status")
+
+        manifest.clear()
+        assert manifest.get_processing_stats()["total"] == 0
+
+    def test_export_manifest_json_matches_list_dump(
+        self, manifest: ManifestManager, tmp_path: Path
+    ):
+        """Test the streamed JSON export has the same layout as dumping a list."""
+        export_path = tmp_path / "export.json"
+        manifest.export_manifest(export_path, format="json")
+        assert export_path.read_text() == "[]"
+
+        for i in range(2):
             manifest.record_extraction(
-                email_id="test123",
-                imap_uid=456,
+                email_id=f"stream{i}",
+                imap_uid=i,
                 subject="Test",
                 sender="test@example.com",
-                date=datetime.now(),
-                labels=[],
-                attachments=[],
+                date=datetime(2024, 1, 15),
+                labels=["INBOX"],
+                attachments=[{"filename": "a.pdf"}],
                 original_size=1024,
             )
+        manifest.export_manifest(export_path, format="json")
 
-            # Retrieve it
-            entry = manifest.get_entry("test123")
-            assert entry is not None
-            assert entry.email_id == "test123"
+        expected = [e.to_dict() for e in manifest.get_all_entries()]
+        assert export_path.read_text() == json.dumps(expected, indent=2, default=str)
 
-            # Non-existent entry
-            assert manifest.get_entry("nonexistent") is None
-
-    def test_update_status(self, temp_manifest_path: Path):
-        """Test updating entry status."""
-        with ManifestManager(temp_manifest_path) as manifest:
+    def test_export_manifest_jsonl(self, manifest: ManifestManager, tmp_path: Path):
+        """Test a .jsonl path gets one compact entry per line."""
+        for i in range(3):
             manifest.record_extraction(
-                email_id="status_test",
-                imap_uid=1,
+                email_id=f"line{i}",
+                imap_uid=i,
                 subject="Test",
                 sender="test@example.com",
-                date=datetime.now(),
-                labels=[],
+                date=datetime(2024, 1, 15),
+                labels=["INBOX"],
                 attachments=[],
                 original_size=1024,
             )
 
-            # Update status
-            manifest.update_status("status_test", "completed", stripped_size=512)
+        export_path = tmp_path / "export.jsonl"
+        manifest.export_manifest(export_path)
 
-            # Verify update
-            entry = manifest.get_entry("status_test")
-            assert entry.status == "completed"
-            assert entry.stripped_size == 512
+        lines = export_path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            e.to_dict() for e in manifest.get_all_entries()
+        ]
+        assert all(", " not in line for line in lines)
 
-    def test_get_entries_by_status(self, temp_manifest_path: Path):
-        """Test filtering entries by status."""
+    def test_lookups_after_reopen(self, temp_manifest_path: Path):
+        """Test entries persist and are found by UID and status after reopening."""
         with ManifestManager(temp_manifest_path) as manifest:
-            # Create multiple entries with different statuses
-            for i in range(5):
+            for i in range(3):
                 manifest.record_extraction(
-                    email_id=f"test{i}",
-                    imap_uid=i,
+                    email_id=f"reopen{i}",
+                    imap_uid=100 + i,
                     subject=f"Test {i}",
                     sender="test@example.com",
-                    date=datetime.now(),
+                    date=_FIXED_NOW,
                     labels=[],
                     attachments=[],
                     original_size=1024,
                 )
+            manifest.update_status("reopen1", "completed", original_message_id="<r1@x>")
 
-            # Update some to completed
-            manifest.update_status("test0", "completed")
-            manifest.update_status("test1", "completed")
-            manifest.update_status("test2", "failed")
-
-            # Query by status
-            completed = manifest.get_entries_by_status("completed")
-            assert len(completed) == 2
-
-            failed = manifest.get_entries_by_status("failed")
-            assert len(failed) == 1
-
-            extracted = manifest.get_entries_by_status("extracted")
-            assert len(extracted) == 2
-
-    def test_is_processed(self, temp_manifest_path: Path):
-        """Test checking if email is processed."""
         with ManifestManager(temp_manifest_path) as manifest:
+            assert manifest.get_entry_by_uid(101).email_id == "reopen1"
+            assert manifest.get_unprocessed_uids([100, 101, 102]) == [100, 102]
+            assert [e.email_id for e in manifest.get_revertible_entries()] == ["reopen1"]
+            assert manifest.mark_reverted("reopen1", new_uid=500)
+            assert not manifest.mark_reverted("missing")
+            assert manifest.get_entry("reopen1").status == "reverted"
+
+    def test_get_unprocessed_uids_spans_parameter_chunks(self, manifest: ManifestManager):
+        """Test candidate lists longer than one SQL statement are filtered fully."""
+        for uid in (5, 1500):
             manifest.record_extraction(
-                email_id="processed_test",
-                imap_uid=1,
+                email_id=f"uid{uid}",
+                imap_uid=uid,
                 subject="Test",
                 sender="test@example.com",
-                date=datetime.now(),
+                date=_FIXED_NOW,
                 labels=[],
                 attachments=[],
                 original_size=1024,
+                status="completed",
             )
 
-            # Not completed yet
-            assert manifest.is_processed("processed_test") is False
+        unprocessed = manifest.get_unprocessed_uids(list(range(2000)))
 
-            # Mark as completed
-            manifest.update_status("processed_test", "completed")
-            assert manifest.is_processed("processed_test") is True
+        assert len(unprocessed) == 1998
+        assert 5 not in unprocessed and 1500 not in unprocessed
 
-    def test_get_processing_stats(self, temp_manifest_path: Path):
-        """Test getting processing statistics."""
+    def test_get_processed_ids_matches_is_processed(self, manifest: ManifestManager):
+        """Test the bulk lookup agrees with is_processed across parameter chunks."""
+        manifest.record_extractions(
+            _record(f"bulk{i}", imap_uid=i, status="completed" if i % 2 else "extracted")
+            for i in range(1000)
+        )
+        candidates = [f"bulk{i}" for i in range(1000)] + ["missing"]
+
+        processed = manifest.get_processed_ids(candidates)
+
+        assert processed == {eid for eid in candidates if manifest.is_processed(eid)}
+        assert len(processed) == 500
+
+    def test_connection_pragmas(self, temp_manifest_path: Path):
+        """Test WAL with the requested sync level and in-memory temp storage."""
         with ManifestManager(temp_manifest_path) as manifest:
-            # Create entries
-            for i in range(10):
-                manifest.record_extraction(
-                    email_id=f"stats{i}",
-                    imap_uid=i,
-                    subject=f"Test {i}",
-                    sender="test@example.com",
-                    date=datetime.now(),
-                    labels=[],
-                    attachments=[{"filename": "test.pdf"}],
-                    original_size=1024 * (i + 1),
-                )
+            pragmas = [
+                manifest._db.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in ("journal_mode", "synchronous", "temp_store", "cache_size")
+            ]
+            assert pragmas == ["wal", 1, 2, -20000]  # synchronous=NORMAL, temp_store=MEMORY
 
-            stats = manifest.get_processing_stats()
+        with ManifestManager(temp_manifest_path, durability="full") as manifest:
+            assert manifest._db.execute("PRAGMA synchronous").fetchone()[0] == 2
 
-            assert stats["total"] == 10
-            assert stats["total_attachments"] == 10
-            assert stats["total_original_size"] > 0
+        with pytest.raises(ValueError):
+            ManifestManager(temp_manifest_path, durability="off")
 
-    def test_export_manifest_json(self, temp_manifest_path: Path, tmp_path: Path):
-        """Test exporting manifest to JSON."""
+    def test_batch_commits_writes_together(self, temp_manifest_path: Path):
+        """Test writes in a batch share one transaction and a failed write undoes itself."""
         with ManifestManager(temp_manifest_path) as manifest:
-            manifest.record_extraction(
-                email_id="export_test",
-                imap_uid=1,
-                subject="Test",
-                sender="test@example.com",
-                date=datetime.now(),
-                labels=["INBOX"],
-                attachments=[],
-                original_size=1024,
-            )
+            with manifest.batch():
+                for i in range(3):
+                    manifest.record_extraction(
+                        email_id=f"batch{i}",
+                        imap_uid=i,
+                        subject="Test",
+                        sender="test@example.com",
+                        date=_FIXED_NOW,
+                        labels=[],
+                        attachments=[],
+                        original_size=1024,
+                    )
+                assert manifest._db.in_transaction
+                with pytest.raises(TypeError):
+                    manifest.update_status("batch0", "completed", stripped_size=object())
 
-            export_path = tmp_path / "export.json"
-            manifest.export_manifest(export_path, format="json")
+            assert not manifest._db.in_transaction
+            assert manifest.get_entry("batch0").status == "extracted"
+            assert manifest.get_processing_stats()["total"] == 3
 
-            assert export_path.exists()
-            content = export_path.read_text()
-            assert "export_test" in content
+        with ManifestManager(temp_manifest_path) as manifest:
+            assert len(manifest.get_all_entries()) == 3
 
-    def test_export_manifest_csv(self, temp_manifest_path: Path, tmp_path: Path):
-        """Test exporting manifest to CSV."""
+    def test_rolled_back_discards_writes(self, temp_manifest_path: Path):
+        """Test writes inside rolled_back() are undone, including cached queries."""
         with ManifestManager(temp_manifest_path) as manifest:
-            manifest.record_extraction(
-                email_id="csv_test",
-                imap_uid=1,
-                subject="Test CSV",
-                sender="test@example.com",
-                date=datetime.now(),
-                labels=[],
-                attachments=[],
-                original_size=1024,
+            manifest.record_extraction(**_record("kept"))
+            with manifest.rolled_back():
+                manifest.record_extraction(**_record("scratch"))
+                manifest.update_status("kept", "completed")
+                assert len(manifest.get_entries_by_status("completed")) == 1
+
+            assert not manifest._db.in_transaction
+            assert manifest.get_entry("scratch") is None
+            assert manifest.get_entries_by_status("completed") == []
+            assert manifest.get_processing_stats()["total"] == 1
+
+    def test_in_memory_manifest_backup_to_file(self, temp_manifest_path: Path):
+        """Test an in-memory manifest writes nothing until backed up to a file."""
+        with ManifestManager(ManifestManager.MEMORY) as manifest:
+            manifest.record_extraction(**_record("snapshot", status="completed"))
+            assert not Path(ManifestManager.MEMORY).exists()
+
+            manifest.backup_to(temp_manifest_path)
+
+        with ManifestManager(temp_manifest_path) as manifest:
+            assert manifest.is_processed("snapshot")
+            assert manifest.get_processing_stats()["total"] == 1
+
+    def test_imports_legacy_tinydb_manifest(self, temp_manifest_path: Path):
+        """Test a TinyDB manifest next to a new database is imported."""
+        entry = {
+            "email_id": "legacy1",
+            "imap_uid": 7,
+            "subject": "Old",
+            "sender": "test@example.com",
+            "date": "2024-01-15T00:00:00",
+            "labels": ["INBOX"],
+            "attachments": [],
+            "processed_at": "2024-01-16T00:00:00",
+            "status": "completed",
+            "original_size": 2048,
+        }
+        legacy_path = temp_manifest_path.with_suffix(".json")
+        legacy_path.write_text(json.dumps({"emails": {"1": entry}}), encoding="utf-8")
+
+        assert ManifestManager.exists(temp_manifest_path)
+        with ManifestManager(temp_manifest_path) as manifest:
+            assert manifest.is_processed("legacy1")
+            assert manifest.get_entry("legacy1").labels == ["INBOX"]
+
+    def test_export_large_manifest_streams_rows(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a 10k-row manifest exports fully without building the entry list."""
+        with ManifestManager(ManifestManager.MEMORY) as manifest:
+            manifest.record_extractions(
+                {
+                    "email_id": f"bulk{i}",
+                    "imap_uid": i,
+                    "subject": f"Test {i}",
+                    "sender": "test@example.com",
+                    "date": datetime(2024, 1, 15),
+                    "labels": [],
+                    "attachments": [],
+                    "original_size": 1024,
+                }
+                for i in range(10_000)
             )
+            monkeypatch.setattr(manifest, "get_all_entries", None)  # Would fail if called
+
+            csv_path = tmp_path / "export.csv"
+            json_path = tmp_path / "export.json"
+            manifest.export_manifest(csv_path, format="csv")
+            manifest.export_manifest(json_path, format="json")
+
+            lines = csv_path.read_text().splitlines()
+            assert len(lines) == 10_001
+            assert lines[-1].startswith("bulk9999,9999,Test 9999,")
+            assert len(json.loads(json_path.read_text())) == 10_000
+
+    def test_export_iteration_does_not_hold_lock(self, manifest: ManifestManager):
+        """Test other manifest calls proceed while an export is part way through."""
+        manifest.record_extractions(_record(f"row{i}", imap_uid=i) for i in range(3))
+        payloads = manifest._iter_payloads()
+        assert next(payloads)["email_id"] == "row0"
 
-            export_path = tmp_path / "export.csv"
-            manifest.export_manifest(export_path, format="csv")
+        found: list[ManifestEntry | None] = []
+        reader = threading.Thread(
+            target=lambda: found.append(manifest.get_entry("row2")), daemon=True
+        )
+        reader.start()
+        reader.join(1)
+        assert found and found[0] is not None
 
-            assert export_path.exists()
-            content = export_path.read_text()
-            assert "csv_test" in content
-            assert "Test CSV" in content
+        # Same-thread calls would deadlock if the generator held the lock
+        manifest.update_status("row1", "completed")
+        assert [p["email_id"] for p in payloads] == ["row1", "row2"]
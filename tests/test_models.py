@@ -1,6 +1,7 @@
 """Tests for data models."""
 
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
 
 from src.models.email import (
@@ -10,6 +11,8 @@ from src.models.email import (
     GmailMetadata,
     ManifestEntry,
     ScanStatistics,
+    format_size,
+    is_user_label,
 )
 
 
@@ -56,6 +59,17 @@ class TestAttachmentInfo:
         assert image.is_image is True
         assert pdf.is_image is False
 
+    def test_flags_follow_replaced_copy(self):
+        """Test instances are frozen and replace() re-derives the flags."""
+        pdf = AttachmentInfo("doc.pdf", "application/pdf", 1024, "attachment", "2")
+
+        with pytest.raises(FrozenInstanceError):
+            pdf.content_type = "image/png"
+
+        image = replace(pdf, content_type="IMAGE/PNG", content_disposition="Inline")
+        assert (image.is_image, image.is_inline) == (True, True)
+        assert (pdf.is_image, pdf.is_inline) == (False, False)
+
     def test_size_human(self):
         """Test human-readable size formatting."""
         small = AttachmentInfo("f", "t", 512, "a", "1")
@@ -67,6 +81,40 @@ class TestAttachmentInfo:
         assert "MB" in large.size_human
 
 
+class TestIsUserLabel:
+    """Tests for is_user_label."""
+
+    def test_system_labels_and_flags_are_excluded(self):
+        """Test Gmail-managed labels are filtered but similar user labels aren't."""
+        labels = ["INBOX", "\\Important", "SENT", "Work", "Sentiment", "INBOX/Receipts"]
+
+        assert [label for label in labels if is_user_label(label)] == [
+            "Work",
+            "Sentiment",
+            "INBOX/Receipts",
+        ]
+
+
+class TestFormatSize:
+    """Tests for format_size."""
+
+    @pytest.mark.parametrize(
+        "size, expected",
+        [
+            (0, "0 B"),
+            (1023, "1023 B"),
+            (1024, "1.0 KB"),
+            (1024 * 1024 - 1, "1024.0 KB"),
+            (1024 * 1024 * 3 // 2, "1.5 MB"),
+            (1024**3, "1.00 GB"),
+            (5 * 1024**4, "5120.00 GB"),
+        ],
+    )
+    def test_unit_boundaries(self, size: int, expected: str):
+        """Test each unit starts exactly at its power of 1024."""
+        assert format_size(size) == expected
+
+
 class TestEmailScanResult:
     """Tests for EmailScanResult dataclass."""
 
@@ -74,6 +122,7 @@ class TestEmailScanResult:
         """Test filtering of strippable attachments."""
         # Default fixture has one attachment disposition
         assert len(sample_scan_result.strippable_attachments) == 1
+        assert sample_scan_result.strippable_count == 1
 
     def test_can_process_encrypted(self, sample_scan_result: EmailScanResult):
         """Test can_process is False for encrypted emails."""
@@ -130,6 +179,47 @@ class TestManifestEntry:
         assert restored.subject == entry.subject
         assert restored.status == entry.status
 
+    def test_csv_row_from_dict_matches_entry_row(self):
+        """Test the dict-based CSV row equals the one built from the entry."""
+        entry = ManifestEntry(
+            email_id="123",
+            imap_uid=456,
+            subject="Test Subject",
+            sender="test@example.com",
+            date=datetime(2024, 1, 15, 10, 30),
+            labels=["INBOX", "Work"],
+            attachments=[{"filename": "test.pdf"}],
+            processed_at=datetime(2024, 1, 16, 8, 0, 0, 123456),
+            status="failed",
+            original_size=10240,
+            error_message="boom",
+        )
+
+        assert ManifestEntry.csv_row_from_dict(entry.to_dict()) == entry.to_csv_row()
+
+    def test_from_dict_ignores_unknown_and_missing_optional_keys(self):
+        """Test legacy payloads with extra or absent optional keys still load."""
+        data = {
+            "email_id": "123",
+            "imap_uid": 456,
+            "subject": "Test",
+            "sender": "test@example.com",
+            "date": "2024-01-15T00:00:00",
+            "labels": [],
+            "attachments": [],
+            "processed_at": "2024-01-16T00:00:00",
+            "status": "completed",
+            "original_size": 10240,
+            "legacy_field": True,
+        }
+
+        entry = ManifestEntry.from_dict(data)
+
+        assert entry.date == datetime(2024, 1, 15)
+        assert entry.stripped_size is None and entry.original_message_id is None
+        assert data["date"] == "2024-01-15T00:00:00"
+        assert ManifestEntry.from_dict(entry.to_dict()) == entry
+
 
 class TestScanStatistics:
     """Tests for ScanStatistics dataclass."""
@@ -157,3 +247,37 @@ class TestScanStatistics:
         )
 
         assert stats.processable_emails == 85  # 100 - 10 - 5
+
+    def test_aggregate(self):
+        """Test counters are summed and breakdowns merged across parts."""
+        first = ScanStatistics(
+            total_emails=100,
+            total_attachments=200,
+            total_attachment_size=1000,
+            emails_with_inline_only=10,
+            encrypted_emails_skipped=5,
+            estimated_backup_size=750,
+            by_content_type={"application/pdf": 150, "image/png": 50},
+            by_year={2023: 100},
+            by_sender={"example.com": 100},
+        )
+        second = ScanStatistics(
+            total_emails=20,
+            total_attachments=30,
+            total_attachment_size=500,
+            emails_with_inline_only=1,
+            encrypted_emails_skipped=2,
+            by_content_type={"application/pdf": 30},
+            by_year={2023: 5, 2024: 15},
+        )
+
+        combined = ScanStatistics.aggregate([first, second])
+
+        assert combined.processable_emails == 102  # 120 - 11 - 7
+        assert combined.total_attachment_size == 1500
+        assert combined.estimated_backup_size == 750
+        assert combined.by_content_type == {"application/pdf": 180, "image/png": 50}
+        assert combined.by_year == {2023: 105, 2024: 15}
+        assert combined.by_sender == {"example.com": 100}
+        assert first.by_year == {2023: 100}
+        assert ScanStatistics.aggregate([]).total_emails == 0
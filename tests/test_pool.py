@@ -0,0 +1,153 @@
+"""Tests for the IMAP connection pool."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.imap import pool as pool_module
+from src.imap.client import IMAPConnectionError
+from src.imap.pool import GmailIMAPClientPool, get_pool
+
+
+@pytest.fixture
+def opened() -> list[MagicMock]:
+    """Collect clients opened by the pool factory."""
+    return []
+
+
+@pytest.fixture
+def pool(opened: list[MagicMock]) -> GmailIMAPClientPool:
+    """Create a two-connection pool of mock clients."""
+
+    def factory() -> MagicMock:
+        opened.append(MagicMock())
+        return opened[-1]
+
+    return GmailIMAPClientPool(factory, max_connections=2)
+
+
+class TestGmailIMAPClientPool:
+    """Tests for GmailIMAPClientPool class."""
+
+    def test_reuses_released_connection(self, pool, opened):
+        """Test a released connection is handed out again."""
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            pass
+
+        assert first is second
+        assert len(opened) == 1
+
+    def test_concurrent_acquire_opens_separate_connections(self, pool, opened):
+        """Test nested checkouts never share a connection."""
+        with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+
+        assert len(opened) == 2
+
+    def test_acquire_blocks_at_limit(self, pool, opened):
+        """Test a third checkout waits for a release."""
+        acquired = threading.Event()
+
+        def third() -> None:
+            with pool.acquire():
+                acquired.set()
+
+        with pool.acquire(), pool.acquire():
+            worker = threading.Thread(target=third)
+            worker.start()
+            assert not acquired.wait(0.05)
+
+        worker.join(1)
+        assert acquired.is_set()
+        assert len(opened) == 2
+
+    def test_failed_connection_is_checked_before_reuse(self, pool, opened):
+        """Test an error triggers NOOP and reconnect on next checkout."""
+        with pytest.raises(ValueError):
+            with pool.acquire():
+                raise ValueError("boom")
+        opened[0].noop.side_effect = OSError("eof")
+
+        with pool.acquire() as client:
+            pass
+
+        client.noop.assert_called_once()
+        client.connect.assert_called_once()
+        client.authenticate.assert_called_once()
+
+    def test_failed_reconnect_frees_slot(self, opened):
+        """Test a connection that can't be re-established gives its slot back."""
+
+        def factory() -> MagicMock:
+            opened.append(MagicMock())
+            return opened[-1]
+
+        pool = GmailIMAPClientPool(factory, max_connections=1)
+        with pytest.raises(ValueError):
+            with pool.acquire():
+                raise ValueError("boom")
+        opened[0].noop.side_effect = OSError("eof")
+        opened[0].connect.side_effect = OSError("refused")
+
+        with pytest.raises(OSError, match="refused"):
+            with pool.acquire():
+                pass
+        opened[0].disconnect.assert_called()
+
+        # Would block forever if the broken connection still held the slot
+        acquired: list[MagicMock] = []
+
+        def retry() -> None:
+            with pool.acquire() as client:
+                acquired.append(client)
+
+        worker = threading.Thread(target=retry, daemon=True)
+        worker.start()
+        worker.join(1)
+        assert acquired == [opened[1]]
+
+    def test_close_disconnects_idle(self, pool, opened):
+        """Test close() disconnects idle clients and refuses checkouts."""
+        with pool.acquire():
+            pass
+
+        pool.close()
+
+        opened[0].disconnect.assert_called_once()
+        with pytest.raises(IMAPConnectionError):
+            with pool.acquire():
+                pass
+
+    def test_try_acquire_only_takes_idle_connections(self, pool, opened):
+        """Test try_acquire neither opens a connection nor blocks."""
+        with pool.acquire() as client:
+            with pool.try_acquire() as spare:
+                assert spare is None
+        with pool.acquire():
+            with pool.try_acquire() as spare:
+                assert spare is None
+        assert len(opened) == 1
+
+        with pool.acquire(), pool.acquire():
+            pass
+        with pool.acquire() as client, pool.try_acquire() as spare:
+            assert spare is not None and spare is not client
+
+
+class TestGetPool:
+    """Tests for the process-wide pool registry."""
+
+    def test_shares_pool_per_account_until_closed(self, monkeypatch: pytest.MonkeyPatch):
+        """Test one pool is shared per account and replaced once closed."""
+        monkeypatch.setattr(pool_module, "_pools", {})
+        oauth = MagicMock()
+
+        shared = get_pool(oauth, "user@gmail.com")
+        assert get_pool(oauth, "User@Gmail.com") is shared
+        assert get_pool(oauth, "other@gmail.com") is not shared
+
+        shared.close()
+        assert get_pool(oauth, "user@gmail.com") is not shared
@@ -0,0 +1,161 @@
+"""Tests for email reconstruction."""
+
+import pytest
+
+from src.models.email import AttachmentInfo, SavedAttachment
+from src.processor.reconstructor import (
+    EmailReconstructor,
+    MIMETreeWalker,
+    SimpleReconstructor,
+)
+from src.processor.validator import ReconstructionValidator
+
+
+@pytest.fixture
+def saved_attachment() -> SavedAttachment:
+    """Create a saved attachment record matching sample_raw_email."""
+    return SavedAttachment(
+        original_filename="document.pdf",
+        saved_path="documents/2024-01-15_document.pdf",
+        size=64,
+        content_type="application/pdf",
+        sha256_hash="sha256:abc",
+    )
+
+
+class TestEmailReconstructor:
+    """Tests for EmailReconstructor class."""
+
+    def test_reconstruct_strips_attachment(
+        self,
+        sample_raw_email: bytes,
+        sample_attachment_info: AttachmentInfo,
+        saved_attachment: SavedAttachment,
+    ):
+        """Test attachment is replaced with a placeholder."""
+        reconstructor = EmailReconstructor()
+
+        result = reconstructor.reconstruct(
+            sample_raw_email, [sample_attachment_info], [saved_attachment]
+        )
+
+        assert b"JVBERi0xLjQK" not in result
+        assert b"This is the email body." in result
+        assert b"documents/2024-01-15_document.pdf" in result
+
+    def test_reconstruct_reuse_does_not_leak_lookups(
+        self,
+        sample_raw_email: bytes,
+        sample_attachment_info: AttachmentInfo,
+        saved_attachment: SavedAttachment,
+    ):
+        """Test a reused instance doesn't carry lookups into the next email."""
+        reconstructor = EmailReconstructor()
+        reconstructor.reconstruct(sample_raw_email, [sample_attachment_info], [saved_attachment])
+
+        result = reconstructor.reconstruct(sample_raw_email, [], [])
+
+        assert b"JVBERi0xLjQK" in result
+        assert b"[Attachment Removed]" not in result
+
+    def test_fast_reconstruct_strips_attachment(
+        self,
+        sample_raw_email: bytes,
+        sample_attachment_info: AttachmentInfo,
+        saved_attachment: SavedAttachment,
+    ):
+        """Test byte-level path strips the attachment and keeps headers intact."""
+        reconstructor = EmailReconstructor()
+
+        result = reconstructor.fast_reconstruct(
+            sample_raw_email, [sample_attachment_info], [saved_attachment]
+        )
+
+        assert b"JVBERi0xLjQK" not in result
+        assert b"documents/2024-01-15_document.pdf" in result
+        # Header block is copied verbatim
+        header_block = sample_raw_email.split(b"\n\n", 1)[0]
+        assert result.startswith(header_block)
+
+        validation = ReconstructionValidator().validate(sample_raw_email, result)
+        assert validation.is_valid
+        assert validation.warnings == []
+
+    def test_fast_reconstruct_preserves_inline_with_content_id(
+        self,
+        sample_raw_email: bytes,
+        sample_attachment_info: AttachmentInfo,
+        saved_attachment: SavedAttachment,
+    ):
+        """Test parts referenced by Content-ID are kept."""
+        raw_email = sample_raw_email.replace(
+            b"Content-Transfer-Encoding: base64",
+            b"Content-Transfer-Encoding: base64\nContent-ID: <doc@example.com>",
+        )
+        reconstructor = EmailReconstructor()
+
+        result = reconstructor.fast_reconstruct(
+            raw_email, [sample_attachment_info], [saved_attachment]
+        )
+
+        assert b"JVBERi0xLjQK" in result
+
+    def test_fast_reconstruct_falls_back_for_single_part(
+        self,
+        sample_encrypted_email: bytes,
+    ):
+        """Test single-part messages use the full parse path."""
+        reconstructor = EmailReconstructor()
+        attachment = AttachmentInfo(
+            filename="smime.p7m",
+            content_type="application/pkcs7-mime",
+            size=40,
+            content_disposition="attachment",
+            part_number="1",
+        )
+
+        result = reconstructor.fast_reconstruct(sample_encrypted_email, [attachment], [])
+
+        assert b"[Attachment Removed]" in result
+
+
+class TestMIMETreeWalker:
+    """Tests for MIMETreeWalker class."""
+
+    def test_summarize(self, sample_raw_email: bytes):
+        """Test one walk yields parts, depths and text parts."""
+        msg = EmailReconstructor().parse_email(sample_raw_email)
+
+        summary = MIMETreeWalker.summarize(msg)
+
+        assert summary.content_types == ["multipart/mixed", "text/plain", "application/pdf"]
+        assert summary.depths == [1, 2, 2]
+        assert summary.text_parts == [summary.parts[1]]
+        assert MIMETreeWalker.count_parts(msg) == 3
+        assert MIMETreeWalker.get_depth(msg) == 2
+
+
+class TestSimpleReconstructor:
+    """Tests for SimpleReconstructor class."""
+
+    def test_notice_appended_to_quoted_printable_body(self):
+        """Test notice is appended without re-encoding the body."""
+        raw_email = (
+            b"From: sender@example.com\n"
+            b"Message-ID: <qp@example.com>\n"
+            b"MIME-Version: 1.0\n"
+            b'Content-Type: text/plain; charset="utf-8"\n'
+            b"Content-Transfer-Encoding: quoted-printable\n"
+            b"\n"
+            b"caf=C3=A9 =3D menu\n"
+        )
+        reconstructor = SimpleReconstructor()
+
+        result = reconstructor.reconstruct_simple(raw_email, [{"filename": "menu.pdf"}])
+
+        assert b"caf=C3=A9 =3D menu" in result
+        assert b"Content-Transfer-Encoding: quoted-printable" in result
+        msg = reconstructor._parser.parsebytes(result)
+        content = msg.get_content()
+        assert content.startswith("café = menu")
+        assert "- menu.pdf (Unknown size)" in content
@@ -0,0 +1,150 @@
+"""Tests for email replacement."""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.email import EmailScanResult, ExtractionResult, SavedAttachment
+from src.processor.replacer import EmailReplacer
+from src.processor.transaction import TransactionManager
+
+
+@pytest.fixture
+def extraction_result() -> ExtractionResult:
+    """Create an extraction result matching sample_raw_email."""
+    return ExtractionResult(
+        uid=12345,
+        success=True,
+        attachments_saved=[
+            SavedAttachment(
+                original_filename="document.pdf",
+                saved_path="documents/2024-01-15_document.pdf",
+                size=64,
+                content_type="application/pdf",
+                sha256_hash="sha256:abc",
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def replacer(sample_raw_email: bytes, tmp_path: Path) -> EmailReplacer:
+    """Create a replacer backed by a mock IMAP client."""
+    client = MagicMock()
+    client.fetch_raw_email.return_value = sample_raw_email
+    client.append.return_value = 500
+    client.move_to_trash.return_value = True
+    return EmailReplacer(client, TransactionManager(tmp_path / "txn.jsonl"))
+
+
+class TestEmailReplacer:
+    """Tests for EmailReplacer class."""
+
+    def test_replace_email_batch_parallel(
+        self,
+        replacer: EmailReplacer,
+        sample_scan_result: EmailScanResult,
+        extraction_result: ExtractionResult,
+    ):
+        """Test pooled reconstruction uploads the same bytes as the serial path."""
+        items = [
+            (1, sample_scan_result, extraction_result),
+            (2, sample_scan_result, extraction_result),
+        ]
+
+        results = replacer.replace_email_batch(items, batch_size=2, max_workers=2)
+
+        assert [r.original_uid for r in results] == [1, 2]
+        assert all(r.success for r in results)
+        uploaded = [c.kwargs["email_data"] for c in replacer.client.append.call_args_list]
+        expected = replacer.reconstructor.fast_reconstruct(
+            replacer.client.fetch_raw_email.return_value,
+            sample_scan_result.strippable_attachments,
+            extraction_result.attachments_saved,
+        )
+        # Placeholder timestamps can differ by a second between processes
+        assert [len(u) for u in uploaded] == [len(expected)] * 2
+
+    def test_replace_chunk_worker_crash_fails_each_item(
+        self,
+        replacer: EmailReplacer,
+        sample_scan_result: EmailScanResult,
+        extraction_result: ExtractionResult,
+    ):
+        """Test a dead worker pool fails every open transaction instead of escaping."""
+        executor = MagicMock()
+
+        def submit(fn, job):
+            future: Future = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+        executor.submit.side_effect = submit
+        items = [
+            (1, sample_scan_result, extraction_result),
+            (2, sample_scan_result, extraction_result),
+        ]
+
+        results = replacer._replace_chunk(items, executor)
+
+        assert [(r.original_uid, r.success) for r in results] == [(1, False), (2, False)]
+        assert all("worker died" in r.error for r in results)
+        assert replacer.txn_manager.get_incomplete_transactions() == []
+        replacer.client.append.assert_not_called()
+
+    def test_replace_email_batch_fetch_failure(
+        self,
+        replacer: EmailReplacer,
+        sample_scan_result: EmailScanResult,
+        extraction_result: ExtractionResult,
+    ):
+        """Test a failed fetch fails only that item."""
+        raw_email = replacer.client.fetch_raw_email.return_value
+
+        def fetch_raw_email(uid: int) -> bytes:
+            if uid == 2:
+                raise ConnectionError("gone")
+            return raw_email
+
+        replacer.client.fetch_raw_email.side_effect = fetch_raw_email
+        items = [
+            (1, sample_scan_result, extraction_result),
+            (2, sample_scan_result, extraction_result),
+        ]
+
+        results = replacer.replace_email_batch(items, batch_size=2, max_workers=1)
+
+        assert results[0].success
+        assert not results[1].success
+        assert "gone" in results[1].error
+
+    def test_small_savings_skip_upload_refetch(
+        self,
+        replacer: EmailReplacer,
+        sample_scan_result: EmailScanResult,
+        extraction_result: ExtractionResult,
+    ):
+        """Test emails below the threshold aren't re-fetched for verification."""
+        attachments = sample_scan_result.attachments
+        attachments[0] = replace(attachments[0], size=1024)
+
+        result = replacer.replace_email(1, sample_scan_result, extraction_result)
+
+        assert result.success
+        replacer.client.fetch_raw_email.assert_called_once_with(1)
+
+    def test_large_savings_verify_upload(
+        self,
+        replacer: EmailReplacer,
+        sample_scan_result: EmailScanResult,
+        extraction_result: ExtractionResult,
+    ):
+        """Test emails above the threshold are re-fetched for verification."""
+        result = replacer.replace_email(1, sample_scan_result, extraction_result)
+
+        assert result.success
+        assert replacer.client.fetch_raw_email.call_count == 2
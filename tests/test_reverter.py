@@ -0,0 +1,186 @@
+"""Tests for email revert."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.imap.pool import GmailIMAPClientPool
+from src.models.email import ManifestEntry
+from src.processor.reverter import EmailReverter, RevertResult
+
+
+def make_entry(email_id: str, message_id: str | None) -> ManifestEntry:
+    """Create a completed manifest entry."""
+    return ManifestEntry(
+        email_id=email_id,
+        imap_uid=1,
+        subject="Test",
+        sender="sender@example.com",
+        date=datetime(2024, 1, 15),
+        labels=["Work"],
+        attachments=[],
+        processed_at=datetime(2024, 2, 1),
+        status="completed",
+        original_size=1000,
+        stripped_uid=99,
+        original_message_id=message_id,
+    )
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """Create a mock IMAP client with two originals in Trash."""
+    client = MagicMock()
+    client.has_capability.return_value = False
+    client.list_folders.return_value = ["INBOX", "[Gmail]/Trash"]
+    client.search.return_value = [5, 7]
+    client.fetch_many.return_value = {
+        7: {"BODY[HEADER.FIELDS (MESSAGE-ID)]": b"Message-ID: <b@example.com>\r\n\r\n"},
+        5: {"BODY[HEADER.FIELDS (MESSAGE-ID)]": b"Message-ID: <a@example.com>\r\n\r\n"},
+    }
+    return client
+
+
+class TestEmailReverter:
+    """Tests for EmailReverter class."""
+
+    def test_check_trash_availability_batches_lookups(self, client: MagicMock):
+        """Test availability is resolved with one SEARCH and one FETCH."""
+        reverter = EmailReverter(client, MagicMock())
+        entries = [
+            make_entry("1", "<a@example.com>"),
+            make_entry("2", "<b@example.com>"),
+            make_entry("3", "<gone@example.com>"),
+            make_entry("4", None),
+        ]
+
+        availability = reverter.check_trash_availability(entries)
+
+        assert availability == {"1": True, "2": True, "3": False, "4": False}
+        client.select_folder_cached.assert_called_once_with("[Gmail]/Trash", readonly=True)
+        client.search.assert_called_once()
+        criteria = client.search.call_args.args[0]
+        assert criteria.startswith("OR OR HEADER Message-ID")
+        assert criteria.count("HEADER Message-ID") == 3
+
+    def test_trash_lookup_uses_gmail_search_when_supported(self, client: MagicMock):
+        """Test Gmail servers are searched with one X-GM-RAW rfc822msgid: query."""
+        client.has_capability.return_value = True
+        reverter = EmailReverter(client, MagicMock())
+
+        availability = reverter.check_trash_availability(
+            [make_entry("1", "<a@example.com>"), make_entry("2", "<b@example.com>")]
+        )
+
+        assert availability == {"1": True, "2": True}
+        client.search.assert_called_once_with(
+            'X-GM-RAW "rfc822msgid:a@example.com OR rfc822msgid:b@example.com"'
+        )
+
+    def test_restore_copies_server_side_with_uidplus(self, client: MagicMock):
+        """Test UIDPLUS servers restore with UID COPY instead of FETCH+APPEND."""
+        client.has_capability.side_effect = lambda name: name == "UIDPLUS"
+        client.uid_copy.return_value = 321
+        reverter = EmailReverter(client, MagicMock())
+
+        new_uid = reverter._restore_from_trash(client, 5)
+
+        assert new_uid == 321
+        client.uid_copy.assert_called_once_with(5, "[Gmail]/All Mail")
+        client.fetch_raw_email.assert_not_called()
+        client.append.assert_not_called()
+        client.expunge.assert_not_called()
+
+    def test_revert_batch_runs_each_step_once(self, client: MagicMock):
+        """Test a batch costs one SEARCH, one COPY and one STORE per label set."""
+        client.has_capability.side_effect = lambda name: name == "UIDPLUS"
+        client.uid_copy_many.return_value = {5: 205, 7: 207}
+        manifest = MagicMock()
+        entries = [
+            make_entry("1", "<a@example.com>"),
+            make_entry("2", "<b@example.com>"),
+            make_entry("3", "<gone@example.com>"),
+        ]
+        entries[1].labels = ["INBOX", "Work"]
+
+        results = EmailReverter(client, manifest).revert_batch(entries)
+
+        assert [r.success for r in results] == [True, True, False]
+        assert results[0].labels_applied == ["Work"]
+        client.search.assert_called_once()
+        client.uid_copy_many.assert_called_once_with([5, 7], "[Gmail]/All Mail")
+        client.store_labels_many.assert_called_once_with([205, 207], ["Work"], action="+")
+        client.move_many_to_trash.assert_called_once_with([99, 99])
+        client.expunge.assert_called_once()
+        assert manifest.mark_reverted.call_count == 2
+
+    def test_revert_batch_deletes_stripped_on_idle_connection(self, client: MagicMock):
+        """Test stripped deletion overlaps labeling when a second connection is idle."""
+        spare = MagicMock()
+        clients = iter([client, spare])
+        pool = GmailIMAPClientPool(lambda: next(clients), max_connections=2)
+        with pool.acquire(), pool.acquire():
+            pass  # Open both connections so one is idle during the revert
+
+        reverter = EmailReverter(pool, MagicMock())
+
+        results = reverter.revert_batch([make_entry("1", "<a@example.com>")])
+
+        assert results[0].success and results[0].stripped_deleted
+        client.store_labels_many.assert_called_once()
+        client.move_many_to_trash.assert_not_called()
+        spare.move_many_to_trash.assert_called_once_with([99])
+        spare.search.assert_not_called()
+
+    def test_revert_many_uses_pooled_clients(self):
+        """Test every entry is reverted, each on a connection from the pool."""
+        clients: list[MagicMock] = []
+
+        def factory() -> MagicMock:
+            clients.append(MagicMock())
+            return clients[-1]
+
+        pool = GmailIMAPClientPool(factory, max_connections=2)
+        entries = [make_entry(str(i), f"<{i}@example.com>") for i in range(6)]
+        reverter = EmailReverter(pool, MagicMock())
+        used: list[MagicMock] = []
+
+        def revert_batch_with_client(self, client, pending, results):
+            used.append(client)
+            for index, entry in pending:
+                results[index] = RevertResult(success=True, email_id=entry.email_id)
+
+        with patch.object(EmailReverter, "_revert_batch_with_client", revert_batch_with_client):
+            results = list(reverter.revert_many(entries, batch_size=2))
+
+        assert sorted(r.email_id for r in results) == [str(i) for i in range(6)]
+        assert len(clients) <= 2
+        assert len(used) == 3
+        assert all(c in clients for c in used)
+
+    def test_trash_folder_listed_once_per_pool(self, client: MagicMock):
+        """Test the Trash folder LIST result is shared across reverters."""
+        client.list_folders.return_value = ["INBOX", "[Gmail]/Bin"]
+        client.search.return_value = []
+        pool = GmailIMAPClientPool.from_client(client)
+
+        EmailReverter(pool, MagicMock()).check_trash_availability([make_entry("1", "<a@x>")])
+        EmailReverter(pool, MagicMock()).check_trash_availability([make_entry("2", "<b@x>")])
+
+        client.list_folders.assert_called_once()
+        assert client.select_folder_cached.call_args.args[0] == "[Gmail]/Bin"
+
+    def test_revert_many_deletes_stripped_in_one_batch(self, client: MagicMock):
+        """Test stripped versions are trashed with a single batched STORE."""
+        entries = [make_entry("1", "<a@example.com>"), make_entry("2", "<b@example.com>")]
+        for i, entry in enumerate(entries):
+            entry.stripped_uid = 100 + i
+        reverter = EmailReverter(client, MagicMock())
+
+        results = list(reverter.revert_many(entries))
+
+        assert all(r.success and r.stripped_deleted for r in results)
+        client.move_to_trash.assert_not_called()
+        client.move_many_to_trash.assert_called_once()
+        assert sorted(client.move_many_to_trash.call_args.args[0]) == [100, 101]
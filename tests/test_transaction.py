@@ -0,0 +1,73 @@
+"""Tests for transaction logging."""
+
+from datetime import datetime
+from pathlib import Path
+
+from src.processor.transaction import TransactionLog, TransactionManager
+
+
+class TestTransactionManager:
+    """Tests for TransactionManager class."""
+
+    def test_steps_are_readable_while_log_is_open(self, tmp_path: Path):
+        """Test appended entries are visible before the log is closed."""
+        manager = TransactionManager(tmp_path / "txn.jsonl")
+
+        txn_id = manager.begin_transaction("email-1")
+        manager.log_step(txn_id, "uploaded", {"new_uid": 42})
+
+        state = manager.get_transaction_state(txn_id)
+        assert state["steps"] == ["started", "uploaded"]
+        assert state["data"] == {"new_uid": 42}
+        assert manager.get_incomplete_transactions() == [txn_id]
+        manager.close()
+
+    def test_append_after_cleanup_rewrite(self, tmp_path: Path):
+        """Test the log keeps appending after cleanup rewrites the file."""
+        manager = TransactionManager(tmp_path / "txn.jsonl")
+        old_txn = manager.begin_transaction("email-1")
+        manager.commit(old_txn)
+
+        assert manager.cleanup_old_logs(days=-1) == 2
+        new_txn = manager.begin_transaction("email-2")
+        manager.close()
+
+        entries = TransactionLog(tmp_path / "txn.jsonl").read_all()
+        assert [e["txn_id"] for e in entries] == [new_txn]
+
+
+class TestTransactionLog:
+    """Tests for TransactionLog class."""
+
+    def test_index_tracks_appends_after_first_read(self, tmp_path: Path):
+        """Test entries appended after the index loads are still returned."""
+        path = tmp_path / "txn.jsonl"
+        path.write_text('{"txn_id": "a", "status": "started"}\nnot json\n', encoding="utf-8")
+        log = TransactionLog(path)
+
+        assert log.get_last_state("a") == "started"
+        log.append({"txn_id": "b", "status": "started"})
+        log.append({"txn_id": "a", "status": "completed"})
+        log.close()
+
+        assert [e["status"] for e in log.read_transaction("a")] == ["started", "completed"]
+        assert [e["txn_id"] for e in log.read_all()] == ["a", "b", "a"]
+        assert TransactionLog(path).read_all() == log.read_all()
+
+    def test_remove_older_than_streams_kept_lines(self, tmp_path: Path):
+        """Test old entries are dropped and kept lines are copied verbatim."""
+        path = tmp_path / "txn.jsonl"
+        path.write_bytes(
+            b'{"txn_id": "old", "timestamp": "2020-01-01T00:00:00"}\n'
+            b'{"txn_id":"new",  "timestamp": "2030-01-01T00:00:00"}\n'
+            b'{"txn_id": "bad", "timestamp": "yesterday"}\n'
+        )
+        log = TransactionLog(path)
+
+        assert log.remove_older_than(datetime(2025, 1, 1)) == 1
+
+        assert path.read_bytes() == (
+            b'{"txn_id":"new",  "timestamp": "2030-01-01T00:00:00"}\n'
+            b'{"txn_id": "bad", "timestamp": "yesterday"}\n'
+        )
+        assert not path.with_suffix(".jsonl.tmp").exists()
@@ -0,0 +1,87 @@
+"""Tests for reconstruction validation."""
+
+from src.processor.validator import PreflightChecker, ReconstructionValidator
+
+NESTED_EMAIL = (
+    b"Message-ID: <nested@example.com>\n"
+    b'Content-Type: multipart/mixed; boundary="outer"\n'
+    b"\n"
+    b"--outer\n"
+    b'Content-Type: multipart/alternative; boundary="inner"\n'
+    b"\n"
+    b"--inner\n"
+    b"\n"
+    b"no content type\n"
+    b"--inner--\n"
+    b"--outer\n"
+    b"Content-Type: text/plain\n"
+    b"\n"
+    b"plain\n"
+    b"--outer--\n"
+)
+
+
+class TestReconstructionValidator:
+    """Tests for ReconstructionValidator class."""
+
+    def test_mime_issues_report_nested_part_path(self):
+        """Test issues in nested parts are prefixed with their full path."""
+        validator = ReconstructionValidator()
+        msg = validator._parser.parsebytes(NESTED_EMAIL)
+
+        assert validator._check_mime_validity(msg) == ["Part 1/1: Missing Content-Type header"]
+
+    def test_validate_accepts_unchanged_email(self, sample_raw_email: bytes):
+        """Test an unmodified email validates cleanly."""
+        result = ReconstructionValidator().validate(sample_raw_email, sample_raw_email)
+
+        assert result.is_valid
+        assert result.warnings == []
+
+    def test_validate_warns_when_body_changes(self, sample_raw_email: bytes):
+        """Test a modified body produces a warning."""
+        modified = sample_raw_email.replace(b"This is the email body.", b"Different body.")
+
+        result = ReconstructionValidator().validate(sample_raw_email, modified)
+
+        assert result.warnings == ["Original body text may have been modified"]
+
+    def test_validate_accepts_reencoded_body(self):
+        """Test a body re-encoded in another charset is still recognized."""
+        header = b"Message-ID: <enc@example.com>\nContent-Type: text/plain; charset="
+        original = header + b'"iso-8859-1"\n\ncaf\xe9 menu\n'
+        reconstructed = header + b'"utf-8"\n\ncaf\xc3\xa9 menu\n\n[Attachment Removed]\n'
+
+        result = ReconstructionValidator().validate(original, reconstructed)
+
+        assert result.warnings == []
+
+    def test_validate_reports_modified_critical_header(self, sample_raw_email: bytes):
+        """Test a changed Subject is reported and case of header names is ignored."""
+        modified = sample_raw_email.replace(
+            b"Subject: Test Email with Attachment", b"SUBJECT: Changed"
+        ).replace(b"Message-ID:", b"message-id:")
+
+        result = ReconstructionValidator().validate(sample_raw_email, modified)
+
+        assert result.header_issues == ["Modified critical header: Subject"]
+
+    def test_validate_rejects_broken_output_before_parsing(self, sample_raw_email: bytes):
+        """Test truncated or header-less output fails without a MIME parse."""
+        validator = ReconstructionValidator()
+        validator._parser = None  # Any parse attempt would raise
+        headerless = sample_raw_email.replace(b"Message-ID: <test123@example.com>\n", b"")
+
+        truncated = validator.validate(sample_raw_email, b"From: a@b\n\n")
+        missing_id = validator.validate(sample_raw_email, headerless)
+
+        assert not truncated.is_valid
+        assert truncated.mime_issues == ["Reconstructed email is only 11 bytes"]
+        assert missing_id.header_issues == ["Missing critical header: Message-ID"]
+
+    def test_preflight_rejects_oversized_email_without_parsing(self):
+        """Test the size limit is checked before the email is parsed."""
+        ok, reasons = PreflightChecker.can_process(b"x" * (50 * 1024 * 1024 + 1))
+
+        assert not ok
+        assert reasons == ["Email exceeds 50MB size limit"]